@@ -0,0 +1,166 @@
+"""
+Temporal VR Project - Headless Batch Runner
+여러 Blender 백그라운드 프로세스로 temporal 객체를 병렬 베이크/익스포트
+"""
+# temporal_batch_runner.py
+import os
+import sys
+import json
+import argparse
+import subprocess
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from temporal_vr_automation import TemporalVRAutomation
+
+# 실행 위치와 무관하게 이 파일 기준으로 프로젝트 루트/설정 파일을 찾음
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+WORKER_SCRIPT = PROJECT_ROOT / "blender" / "scripts" / "temporal_base.py"
+
+# temporal_capture는 bpy 없이 사용 가능 (병렬 캡처/파트 병합용)
+sys.path.append(str(WORKER_SCRIPT.parent))
+import temporal_capture
+
+class TemporalBatchRunner:
+    def __init__(self, blender_path: Optional[str] = None, workers: Optional[int] = None,
+                 batch_size: int = 4, timeout: Optional[float] = None,
+                 profile_dir: Optional[str] = None):
+        self.blender_path = blender_path or TemporalVRAutomation(PROJECT_ROOT).config["blender_path"]
+        self.workers = workers or os.cpu_count() or 1
+        self.batch_size = max(1, batch_size)
+        self.timeout = timeout
+        self.profile_dir = profile_dir
+
+    @staticmethod
+    def load_specs(spec_file: str) -> List[Dict]:
+        """스펙 파일 로드 (리스트 또는 {"objects": [...]})"""
+        with open(spec_file, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        return data["objects"] if isinstance(data, dict) else data
+
+    def _make_batches(self, specs: List[Dict]) -> List[List[Dict]]:
+        """Blender 실행 1회당 처리할 스펙 묶음 생성"""
+        # 같은 .blend 파일은 같은 워커에서 처리 (파일 재로드 방지)
+        ordered = sorted(specs, key=lambda spec: spec.get("blend_file", ""))
+        return [ordered[i:i + self.batch_size] for i in range(0, len(ordered), self.batch_size)]
+
+    def _run_worker(self, index: int, batch: List[Dict], output_dir: Path, work_dir: Path) -> List[Dict]:
+        """Blender 워커 1개 실행 후 결과 수집"""
+        spec_file = work_dir / f"batch_{index:04d}_specs.json"
+        result_file = work_dir / f"batch_{index:04d}_result.json"
+        with open(spec_file, 'w', encoding='utf-8') as f:
+            json.dump(batch, f, ensure_ascii=False)
+
+        command = [
+            self.blender_path, "--background", "--factory-startup",
+            "--python", str(WORKER_SCRIPT), "--",
+            "--specs", str(spec_file),
+            "--output-dir", str(output_dir),
+            "--result", str(result_file)
+        ]
+
+        # 워커별 프로파일 리포트 (temporal_profile 환경변수)
+        env = None
+        if self.profile_dir:
+            env = dict(os.environ, TEMPORAL_PROFILE="1",
+                       TEMPORAL_PROFILE_OUT=str(Path(self.profile_dir).resolve() / f"batch_{index:04d}.json"))
+
+        try:
+            process = subprocess.run(command, capture_output=True, text=True, env=env,
+                                     encoding='utf-8', errors='replace', timeout=self.timeout)
+            if result_file.exists():
+                with open(result_file, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+            error = (process.stderr or process.stdout).strip()[-500:] or f"exit code {process.returncode}"
+        except subprocess.TimeoutExpired:
+            error = f"timed out after {self.timeout}s"
+        except OSError as e:
+            error = f"could not start Blender: {e}"
+
+        return [{"name": spec.get("name"), "status": "error", "error": error} for spec in batch]
+
+    def run(self, specs: List[Dict], output_dir: str) -> Dict:
+        """전체 스펙을 워커 풀에 분배하고 결과 매니페스트 작성"""
+        output_path = Path(output_dir).resolve()
+        output_path.mkdir(parents=True, exist_ok=True)
+        if self.profile_dir:
+            Path(self.profile_dir).mkdir(parents=True, exist_ok=True)
+        batches = self._make_batches(specs)
+        start = time.perf_counter()
+
+        print(f"🚀 Baking {len(specs)} temporal objects: "
+              f"{len(batches)} batches on {self.workers} Blender workers")
+
+        results: List[Dict] = []
+        with tempfile.TemporaryDirectory(prefix="temporal_batch_") as work_dir:
+            with ThreadPoolExecutor(max_workers=self.workers) as pool:
+                futures = {
+                    pool.submit(self._run_worker, i, batch, output_path, Path(work_dir)): i
+                    for i, batch in enumerate(batches)
+                }
+                for future in as_completed(futures):
+                    batch_results = future.result()
+                    results.extend(batch_results)
+                    failed = sum(1 for r in batch_results if r.get("status") != "ok")
+                    mark = "✅" if not failed else "⚠️"
+                    print(f"{mark} Batch {futures[future] + 1}/{len(batches)} done "
+                          f"({len(batch_results) - failed} ok, {failed} failed)")
+
+        elapsed = time.perf_counter() - start
+        manifest = {
+            "created": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "elapsed_seconds": elapsed,
+            "workers": self.workers,
+            "objects": sorted(results, key=lambda r: str(r.get("name")))
+        }
+        with open(output_path / "manifest.json", 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2, ensure_ascii=False)
+
+        ok = sum(1 for r in results if r.get("status") == "ok")
+        print(f"📦 {ok}/{len(results)} exports in {elapsed:.1f}s → {output_path / 'manifest.json'}")
+        return manifest
+
+    def capture(self, blend_file: str, obj_name: str, frames: List[float], output: str,
+                parts: Optional[int] = None) -> Dict:
+        """프레임 구간을 워커들에 나눠 캡처한 뒤 하나의 .tvrk로 병합 (temporal_capture 사용)"""
+        info = temporal_capture.capture_frames(self.blender_path, blend_file, obj_name, frames, output,
+                                               parts or self.workers, self.timeout, self.profile_dir)
+        print(f"📦 {info['keyframe_count']} frames of {obj_name} merged → {output} "
+              f"({info['parts']} parts, {info['bytes_written'] / 1024:.1f} KB)")
+        return info
+
+def main():
+    """메인 실행 함수"""
+    parser = argparse.ArgumentParser(description="Temporal VR headless batch baking")
+    parser.add_argument("specs", nargs="?", help="JSON spec file (list of temporal object specs)")
+    parser.add_argument("-o", "--output-dir", default="exports", help="Export directory")
+    parser.add_argument("-j", "--workers", type=int, default=None, help="Parallel Blender processes")
+    parser.add_argument("--batch-size", type=int, default=4, help="Specs per Blender launch")
+    parser.add_argument("--blender", default=None, help="Override config blender_path")
+    parser.add_argument("--timeout", type=float, default=None, help="Seconds per batch")
+    parser.add_argument("--profile", default=None, metavar="DIR", help="Write per-batch stage profiles here")
+    parser.add_argument("--capture", nargs=2, metavar=("BLEND", "OBJECT"),
+                        help="Capture evaluated mesh frames of OBJECT in BLEND in parallel")
+    parser.add_argument("--frames", nargs=3, type=float, default=(0, 100, 1), metavar=("START", "END", "STEP"),
+                        help="Frame range for --capture (END inclusive)")
+    args = parser.parse_args()
+
+    runner = TemporalBatchRunner(args.blender, args.workers, args.batch_size, args.timeout, args.profile)
+    if args.capture:
+        start, end, step = args.frames
+        frames = [start + i * step for i in range(int((end - start) / step) + 1)]
+        output = str(Path(args.output_dir) / f"{args.capture[1]}.tvrk")
+        Path(args.output_dir).mkdir(parents=True, exist_ok=True)
+        runner.capture(args.capture[0], args.capture[1], frames, output)
+        return
+    if not args.specs:
+        parser.error("a spec file (or --capture) is required")
+    manifest = runner.run(runner.load_specs(args.specs), args.output_dir)
+    failed = [r for r in manifest["objects"] if r.get("status") != "ok"]
+    raise SystemExit(1 if failed else 0)
+
+if __name__ == "__main__":
+    main()
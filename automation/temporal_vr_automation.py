@@ -13,8 +13,8 @@ from typing import Dict, List, Optional
 import sys
 
 class TemporalVRAutomation:
-    def __init__(self):
-        self.project_root = Path.cwd()
+    def __init__(self, project_root: Optional[Path] = None):
+        self.project_root = Path(project_root) if project_root else Path.cwd()
         self.start_date = datetime(2025, 6, 26)
         self.config = self.load_or_create_config()
         
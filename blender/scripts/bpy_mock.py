@@ -0,0 +1,720 @@
+# bpy_mock.py
+# Temporal VR Project - Lightweight bpy/bmesh stand-in
+# Lets the temporal pipeline (and its benchmarks) run under plain Python
+#
+# Only the API surface temporal_base.py touches is modelled, backed by NumPy:
+# ID collections, objects, meshes, curves, materials/node trees, actions with
+# F-curves, and a scene whose frame_set evaluates F-curves (linearly).
+# Timings measured here reflect our own Python/NumPy overhead, not Blender's;
+# use them to compare revisions, and real `blender --background` for absolutes.
+#
+#   import bpy_mock; bpy_mock.install()   # before `import temporal_base`
+
+import sys
+import types
+import numpy as np
+
+installed = False
+
+
+class _VectorProperty:
+    """float64 vector attribute that assigns in place like a bpy Vector"""
+
+    def __init__(self, default):
+        self.default = tuple(default)
+
+    def __set_name__(self, owner, name):
+        self.attr = '_' + name
+
+    def __get__(self, obj, owner):
+        if obj is None:
+            return self
+        value = obj.__dict__.get(self.attr)
+        if value is None:
+            value = obj.__dict__[self.attr] = np.array(self.default, dtype=np.float64)
+        return value
+
+    def __set__(self, obj, value):
+        self.__get__(obj, type(obj))[:] = value
+
+
+def _foreach_get(array, out):
+    out[:] = array.reshape(-1)
+
+
+def _foreach_set(array, values):
+    array.reshape(-1)[:] = np.asarray(values).reshape(-1)
+
+
+class ID:
+    """Datablock base: name, custom properties and animation data"""
+
+    def __init__(self, name):
+        self.name = name
+        self.animation_data = None
+        self._props = {}
+
+    def __getitem__(self, key):
+        return self._props[key]
+
+    def __setitem__(self, key, value):
+        self._props[key] = value
+
+    def __delitem__(self, key):
+        del self._props[key]
+
+    def __contains__(self, key):
+        return key in self._props
+
+    def get(self, key, default=None):
+        return self._props.get(key, default)
+
+    @property
+    def original(self):
+        return self
+
+    @property
+    def users(self):
+        return 1
+
+    def animation_data_create(self):
+        if self.animation_data is None:
+            self.animation_data = AnimationData()
+        return self.animation_data
+
+    def evaluated_get(self, depsgraph):
+        return self
+
+
+class IDCollection:
+    """bpy.data.<collection> with Blender-style unique names"""
+
+    def __init__(self, factory):
+        self._factory = factory
+        self._items = {}
+
+    def _unique(self, name):
+        if name not in self._items:
+            return name
+        i = 1
+        while f"{name}.{i:03d}" in self._items:
+            i += 1
+        return f"{name}.{i:03d}"
+
+    def new(self, name, *args, **kwargs):
+        item = self._factory(self._unique(name), *args, **kwargs)
+        self._items[item.name] = item
+        return item
+
+    def remove(self, item, **kwargs):
+        self._items.pop(item.name, None)
+        if isinstance(item, Object):
+            for collection in [data.scene_collection] + list(data.collections):
+                if item in collection.objects:
+                    collection.objects.unlink(item)
+
+    def get(self, name, default=None):
+        return self._items.get(name, default)
+
+    def __contains__(self, name):
+        return name in self._items
+
+    def __getitem__(self, name):
+        return self._items[name]
+
+    def __iter__(self):
+        return iter(list(self._items.values()))
+
+    def __len__(self):
+        return len(self._items)
+
+
+# --- Animation -----------------------------------------------------------------
+
+class AnimationData:
+    def __init__(self):
+        self.action = None
+
+
+class Keyframe:
+    """View onto one row of a KeyframePoints array"""
+
+    def __init__(self, points, index):
+        self._points = points
+        self._index = index
+
+    @property
+    def co(self):
+        return self._points._co[self._index]
+
+    @property
+    def handle_left(self):
+        return self._points._left[self._index]
+
+    @property
+    def handle_right(self):
+        return self._points._right[self._index]
+
+    @property
+    def interpolation(self):
+        return self._points._interpolation[self._index]
+
+    @interpolation.setter
+    def interpolation(self, value):
+        self._points._interpolation[self._index] = value
+
+
+class KeyframePoints:
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        self._co = np.zeros((0, 2), dtype=np.float64)
+        self._left = np.zeros((0, 2), dtype=np.float64)
+        self._right = np.zeros((0, 2), dtype=np.float64)
+        self._interpolation = []
+
+    def add(self, count):
+        pad = np.zeros((count, 2), dtype=np.float64)
+        self._co = np.concatenate([self._co, pad])
+        self._left = np.concatenate([self._left, pad])
+        self._right = np.concatenate([self._right, pad])
+        self._interpolation += ['BEZIER'] * count
+
+    def _array(self, attr):
+        return {'co': self._co, 'handle_left': self._left, 'handle_right': self._right}[attr]
+
+    def foreach_get(self, attr, out):
+        _foreach_get(self._array(attr), out)
+
+    def foreach_set(self, attr, values):
+        _foreach_set(self._array(attr), values)
+
+    def insert(self, frame, value, options=None):
+        i = int(np.searchsorted(self._co[:, 0], frame))
+        if i < len(self._co) and self._co[i, 0] == frame:
+            self._co[i, 1] = value
+        else:
+            row = np.array([[frame, value]], dtype=np.float64)
+            self._co = np.insert(self._co, i, row, axis=0)
+            self._left = np.insert(self._left, i, row, axis=0)
+            self._right = np.insert(self._right, i, row, axis=0)
+            self._interpolation.insert(i, 'BEZIER')
+        return Keyframe(self, i)
+
+    def remove(self, point, fast=False):
+        i = point._index
+        self._co = np.delete(self._co, i, axis=0)
+        self._left = np.delete(self._left, i, axis=0)
+        self._right = np.delete(self._right, i, axis=0)
+        del self._interpolation[i]
+
+    def __len__(self):
+        return len(self._co)
+
+    def __getitem__(self, index):
+        return Keyframe(self, range(len(self))[index])
+
+    def __iter__(self):
+        return (Keyframe(self, i) for i in range(len(self)))
+
+
+class FCurve:
+    def __init__(self, data_path, index=0, action_group=""):
+        self.data_path = data_path
+        self.array_index = index
+        self.group = action_group
+        self.keyframe_points = KeyframePoints()
+
+    def update(self):
+        points = self.keyframe_points
+        order = np.argsort(points._co[:, 0], kind='stable')
+        points._co, points._left, points._right = points._co[order], points._left[order], points._right[order]
+        points._interpolation = [points._interpolation[i] for i in order]
+
+    def evaluate(self, frame):
+        co = self.keyframe_points._co
+        if len(co) == 0:
+            return 0.0
+        return float(np.interp(frame, co[:, 0], co[:, 1]))
+
+
+class FCurves:
+    def __init__(self):
+        self._curves = []
+
+    def find(self, data_path, index=0):
+        for fcurve in self._curves:
+            if fcurve.data_path == data_path and fcurve.array_index == index:
+                return fcurve
+        return None
+
+    def new(self, data_path, index=0, action_group=""):
+        if self.find(data_path, index) is not None:
+            raise RuntimeError(f"F-Curve '{data_path}[{index}]' already exists")
+        fcurve = FCurve(data_path, index, action_group)
+        self._curves.append(fcurve)
+        return fcurve
+
+    def remove(self, fcurve):
+        self._curves.remove(fcurve)
+
+    def __iter__(self):
+        return iter(list(self._curves))
+
+    def __len__(self):
+        return len(self._curves)
+
+
+class Action(ID):
+    def __init__(self, name):
+        super().__init__(name)
+        self.fcurves = FCurves()
+
+
+def _apply_fcurve(owner, data_path, index, value):
+    """Write an evaluated F-curve value back onto its owner"""
+    if data_path.startswith('["'):
+        owner[data_path[2:-2]] = value
+    elif hasattr(owner, data_path):
+        getattr(owner, data_path)[index] = value
+
+
+def _keyframe_insert(owner, data_path, frame):
+    """Key the current value of owner.data_path (every component)"""
+    if data_path.startswith('["'):
+        values = [owner[data_path[2:-2]]]
+    else:
+        values = np.atleast_1d(getattr(owner, data_path))
+    owner.animation_data_create()
+    if owner.animation_data.action is None:
+        owner.animation_data.action = data.actions.new(f"{owner.name}Action")
+    fcurves = owner.animation_data.action.fcurves
+    for index, value in enumerate(values):
+        fcurve = fcurves.find(data_path, index) or fcurves.new(data_path, index)
+        fcurve.keyframe_points.insert(frame, float(value))
+    return True
+
+
+# --- Meshes --------------------------------------------------------------------
+
+class _ArrayCollection:
+    """Mesh element collection backed by one (N, C) array"""
+
+    def __init__(self, attr, width, dtype):
+        self._attr = attr
+        self._array = np.zeros((0, width), dtype=dtype)
+
+    def add(self, count):
+        self._array = np.concatenate([self._array, np.zeros((count, self._array.shape[1]), self._array.dtype)])
+
+    def foreach_get(self, attr, out):
+        _foreach_get(self._array, out)
+
+    def foreach_set(self, attr, values):
+        _foreach_set(self._array, values)
+
+    def __len__(self):
+        return len(self._array)
+
+
+class _NormalCollection:
+    """Vertex normals, approximated as directions from the mesh center"""
+
+    def __init__(self, vertices):
+        self._vertices = vertices
+
+    def foreach_get(self, attr, out):
+        co = self._vertices._array
+        directions = co - co.mean(axis=0) if len(co) else co
+        lengths = np.linalg.norm(directions, axis=1, keepdims=True)
+        _foreach_get(directions / np.where(lengths > 0, lengths, 1.0), out)
+
+    def __len__(self):
+        return len(self._vertices)
+
+
+class _AttributeData:
+    def __init__(self, values):
+        self._values = values
+
+    def foreach_get(self, attr, out):
+        _foreach_get(self._values, out)
+
+    def foreach_set(self, attr, values):
+        _foreach_set(self._values, values)
+
+
+class Attribute:
+    def __init__(self, name, data_type, domain, size):
+        self.name = name
+        self.data_type = data_type
+        self.domain = domain
+        self.data = _AttributeData(np.zeros(size, dtype=np.float32))
+
+
+class Attributes:
+    def __init__(self, mesh):
+        self._mesh = mesh
+        self._items = {}
+
+    def get(self, name, default=None):
+        return self._items.get(name, default)
+
+    def new(self, name, data_type, domain):
+        attribute = self._items[name] = Attribute(name, data_type, domain, len(self._mesh.vertices))
+        return attribute
+
+    def remove(self, attribute):
+        self._items.pop(attribute.name, None)
+
+
+class Mesh(ID):
+    def __init__(self, name):
+        super().__init__(name)
+        self.materials = []
+        self.shape_keys = None
+        self.clear_geometry()
+
+    def clear_geometry(self):
+        self.vertices = _ArrayCollection('co', 3, np.float32)
+        self.edges = _ArrayCollection('vertices', 2, np.int32)
+        self.vertex_normals = _NormalCollection(self.vertices)
+        self.attributes = Attributes(self)
+        self.loop_triangles = _ArrayCollection('vertices', 3, np.int32)
+        self.faces = []
+
+    def from_pydata(self, vertices, edges, faces):
+        self.clear_geometry()
+        self.vertices._array = np.asarray(vertices, dtype=np.float32).reshape(-1, 3)
+        self.faces = [tuple(face) for face in faces]
+        # Like Blender, faces also get their boundary edges
+        face_edges = {tuple(sorted((face[i], face[(i + 1) % len(face)])))
+                      for face in self.faces for i in range(len(face))}
+        all_edges = sorted(face_edges | {tuple(sorted(edge)) for edge in edges})
+        self.edges._array = np.asarray(all_edges, dtype=np.int32).reshape(-1, 2)
+
+    def calc_loop_triangles(self):
+        """Fan-triangulate every face"""
+        triangles = [(face[0], face[i], face[i + 1]) for face in self.faces for i in range(1, len(face) - 1)]
+        self.loop_triangles._array = np.asarray(triangles, dtype=np.int32).reshape(-1, 3)
+
+    def update(self):
+        pass
+
+    @property
+    def users(self):
+        return sum(1 for obj in data.objects if obj.data is self)
+
+
+class _SplinePoint:
+    def __init__(self):
+        self.co = (0.0, 0.0, 0.0, 1.0)
+
+
+class _SplinePoints(list):
+    def add(self, count):
+        self.extend(_SplinePoint() for _ in range(count))
+
+
+class _Spline:
+    def __init__(self, kind):
+        self.type = kind
+        self.points = _SplinePoints([_SplinePoint()])
+
+
+class _Splines(list):
+    def new(self, type):
+        spline = _Spline(type)
+        self.append(spline)
+        return spline
+
+
+class Curve(ID):
+    def __init__(self, name, type='CURVE'):
+        super().__init__(name)
+        self.dimensions = '2D'
+        self.splines = _Splines()
+        self.bevel_depth = 0.0
+        self.bevel_resolution = 0
+        self.materials = []
+
+
+# --- Materials and node trees ----------------------------------------------------
+
+class _Socket:
+    def __init__(self, name):
+        self.name = name
+        self.default_value = 0.0
+
+    def keyframe_insert(self, data_path, frame=0):
+        return True
+
+
+class _Sockets:
+    """Sockets addressable by index or name, created on first access"""
+
+    def __init__(self):
+        self._items = []
+
+    def __getitem__(self, key):
+        if isinstance(key, int):
+            while len(self._items) <= key:
+                self._items.append(_Socket(str(len(self._items))))
+            return self._items[key]
+        for socket in self._items:
+            if socket.name == key:
+                return socket
+        self._items.append(_Socket(key))
+        return self._items[-1]
+
+
+class _RampElement:
+    def __init__(self):
+        self.color = (0.0, 0.0, 0.0, 1.0)
+
+
+class _ColorRamp:
+    def __init__(self):
+        self.elements = [_RampElement(), _RampElement()]
+
+
+class Node:
+    def __init__(self, type):
+        self.bl_idname = type
+        self.location = (0, 0)
+        self.inputs = _Sockets()
+        self.outputs = _Sockets()
+        self.color_ramp = _ColorRamp()
+        self.node_tree = None
+        self.attribute_type = 'GEOMETRY'
+        self.attribute_name = ""
+
+
+class _Nodes(list):
+    def new(self, type):
+        node = Node(type)
+        self.append(node)
+        return node
+
+
+class _Links(list):
+    def new(self, output, input):
+        self.append((output, input))
+        return self[-1]
+
+
+class _Interface:
+    def new_socket(self, name, in_out='INPUT', socket_type='NodeSocketFloat'):
+        return _Socket(name)
+
+
+class NodeTree(ID):
+    def __init__(self, name, type='ShaderNodeTree'):
+        super().__init__(name)
+        self.type = type
+        self.nodes = _Nodes()
+        self.links = _Links()
+        self.interface = _Interface()
+
+
+class Material(ID):
+    def __init__(self, name):
+        super().__init__(name)
+        self.node_tree = None
+
+    @property
+    def use_nodes(self):
+        return self.node_tree is not None
+
+    @use_nodes.setter
+    def use_nodes(self, value):
+        if value and self.node_tree is None:
+            self.node_tree = NodeTree(f"{self.name}_Tree")
+            self.node_tree.nodes.new('ShaderNodeBsdfPrincipled')
+            self.node_tree.nodes.new('ShaderNodeOutputMaterial')
+
+
+class _MaterialSlot:
+    def __init__(self):
+        self.link = 'DATA'
+        self.material = None
+
+
+# --- Objects and scene ----------------------------------------------------------
+
+class Object(ID):
+    location = _VectorProperty((0.0, 0.0, 0.0))
+    rotation_euler = _VectorProperty((0.0, 0.0, 0.0))
+    rotation_quaternion = _VectorProperty((1.0, 0.0, 0.0, 0.0))
+    scale = _VectorProperty((1.0, 1.0, 1.0))
+
+    def __init__(self, name, object_data=None):
+        super().__init__(name)
+        self.data = object_data
+        self.rotation_mode = 'XYZ'
+        self.vertex_groups = []
+        self._slots = []
+
+    @property
+    def type(self):
+        if isinstance(self.data, Mesh):
+            return 'MESH'
+        if isinstance(self.data, Curve):
+            return 'CURVE'
+        return 'EMPTY'
+
+    @property
+    def material_slots(self):
+        count = len(self.data.materials) if self.data is not None else 0
+        while len(self._slots) < count:
+            self._slots.append(_MaterialSlot())
+        return self._slots[:count]
+
+    def keyframe_insert(self, data_path, frame=None, index=-1):
+        return _keyframe_insert(self, data_path, data.scene.frame_current if frame is None else frame)
+
+    def to_mesh(self):
+        return self.data
+
+    def to_mesh_clear(self):
+        pass
+
+
+class _CollectionObjects(list):
+    def link(self, obj):
+        if obj in self:
+            raise RuntimeError(f"Object '{obj.name}' already in collection")
+        self.append(obj)
+
+    def unlink(self, obj):
+        self.remove(obj)
+
+
+class Collection(ID):
+    def __init__(self, name):
+        super().__init__(name)
+        self.objects = _CollectionObjects()
+        self.children = _CollectionObjects()
+
+
+class Depsgraph:
+    def __init__(self):
+        self.updates = []
+
+
+class Scene(ID):
+    def __init__(self, name):
+        super().__init__(name)
+        self.frame_start = 1
+        self.frame_end = 250
+        self.frame_current = 1
+        self.render = types.SimpleNamespace(fps=24, fps_base=1.0)
+        self.collection = data.scene_collection
+
+    def frame_set(self, frame, subframe=0.0):
+        """Evaluate every object's F-curves at the new frame"""
+        self.frame_current = int(frame)
+        t = frame + subframe
+        for obj in data.objects:
+            action = obj.animation_data.action if obj.animation_data else None
+            if action is None:
+                continue
+            for fcurve in action.fcurves:
+                if len(fcurve.keyframe_points):
+                    _apply_fcurve(obj, fcurve.data_path, fcurve.array_index, fcurve.evaluate(t))
+
+
+class BlendData:
+    def __init__(self):
+        self.filepath = ""
+        self.objects = IDCollection(Object)
+        self.meshes = IDCollection(Mesh)
+        self.curves = IDCollection(Curve)
+        self.materials = IDCollection(Material)
+        self.node_groups = IDCollection(NodeTree)
+        self.actions = IDCollection(Action)
+        self.collections = IDCollection(Collection)
+        self.scene_collection = Collection("Scene Collection")
+        self.scene = None
+
+
+class Context:
+    @property
+    def scene(self):
+        return data.scene
+
+    @property
+    def collection(self):
+        return data.scene_collection
+
+    def evaluated_depsgraph_get(self):
+        return Depsgraph()
+
+
+data = None
+context = Context()
+
+
+def reset():
+    """Start from an empty file (like read_factory_settings(use_empty=True))"""
+    global data
+    data = BlendData()
+    data.scene = Scene("Scene")
+    bpy.data = data
+
+
+# --- bmesh ----------------------------------------------------------------------
+
+class BMesh:
+    def __init__(self):
+        self.verts = []
+        self.faces = []
+
+    def to_mesh(self, mesh):
+        mesh.from_pydata(self.verts, [], self.faces)
+
+    def free(self):
+        self.verts = []
+        self.faces = []
+
+
+def _create_cube(bm, size=2.0, calc_uvs=False, **kwargs):
+    h = size / 2.0
+    bm.verts = [(x, y, z) for x in (-h, h) for y in (-h, h) for z in (-h, h)]
+    bm.faces = [(0, 1, 3, 2), (4, 6, 7, 5), (0, 4, 5, 1), (2, 3, 7, 6), (0, 2, 6, 4), (1, 5, 7, 3)]
+    return {'verts': bm.verts}
+
+
+def _make_modules():
+    """Build the fake bpy and bmesh modules"""
+    bpy_module = types.ModuleType("bpy")
+    bpy_module.context = context
+    bpy_module.types = types.SimpleNamespace(Object=Object, Mesh=Mesh, ID=ID)
+    bpy_module.app = types.SimpleNamespace(
+        version=(4, 4, 0), version_string="4.4.0 (bpy_mock)", background=True,
+        handlers=types.SimpleNamespace(depsgraph_update_post=[], frame_change_post=[]),
+        timers=types.SimpleNamespace(register=lambda *a, **k: None,
+                                     unregister=lambda *a, **k: None,
+                                     is_registered=lambda *a, **k: False))
+    bpy_module.ops = types.SimpleNamespace()
+
+    bmesh_module = types.ModuleType("bmesh")
+    bmesh_module.new = BMesh
+    bmesh_module.ops = types.SimpleNamespace(create_cube=_create_cube)
+    return bpy_module, bmesh_module
+
+
+bpy, bmesh = _make_modules()
+
+
+def install():
+    """Register the stand-ins as `bpy` and `bmesh` (only if the real ones are absent)"""
+    global installed
+    if 'bpy' in sys.modules and not installed:
+        return False
+    reset()
+    sys.modules['bpy'] = bpy
+    sys.modules['bmesh'] = bmesh
+    installed = True
+    return True
@@ -3,9 +3,275 @@
 # This demonstrates the core concept: manipulating time as a parameter in 3D modeling
 
 import bpy
+import bmesh
+import argparse
+import json
 import math
+import os
+import shutil
+import sys
+import tempfile
+import time
+import numpy as np
 from typing import Dict, Tuple, List
 
+# Make sibling helper modules importable when run via `blender -P`
+_SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+if _SCRIPT_DIR not in sys.path:
+    sys.path.append(_SCRIPT_DIR)
+
+import temporal_format
+from temporal_interp import TemporalEvaluator
+from temporal_quat import euler_to_quat, make_continuous, quat_to_euler
+import temporal_reduce
+import temporal_compress
+import temporal_fields
+import temporal_morph
+import temporal_specs
+import temporal_link
+import temporal_cache
+import temporal_spatial
+import temporal_profile
+import temporal_vat
+import temporal_lod
+import temporal_capture
+from temporal_profile import timed, DATABLOCKS_CREATED, DEPSGRAPH_UPDATES, KEYFRAMES_INSERTED
+from temporal_specs import normalize_phases, phases_to_arrays
+
+# Custom property holding a TemporalScene object's grid position
+GRID_ORIGIN_PROPERTY = "temporal_grid_origin"
+
+# Object transform data paths owned by the temporal evolution
+TRANSFORM_DATA_PATHS = ('location', 'rotation_euler', 'rotation_quaternion', 'scale')
+# Exported channel name of each transform data path
+TRANSFORM_CHANNELS = (('location', 'location'),
+                      ('rotation', 'rotation_euler'),
+                      ('rotation_quat', 'rotation_quaternion'),
+                      ('scale', 'scale'))
+
+# Shared temporal material: one node group/material drives every object
+TEMPORAL_NODE_GROUP = "TemporalTimeRamp"
+TEMPORAL_SHARED_MATERIAL = "TemporalShared_Mat"
+TEMPORAL_PHASE_PROPERTY = "temporal_phase"
+
+# Evaluated states shared by every TemporalObject (see TemporalObject.state_at)
+STATE_CACHE = temporal_cache.TemporalStateCache()
+
+# Default temporal evolution phases used by the demonstration
+DEFAULT_TEMPORAL_PHASES = [
+    {
+        'time': 0,
+        'scale': (1, 1, 1),
+        'rotation': (0, 0, 0),
+        'location': (0, 0, 0),
+        'description': 'Birth - Object emerges'
+    },
+    {
+        'time': 25,
+        'scale': (2, 2, 0.5),
+        'rotation': (0, 0, math.radians(45)),
+        'location': (0, 0, 1),
+        'description': 'Growth - Expanding and rotating'
+    },
+    {
+        'time': 50,
+        'scale': (1.5, 1.5, 3),
+        'rotation': (math.radians(30), 0, math.radians(90)),
+        'location': (2, 0, 2),
+        'description': 'Maturity - Complex transformation'
+    },
+    {
+        'time': 75,
+        'scale': (3, 0.5, 1),
+        'rotation': (math.radians(60), math.radians(45), math.radians(180)),
+        'location': (3, 2, 1),
+        'description': 'Decay - Deforming'
+    },
+    {
+        'time': 100,
+        'scale': (0.1, 0.1, 0.1),
+        'rotation': (math.radians(90), math.radians(90), math.radians(270)),
+        'location': (0, 0, 0),
+        'description': 'End - Returning to origin'
+    }
+]
+
+def bake_fcurves(obj, data_path: str, frames: np.ndarray, values: np.ndarray,
+                 group: str = "Object Transforms", interpolation: str = None) -> int:
+    """Replace the keys of every data_path component with one foreach_set per F-curve
+    
+    frames is (N,), values is (N,) or (N, C). obj may be any animatable ID.
+    Returns the number of keys written.
+    """
+    frames = np.asarray(frames, dtype=np.float32)
+    values = np.asarray(values, dtype=np.float32).reshape(len(frames), -1)
+    if len(frames) and np.any(np.diff(frames) <= 0):
+        raise ValueError(f"Frames for '{data_path}' must be strictly increasing")
+        
+    if obj.animation_data is None:
+        obj.animation_data_create()
+    if obj.animation_data.action is None:
+        obj.animation_data.action = bpy.data.actions.new(name=f"{obj.name}Action")
+        temporal_profile.count(DATABLOCKS_CREATED)
+    fcurves = obj.animation_data.action.fcurves
+    
+    # Interleaved (frame, value) pairs; frames stay fixed across components
+    co = np.empty(len(frames) * 2, dtype=np.float32)
+    co[0::2] = frames
+    
+    for index in range(values.shape[1]):
+        fcurve = fcurves.find(data_path, index=index)
+        if fcurve is None:
+            fcurve = fcurves.new(data_path, index=index, action_group=group)
+            
+        co[1::2] = values[:, index]
+        _write_fcurve_points(fcurve, co, interpolation)
+        
+    temporal_profile.count(KEYFRAMES_INSERTED, len(frames) * values.shape[1])
+    return len(frames) * values.shape[1]
+
+def clear_transform_fcurves(obj):
+    """Remove transform F-curves only, keeping custom property and other animation"""
+    if not obj.animation_data or not obj.animation_data.action:
+        return
+    fcurves = obj.animation_data.action.fcurves
+    for fcurve in [fc for fc in fcurves if fc.data_path in TRANSFORM_DATA_PATHS]:
+        fcurves.remove(fcurve)
+
+def _write_fcurve_points(fcurve, co: np.ndarray, interpolation=None):
+    """Replace all keyframe points of fcurve with interleaved (frame, value) pairs
+    
+    interpolation is one mode for every key or a sequence with one per key.
+    """
+    fcurve.keyframe_points.clear()
+    fcurve.keyframe_points.add(len(co) // 2)
+    fcurve.keyframe_points.foreach_set("co", co)
+    fcurve.keyframe_points.foreach_set("handle_left", co)
+    fcurve.keyframe_points.foreach_set("handle_right", co)
+    if interpolation:
+        modes = [interpolation] * (len(co) // 2) if isinstance(interpolation, str) else interpolation
+        for point, mode in zip(fcurve.keyframe_points, modes):
+            point.interpolation = mode
+    fcurve.update()
+
+def reduce_fcurves(obj, tolerance, data_paths: List[str] = TRANSFORM_DATA_PATHS) -> Dict:
+    """Drop keys each F-curve can rebuild within tolerance
+    
+    tolerance is a float or a dict keyed by channel name ('location',
+    'rotation', 'rotation_quat', 'scale', 'default'), the same keys
+    TemporalObject.reduce_keyframes uses; rotation_quaternion curves fall
+    back to 'rotation'. Only transform curves are reduced unless data_paths
+    says otherwise (other paths are looked up by data_path). Every F-curve
+    is simplified on its own and keeps its keys' interpolation modes. The
+    reported max error is measured with Blender's own evaluator after the
+    rebuild.
+    """
+    report = {'original_keys': 0, 'kept_keys': 0, 'compression_ratio': 1.0, 'max_error': 0.0}
+    temporal_reduce.validate_tolerance(tolerance, data_paths or ())
+    if not obj.animation_data or not obj.animation_data.action:
+        return report
+    channel_names = {path: name for name, path in TRANSFORM_CHANNELS}
+        
+    for fcurve in obj.animation_data.action.fcurves:
+        if data_paths is not None and fcurve.data_path not in data_paths:
+            continue
+        count = len(fcurve.keyframe_points)
+        co = np.empty(count * 2, dtype=np.float32)
+        fcurve.keyframe_points.foreach_get("co", co)
+        times, values = co[0::2].astype(np.float64), co[1::2].astype(np.float64)
+        interpolations = [point.interpolation for point in fcurve.keyframe_points]
+        
+        name = channel_names.get(fcurve.data_path, fcurve.data_path)
+        fallbacks = (fcurve.data_path, 'rotation') if name == 'rotation_quat' else (fcurve.data_path,)
+        tol = temporal_reduce.channel_tolerance(tolerance, name, *fallbacks)
+        mode = 'linear' if all(i == 'LINEAR' for i in interpolations) else 'bezier'
+        mask = temporal_reduce.simplify_channel(times, values, tol, mode=mode)
+        if not mask.all():
+            kept = np.empty(int(mask.sum()) * 2, dtype=np.float32)
+            kept[0::2] = times[mask]
+            kept[1::2] = values[mask]
+            _write_fcurve_points(fcurve, kept,
+                                 [i for i, keep in zip(interpolations, mask) if keep])
+            error = max(abs(fcurve.evaluate(t) - v) for t, v in zip(times, values))
+            report['max_error'] = max(report['max_error'], float(error))
+            
+        report['original_keys'] += count
+        report['kept_keys'] += int(mask.sum())
+        
+    if report['kept_keys']:
+        report['compression_ratio'] = report['original_keys'] / report['kept_keys']
+    return report
+
+def create_cube_mesh(name: str, size: float = 2.0):
+    """Build a cube mesh datablock without operators or context"""
+    mesh = bpy.data.meshes.new(name)
+    bm = bmesh.new()
+    bmesh.ops.create_cube(bm, size=size, calc_uvs=True)
+    bm.to_mesh(mesh)
+    bm.free()
+    temporal_profile.count(DATABLOCKS_CREATED)
+    return mesh
+
+def get_temporal_node_group():
+    """Cached shader node group: object 'temporal_phase' → past/future color ramp"""
+    if TEMPORAL_NODE_GROUP in bpy.data.node_groups:
+        return bpy.data.node_groups[TEMPORAL_NODE_GROUP]
+        
+    group = bpy.data.node_groups.new(TEMPORAL_NODE_GROUP, 'ShaderNodeTree')
+    temporal_profile.count(DATABLOCKS_CREATED)
+    group.interface.new_socket(name="Color", in_out='OUTPUT', socket_type='NodeSocketColor')
+    group.interface.new_socket(name="Time", in_out='OUTPUT', socket_type='NodeSocketFloat')
+    
+    nodes = group.nodes
+    links = group.links
+    
+    # Attribute node in OBJECT mode reads the object's custom property
+    time_input = nodes.new(type='ShaderNodeAttribute')
+    time_input.attribute_type = 'OBJECT'
+    time_input.attribute_name = TEMPORAL_PHASE_PROPERTY
+    color_ramp = nodes.new(type='ShaderNodeValToRGB')
+    group_output = nodes.new(type='NodeGroupOutput')
+    
+    time_input.location = (-200, 0)
+    color_ramp.location = (0, 0)
+    group_output.location = (300, 0)
+    
+    links.new(time_input.outputs['Fac'], color_ramp.inputs[0])
+    links.new(color_ramp.outputs[0], group_output.inputs['Color'])
+    links.new(time_input.outputs['Fac'], group_output.inputs['Time'])
+    
+    # Same gradient as the per-object material
+    color_ramp.color_ramp.elements[0].color = (0.1, 0.1, 0.8, 1)  # Past = Blue
+    color_ramp.color_ramp.elements[1].color = (0.8, 0.1, 0.1, 1)  # Future = Red
+    
+    return group
+
+def get_shared_temporal_material():
+    """Cached material used by every temporal object"""
+    if TEMPORAL_SHARED_MATERIAL in bpy.data.materials:
+        return bpy.data.materials[TEMPORAL_SHARED_MATERIAL]
+        
+    mat = bpy.data.materials.new(name=TEMPORAL_SHARED_MATERIAL)
+    temporal_profile.count(DATABLOCKS_CREATED)
+    mat.use_nodes = True
+    nodes = mat.node_tree.nodes
+    links = mat.node_tree.links
+    nodes.clear()
+    
+    output = nodes.new(type='ShaderNodeOutputMaterial')
+    principled = nodes.new(type='ShaderNodeBsdfPrincipled')
+    time_group = nodes.new(type='ShaderNodeGroup')
+    time_group.node_tree = get_temporal_node_group()
+    
+    output.location = (400, 0)
+    principled.location = (200, 0)
+    time_group.location = (0, 0)
+    
+    links.new(time_group.outputs['Color'], principled.inputs[0])  # Base Color
+    links.new(principled.outputs[0], output.inputs[0])
+    
+    return mat
+
 class TemporalObject:
     """Base class for objects that change over time"""
     
@@ -14,16 +280,25 @@ class TemporalObject:
         self.temporal_keyframes: Dict[float, Dict] = {}
         self.obj = None
         
-    def create_base_object(self):
-        """Create the base 3D object"""
+    @timed()
+    def create_base_object(self, mesh=None, collection=None,
+                           location: Tuple[float, float, float] = (0, 0, 0)):
+        """Create the base 3D object
+        
+        Uses bpy.data directly (no operators), so it is safe to call in loops.
+        Passing a shared mesh creates a linked duplicate.
+        """
         # Remove existing object if it exists
         if self.name in bpy.data.objects:
             bpy.data.objects.remove(bpy.data.objects[self.name])
             
         # Create new cube
-        bpy.ops.mesh.primitive_cube_add(location=(0, 0, 0))
-        self.obj = bpy.context.active_object
-        self.obj.name = self.name
+        if mesh is None:
+            mesh = create_cube_mesh(f"{self.name}_Mesh")
+        self.obj = bpy.data.objects.new(self.name, mesh)
+        temporal_profile.count(DATABLOCKS_CREATED)
+        self.obj.location = location
+        (collection or bpy.context.collection).objects.link(self.obj)
         
         # Add custom properties for temporal data
         self.obj["is_temporal"] = True
@@ -32,60 +307,132 @@ class TemporalObject:
     def add_temporal_keyframe(self, time: float, properties: Dict):
         """Add a keyframe at specific time with properties"""
         self.temporal_keyframes[time] = properties
+        self._temporal_data_changed()
+        
+    def _temporal_data_changed(self):
+        """Notify consumers that keyframes or baked curves changed"""
+        STATE_CACHE.invalidate(self.name)
+        if self.obj is not None:
+            STATE_CACHE.invalidate(self.obj.name)
+            mark_live_link_dirty(self.obj.name)
+            
+    def state_at(self, t: float, include_mesh: bool = False) -> Dict:
+        """Evaluated state at time t, served from STATE_CACHE when possible
+        
+        Transforms come straight from the F-curves (or temporal_keyframes when
+        nothing is baked), so no frame_set is needed. include_mesh=True adds
+        the evaluated 'vertices'/'normals', which costs one frame change on a
+        miss. Returned arrays are read-only. Edits made outside TemporalObject
+        (e.g. in the graph editor) need STATE_CACHE.invalidate().
+        """
+        owner = self.obj.name if self.obj is not None else self.name
+        state = STATE_CACHE.get_state(owner, t)
+        if state is None:
+            if self.obj is not None and self.obj.animation_data and self.obj.animation_data.action:
+                channels = _sample_transform_channels(self.obj, np.array([t], dtype=np.float32))
+            elif self.temporal_keyframes:
+                channels = self.compile_evaluator().sample(np.array([t], dtype=np.float64))
+            else:
+                raise ValueError(f"{self.name} has no temporal keyframes to evaluate")
+            state = {'time': float(t)}
+            for name, values in channels.items():
+                state[name] = values[0]
+                state[name].flags.writeable = False
+            STATE_CACHE.put_state(owner, t, state)
+            
+        if include_mesh and self.obj is not None and self.obj.type == 'MESH':
+            mesh = STATE_CACHE.get_mesh(owner, t)
+            if mesh is None:
+                # A one-frame iteration allocates fresh buffers, so no copy is needed
+                for _, _, _, _, vertices, normals in iter_evaluated_states(self.obj, [t]):
+                    mesh = (vertices, normals)
+                STATE_CACHE.put_mesh(owner, t, *mesh)
+            state = dict(state, vertices=mesh[0], normals=mesh[1])
+        return state
+        
+    def compile_evaluator(self, mode: str = 'linear') -> TemporalEvaluator:
+        """Compile temporal_keyframes into a Blender-independent evaluator"""
+        return TemporalEvaluator.from_keyframes(self.temporal_keyframes, mode=mode)
+        
+    @timed()
+    def apply_phase_spec(self, spec_path: str, cache_dir: str = None,
+                         quaternion: bool = False) -> Dict:
+        """Bake phases from a JSON/TOML spec file, reusing the compiled cache
+        
+        If the object already carries a bake of the same spec content, the
+        bake itself is skipped too.
+        """
+        compiled = temporal_specs.compile_phase_spec(spec_path, cache_dir)
+        arrays = compiled['arrays']
+        phases = temporal_specs.arrays_to_phases(arrays, compiled['descriptions'])
+        
+        bake_key = f"{compiled['hash']}:{'quat' if quaternion else 'euler'}"
+        already_baked = (self.obj is not None and self.obj.get("temporal_spec_hash") == bake_key
+                         and self.obj.animation_data and self.obj.animation_data.action)
+        
+        self.temporal_keyframes = {}
+        for phase in phases:
+            self.add_temporal_keyframe(phase['time'], phase)
+            
+        if self.obj and not already_baked:
+            rotation = arrays['rotation_quat'] if quaternion else arrays['rotation']
+            self.bake_temporal_arrays(arrays['time'], arrays['location'], rotation, arrays['scale'])
+            self.obj["temporal_spec_hash"] = bake_key
+            
+        source = "cache" if compiled['cached'] else "compiled"
+        state = "up to date" if already_baked else f"{len(phases)} phases baked"
+        print(f"✅ Phase spec '{compiled['name']}' ({source}): {state}")
+        return compiled
+        
+    def _forget_spec_bake(self):
+        """The curves no longer come from a spec, so apply_phase_spec must re-bake"""
+        if self.obj is not None and "temporal_spec_hash" in self.obj:
+            del self.obj["temporal_spec_hash"]
+            
+    @timed()
+    def apply_temporal_evolution(self, phases: List[Dict] = None, bulk: bool = False,
+                                 quaternion: bool = False, incremental: bool = False):
+        """Apply the temporal changes to the object
         
-    def apply_temporal_evolution(self):
-        """Apply the temporal changes to the object"""
+        With bulk=True the phases are baked straight into F-curves from NumPy
+        arrays instead of one frame_set/keyframe_insert round trip per phase.
+        quaternion=True (bulk only) keys rotation_quaternion instead of Euler.
+        incremental=True only edits keys of phases that differ from the
+        stored temporal_keyframes (see update_temporal_evolution).
+        """
         if not self.obj:
             return
             
-        # Clear existing keyframes
-        self.obj.animation_data_clear()
-        
-        # Define temporal evolution phases
-        temporal_phases = [
-            {
-                'time': 0,
-                'scale': (1, 1, 1),
-                'rotation': (0, 0, 0),
-                'location': (0, 0, 0),
-                'description': 'Birth - Object emerges'
-            },
-            {
-                'time': 25,
-                'scale': (2, 2, 0.5),
-                'rotation': (0, 0, math.radians(45)),
-                'location': (0, 0, 1),
-                'description': 'Growth - Expanding and rotating'
-            },
-            {
-                'time': 50,
-                'scale': (1.5, 1.5, 3),
-                'rotation': (math.radians(30), 0, math.radians(90)),
-                'location': (2, 0, 2),
-                'description': 'Maturity - Complex transformation'
-            },
-            {
-                'time': 75,
-                'scale': (3, 0.5, 1),
-                'rotation': (math.radians(60), math.radians(45), math.radians(180)),
-                'location': (3, 2, 1),
-                'description': 'Decay - Deforming'
-            },
-            {
-                'time': 100,
-                'scale': (0.1, 0.1, 0.1),
-                'rotation': (math.radians(90), math.radians(90), math.radians(270)),
-                'location': (0, 0, 0),
-                'description': 'End - Returning to origin'
-            }
-        ]
+        if incremental and self.temporal_keyframes:
+            self.update_temporal_evolution(
+                phases if phases is not None else DEFAULT_TEMPORAL_PHASES)
+            return
+            
+        # Clear existing transform keyframes (other animation stays intact)
+        clear_transform_fcurves(self.obj)
+        self._forget_spec_bake()
+        
+        # Define temporal evolution phases (both rotation forms, for the evaluators)
+        temporal_phases = normalize_phases(phases if phases is not None else DEFAULT_TEMPORAL_PHASES)
+        
+        if bulk:
+            arrays = phases_to_arrays(temporal_phases)
+            rotation = arrays['rotation_quat'] if quaternion else arrays['rotation']
+            self.bake_temporal_arrays(arrays['time'], arrays['location'],
+                                      rotation, arrays['scale'])
+            for phase in temporal_phases:
+                self.add_temporal_keyframe(phase['time'], phase)
+            print(f"✅ Temporal evolution baked: {len(temporal_phases)} phases")
+            return
         
         # Apply keyframes for each temporal phase
+        self.obj.rotation_mode = 'XYZ'
         for phase in temporal_phases:
             frame = int(phase['time'])
             
             # Set frame
             bpy.context.scene.frame_set(frame)
+            temporal_profile.count(DEPSGRAPH_UPDATES)
             
             # Apply transformations
             self.obj.location = phase['location']
@@ -96,16 +443,294 @@ class TemporalObject:
             self.obj.keyframe_insert(data_path="location", frame=frame)
             self.obj.keyframe_insert(data_path="rotation_euler", frame=frame)
             self.obj.keyframe_insert(data_path="scale", frame=frame)
+            temporal_profile.count(KEYFRAMES_INSERTED, 9)
             
             # Store in temporal data
             self.add_temporal_keyframe(phase['time'], phase)
             
         print(f"✅ Temporal evolution applied: {len(temporal_phases)} phases")
         
-    def add_temporal_material(self):
-        """Add material that changes over time"""
+    @timed()
+    def update_temporal_evolution(self, phases: List[Dict], tolerance: float = 1e-6) -> Dict:
+        """Re-bake only the keyframe points whose phases changed
+        
+        The new phase list is diffed against temporal_keyframes. Only the
+        affected F-curve points are edited, removed or inserted; other
+        animation data (and material keyframes) is left untouched.
+        """
+        report = {'added': 0, 'removed': 0, 'changed': 0, 'fcurves_touched': 0}
+        if not self.obj:
+            return report
+        phases = normalize_phases(phases)
+            
+        action = self.obj.animation_data.action if self.obj.animation_data else None
+        if action is None or not self.temporal_keyframes:
+            self.apply_temporal_evolution(phases, bulk=True,
+                                          quaternion=self.obj.rotation_mode == 'QUATERNION')
+            report['added'] = len(phases)
+            return report
+            
+        # Quaternions are re-derived from each side's Euler rotation, never reused
+        old = phases_to_arrays(list(self.temporal_keyframes.values()))
+        new = phases_to_arrays(phases)
+        old_row = {float(t): i for i, t in enumerate(old['time'])}
+        new_row = {float(t): i for i, t in enumerate(new['time'])}
+        removed = sorted(set(old_row) - set(new_row))
+        added = sorted(set(new_row) - set(old_row))
+        common = sorted(set(old_row) & set(new_row))
+        
+        quaternion_mode = self.obj.rotation_mode == 'QUATERNION'
+        channels = (('location', 'location'),
+                    ('rotation_quaternion' if quaternion_mode else 'rotation_euler',
+                     'rotation_quat' if quaternion_mode else 'rotation'),
+                    ('scale', 'scale'))
+        changed_times = set()
+        
+        for data_path, key in channels:
+            for axis in range(new[key].shape[1]):
+                old_values = {t: float(old[key][old_row[t], axis]) for t in common}
+                new_values = {t: float(new[key][new_row[t], axis]) for t in new_row}
+                edits = [t for t in common if abs(new_values[t] - old_values[t]) > tolerance]
+                if not (edits or removed or added):
+                    continue
+                    
+                fcurve = action.fcurves.find(data_path, index=axis)
+                if fcurve is None:
+                    fcurve = action.fcurves.new(data_path, index=axis,
+                                                action_group="Object Transforms")
+                points = fcurve.keyframe_points
+                
+                def point_frames():
+                    co = np.empty(len(points) * 2, dtype=np.float32)
+                    points.foreach_get("co", co)
+                    return co[0::2]
+                    
+                def point_index(frames, t):
+                    i = int(np.searchsorted(frames, t))
+                    return i if i < len(frames) and abs(frames[i] - t) < 1e-4 else None
+                    
+                # Remove from the back first, so earlier indices are unaffected
+                frames = point_frames()
+                for i in sorted((i for i in (point_index(frames, t) for t in removed)
+                                 if i is not None), reverse=True):
+                    points.remove(points[i], fast=True)
+                    
+                # Edit in place (indices stay valid), shifting handles with the key.
+                # Edited times this curve has no key for are inserted afterwards.
+                frames = point_frames()
+                missing = []
+                for t in edits:
+                    i = point_index(frames, t)
+                    if i is None:
+                        missing.append(t)
+                        continue
+                    delta = new_values[t] - points[i].co[1]
+                    points[i].co[1] += delta
+                    points[i].handle_left[1] += delta
+                    points[i].handle_right[1] += delta
+                    changed_times.add(t)
+                    
+                for t in missing + added:
+                    points.insert(t, new_values[t], options={'FAST'})
+                changed_times.update(missing)
+                temporal_profile.count(KEYFRAMES_INSERTED, len(added) + len(missing))
+                    
+                fcurve.update()
+                report['fcurves_touched'] += 1
+                
+        if report['fcurves_touched']:
+            self._forget_spec_bake()
+                
+        self.temporal_keyframes = {}
+        for phase in phases:
+            self.add_temporal_keyframe(phase['time'], phase)
+            
+        report.update(added=len(added), removed=len(removed), changed=len(changed_times))
+        self._temporal_data_changed()
+        print(f"✅ Temporal evolution updated: +{report['added']} -{report['removed']} "
+              f"~{report['changed']} keys, {report['fcurves_touched']} F-curves touched")
+        return report
+        
+    @timed()
+    def bake_temporal_arrays(self, times: np.ndarray, location: np.ndarray,
+                             rotation: np.ndarray, scale: np.ndarray) -> int:
+        """Bake (N,) times and (N, 3) transform arrays into F-curves in bulk
+        
+        An (N, 4) rotation array is treated as quaternions and keyed on
+        rotation_quaternion, switching the object to QUATERNION mode.
+        """
+        if not self.obj:
+            return 0
+        
+        # Clear existing transform keyframes (other animation stays intact)
+        clear_transform_fcurves(self.obj)
+        self._forget_spec_bake()
+        
+        rotation = np.asarray(rotation)
+        if rotation.shape[-1] == 4:
+            self.obj.rotation_mode = 'QUATERNION'
+            rotation_path = 'rotation_quaternion'
+        else:
+            # Phase rotations are XYZ Euler; a quaternion-mode object would ignore them
+            self.obj.rotation_mode = 'XYZ'
+            rotation_path = 'rotation_euler'
+        
+        inserted = 0
+        for data_path, values in (('location', location),
+                                  (rotation_path, rotation),
+                                  ('scale', scale)):
+            inserted += bake_fcurves(self.obj, data_path, times, values)
+        self._temporal_data_changed()
+        return inserted
+        
+    @timed()
+    def reduce_keyframes(self, tolerance, mode: str = 'bezier', fcurves: bool = True) -> Dict:
+        """Remove redundant keys from temporal_keyframes and the baked F-curves
+        
+        tolerance is a float or a per-channel dict ({'location': 1e-3, ...}).
+        """
+        self.temporal_keyframes, report = temporal_reduce.reduce_keyframes(
+            self.temporal_keyframes, tolerance, mode=mode)
+        self._temporal_data_changed()
+        print(f"✅ Temporal keyframes reduced: {report['original_keys']} → {report['kept_keys']} "
+              f"({report['compression_ratio']:.1f}x, max error {report['max_error']:.2e})")
+        
+        if fcurves and self.obj:
+            fcurve_report = reduce_fcurves(self.obj, tolerance)
+            self._forget_spec_bake()
+            report['fcurves'] = fcurve_report
+            print(f"✅ F-curve keys reduced: {fcurve_report['original_keys']} → "
+                  f"{fcurve_report['kept_keys']} ({fcurve_report['compression_ratio']:.1f}x, "
+                  f"max error {fcurve_report['max_error']:.2e})")
+        return report
+        
+    @timed()
+    def add_shape_key_states(self, times, positions: np.ndarray) -> int:
+        """Store (K, V, 3) temporal mesh states as shape keys cross-faded over time
+        
+        Each state becomes a shape key that peaks at its time and fades into
+        its neighbours, so playback interpolates linearly between states.
+        """
+        if not self.obj or self.obj.type != 'MESH':
+            return 0
+            
+        positions = np.asarray(positions, dtype=np.float32)
+        if positions.shape[1] != len(self.obj.data.vertices):
+            raise ValueError(f"States have {positions.shape[1]} vertices, "
+                             f"mesh has {len(self.obj.data.vertices)}")
+                             
+        if self.obj.data.shape_keys is None:
+            self.obj.shape_key_add(name="Basis", from_mix=False)
+        key = self.obj.data.shape_keys
+        
+        # Key is an ID, so the time of each state can live in a custom property
+        state_times = dict(key.get("temporal_times", {}))
+        for t, co in zip(times, positions):
+            name = f"T_{float(t):g}"
+            block = key.key_blocks.get(name) or self.obj.shape_key_add(name=name, from_mix=False)
+            block.data.foreach_set("co", co.reshape(-1))
+            state_times[name] = float(t)
+        key["temporal_times"] = state_times
+        
+        self._key_shape_timeline()
+        self._temporal_data_changed()
+        print(f"✅ Temporal shape keys stored: {len(state_times)} states")
+        return len(positions)
+        
+    def _key_shape_timeline(self):
+        """Key every temporal shape key as a 0 → 1 → 0 tent between its neighbours"""
+        key = self.obj.data.shape_keys
+        ordered = sorted(key["temporal_times"].items(), key=lambda item: item[1])
+        base_time = float(self.obj.get("temporal_range", [0, 100])[0])
+        
+        for i, (name, t) in enumerate(ordered):
+            frames = [t]
+            values = [1.0]
+            if i > 0:
+                frames.insert(0, ordered[i - 1][1])
+                values.insert(0, 0.0)
+            elif t > base_time:
+                frames.insert(0, base_time)
+                values.insert(0, 0.0)
+            if i < len(ordered) - 1:
+                frames.append(ordered[i + 1][1])
+                values.append(0.0)
+            bake_fcurves(key, f'key_blocks["{name}"].value', frames, values,
+                         group="Temporal Shapes", interpolation='LINEAR')
+                         
+    @timed()
+    def bake_time_field(self, kind: str = 'distance', seeds=(0,), group: str = None,
+                        time_range: Tuple[float, float] = (0.0, 1.0), invert: bool = False,
+                        attribute: str = temporal_fields.TIME_FIELD_ATTRIBUTE) -> np.ndarray:
+        """Precompute a per-vertex time field (TemporalMeshData.vertexTimes)
+        
+        kind is 'distance', 'geodesic' or 'weights' (painted vertex group).
+        Positions come from the evaluated mesh; the result is stored as a point
+        attribute so export_temporal_data writes it in keyframe vertex order.
+        Bake into 'temporal_velocity' to author timeVelocities the same way.
+        """
+        if not self.obj or self.obj.type != 'MESH':
+            return None
+            
+        depsgraph = bpy.context.evaluated_depsgraph_get()
+        temporal_profile.count(DEPSGRAPH_UPDATES)
+        obj_eval = self.obj.evaluated_get(depsgraph)
+        mesh = obj_eval.to_mesh()
+        try:
+            positions = temporal_fields.read_vertex_positions(mesh)
+            edges = temporal_fields.read_edges(mesh) if kind == 'geodesic' else None
+        finally:
+            obj_eval.to_mesh_clear()
+            
+        weights = temporal_fields.vertex_group_field(self.obj, group) if kind == 'weights' else None
+        field = temporal_fields.compute_time_field(kind, positions, edges, seeds, weights,
+                                                   time_range, invert)
+        
+        if len(field) == len(self.obj.data.vertices):
+            temporal_fields.write_point_attribute(self.obj.data, attribute, field)
+        else:
+            print(f"⚠️ Modifiers change the vertex count; '{attribute}' not stored on the mesh")
+            
+        print(f"✅ Time field baked: {kind} → {attribute} ({len(field)} vertices)")
+        return field
+        
+    @timed()
+    def export_stream(self, filepath: str, every_frame: bool = False, chunk_size: int = 64):
+        """Stream this object's keyframes (or every frame) to a chunked .tvrs file"""
+        if not self.obj:
+            return None
+        frames = None if every_frame else sorted(self.temporal_keyframes)
+        return export_temporal_stream(self.obj.name, filepath, frames, chunk_size)
+        
+    @timed()
+    def export_vat(self, directory: str, every_frame: bool = True, **options):
+        """Bake this object's captured frames (or keyframes) to vertex animation textures"""
+        if not self.obj:
+            return None
+        frames = None if every_frame else sorted(self.temporal_keyframes)
+        return export_vertex_animation_texture(self.obj.name, directory, frames, **options)
+        
+    @timed()
+    def add_temporal_material(self, shared: bool = True):
+        """Add material that changes over time
+        
+        By default every object uses one shared material whose node group reads
+        the object's animated 'temporal_phase' property, so hundreds of objects
+        compile a single shader. shared=False builds a private node tree.
+        """
+        if shared:
+            self._assign_material(get_shared_temporal_material())
+            
+            # Per-object normalized time, read by the Attribute node
+            start, end = self.obj.get("temporal_range", [0, 100])
+            self.obj[TEMPORAL_PHASE_PROPERTY] = 0.0
+            bake_fcurves(self.obj, f'["{TEMPORAL_PHASE_PROPERTY}"]', [start, end], [0.0, 1.0],
+                         group="Temporal Material")
+            return
+            
         # Create material
         mat = bpy.data.materials.new(name=f"{self.name}_TemporalMat")
+        temporal_profile.count(DATABLOCKS_CREATED)
         mat.use_nodes = True
         
         # Get nodes
@@ -137,14 +762,27 @@ class TemporalObject:
         color_ramp.color_ramp.elements[1].color = (0.8, 0.1, 0.1, 1)  # Future = Red
         
         # Assign material
-        self.obj.data.materials.append(mat)
+        self._assign_material(mat)
         
         # Animate the time value
         time_input.outputs[0].default_value = 0
         time_input.outputs[0].keyframe_insert(data_path="default_value", frame=0)
         time_input.outputs[0].default_value = 1
         time_input.outputs[0].keyframe_insert(data_path="default_value", frame=100)
+        temporal_profile.count(KEYFRAMES_INSERTED, 2)
         
+    def _assign_material(self, mat):
+        """Put mat in the first slot, object-linked when the mesh is shared"""
+        if self.obj.data.users > 1:
+            # Linked duplicates share the mesh, so keep the material on the object
+            if not self.obj.data.materials:
+                self.obj.data.materials.append(None)
+            self.obj.material_slots[0].link = 'OBJECT'
+            self.obj.material_slots[0].material = mat
+        elif mat.name not in self.obj.data.materials:
+            self.obj.data.materials.append(mat)
+            
+    @timed()
     def create_temporal_visualization(self):
         """Create visual guides for temporal evolution"""
         # Create path visualization
@@ -162,6 +800,7 @@ class TemporalObject:
         # Create curve object
         path_obj = bpy.data.objects.new(f"{self.name}_TimePath", curve)
         bpy.context.collection.objects.link(path_obj)
+        temporal_profile.count(DATABLOCKS_CREATED, 2)
         
         # Style the path
         curve.bevel_depth = 0.05
@@ -169,6 +808,160 @@ class TemporalObject:
         
         print("✅ Temporal path visualization created")
 
+class TemporalScene:
+    """Batch manager for many TemporalObjects sharing one mesh datablock"""
+    
+    def __init__(self, name: str = "TemporalScene"):
+        self.name = name
+        self.objects: List[TemporalObject] = []
+        self.timings: Dict[str, float] = {}
+        self.mesh = None
+        
+        # Keep batch objects in their own collection
+        if name in bpy.data.collections:
+            self.collection = bpy.data.collections[name]
+        else:
+            self.collection = bpy.data.collections.new(name)
+            bpy.context.scene.collection.children.link(self.collection)
+            
+    def _record(self, stage: str, start: float):
+        """Store elapsed time for a stage"""
+        self.timings[stage] = time.perf_counter() - start
+        
+    def create_objects(self, count: int, spacing: float = 4.0, mesh=None) -> List[TemporalObject]:
+        """Create count linked duplicates laid out on a square grid"""
+        start = time.perf_counter()
+        
+        self.mesh = mesh or create_cube_mesh(f"{self.name}_Mesh")
+        columns = max(1, math.ceil(math.sqrt(count)))
+        
+        for i in range(count):
+            row, column = divmod(i, columns)
+            location = (column * spacing, row * spacing, 0)
+            temporal_obj = TemporalObject(f"{self.name}_{i:04d}")
+            temporal_obj.create_base_object(
+                mesh=self.mesh, collection=self.collection, location=location)
+            temporal_obj.obj[GRID_ORIGIN_PROPERTY] = location
+            self.objects.append(temporal_obj)
+            
+        self._record('create_objects', start)
+        return self.objects
+        
+    def apply_evolutions(self, phases: List[Dict] = None, quaternion: bool = False):
+        """Bake the same evolution onto every object, offset by its grid position
+        
+        The offset is the grid origin stored at creation, not the animated
+        location, so calling this again re-bakes in place.
+        """
+        start = time.perf_counter()
+        
+        temporal_phases = normalize_phases(phases if phases is not None else DEFAULT_TEMPORAL_PHASES)
+        arrays = phases_to_arrays(temporal_phases)
+        
+        for temporal_obj in self.objects:
+            # Objects added by hand get their origin pinned on the first bake
+            if GRID_ORIGIN_PROPERTY not in temporal_obj.obj:
+                temporal_obj.obj[GRID_ORIGIN_PROPERTY] = tuple(temporal_obj.obj.location)
+            origin = np.array(temporal_obj.obj[GRID_ORIGIN_PROPERTY], dtype=np.float32)
+            rotation = arrays['rotation_quat'] if quaternion else arrays['rotation']
+            temporal_obj.bake_temporal_arrays(arrays['time'], arrays['location'] + origin,
+                                              rotation, arrays['scale'])
+            for phase in temporal_phases:
+                # Store the offset location so evaluators match the baked curves
+                offset = tuple(float(v) for v in np.add(phase['location'], origin))
+                temporal_obj.add_temporal_keyframe(phase['time'], {**phase, 'location': offset})
+                
+        self._record('apply_evolutions', start)
+        
+    def add_materials(self):
+        """Add the temporal material to every object"""
+        start = time.perf_counter()
+        for temporal_obj in self.objects:
+            temporal_obj.add_temporal_material()
+        self._record('add_materials', start)
+        
+    def create_paths(self, samples: int = 200, mode: str = 'bezier',
+                     lod_tolerance: float = 0.0):
+        """Draw every object's evolution path into one batched mesh"""
+        start = time.perf_counter()
+        path_obj = create_batched_temporal_paths(self.objects, samples, mode, lod_tolerance,
+                                                 name=f"{self.name}_TimePaths",
+                                                 collection=self.collection)
+        self._record('create_paths', start)
+        return path_obj
+        
+    def report(self) -> Dict[str, float]:
+        """Print and return per-stage timings"""
+        print(f"⏱️ TemporalScene '{self.name}': {len(self.objects)} objects")
+        for stage, seconds in self.timings.items():
+            per_object = seconds / max(len(self.objects), 1) * 1000
+            print(f"   {stage}: {seconds:.3f}s ({per_object:.3f} ms/object)")
+        return dict(self.timings)
+
+@timed()
+def create_batched_temporal_paths(temporal_objects: List[TemporalObject], samples: int = 200,
+                                  mode: str = 'bezier', lod_tolerance: float = 0.0,
+                                  name: str = "TemporalPaths", collection=None):
+    """Write the evolution paths of many objects into a single edge mesh
+    
+    Paths are sampled with the NumPy evaluator instead of one beveled curve
+    object per TemporalObject. lod_tolerance > 0 drops path points that a
+    straight segment reproduces within that distance. A 'temporal_time'
+    point attribute holds the normalized time for coloring.
+    """
+    point_blocks = []
+    time_blocks = []
+    edge_blocks = []
+    count = 0
+    
+    for temporal_obj in temporal_objects:
+        if len(temporal_obj.temporal_keyframes) < 2:
+            continue
+        evaluator = temporal_obj.compile_evaluator(mode)
+        t0, t1 = evaluator.time_range
+        times = np.linspace(t0, t1, samples)
+        points = evaluator.sample(times)['location']
+        
+        if lod_tolerance > 0.0:
+            keep = temporal_reduce.simplify_channel(times, points, lod_tolerance, mode='linear')
+            times, points = times[keep], points[keep]
+            
+        # Consecutive points of one path are joined by edges
+        indices = np.arange(count, count + len(points), dtype=np.int32)
+        edge_blocks.append(np.column_stack([indices[:-1], indices[1:]]))
+        point_blocks.append(points.astype(np.float32))
+        time_blocks.append(((times - t0) / (t1 - t0)).astype(np.float32))
+        count += len(points)
+        
+    if name in bpy.data.meshes:
+        mesh = bpy.data.meshes[name]
+        mesh.clear_geometry()
+    else:
+        mesh = bpy.data.meshes.new(name)
+        temporal_profile.count(DATABLOCKS_CREATED)
+        
+    if count:
+        points = np.concatenate(point_blocks)
+        edges = np.concatenate(edge_blocks)
+        mesh.vertices.add(len(points))
+        mesh.edges.add(len(edges))
+        mesh.vertices.foreach_set("co", points.reshape(-1))
+        mesh.edges.foreach_set("vertices", edges.reshape(-1))
+        mesh.update()
+        temporal_fields.write_point_attribute(mesh, temporal_fields.TIME_FIELD_ATTRIBUTE,
+                                              np.concatenate(time_blocks))
+        
+    if name in bpy.data.objects:
+        path_obj = bpy.data.objects[name]
+        path_obj.data = mesh
+    else:
+        path_obj = bpy.data.objects.new(name, mesh)
+        temporal_profile.count(DATABLOCKS_CREATED)
+        (collection or bpy.context.collection).objects.link(path_obj)
+        
+    print(f"✅ Batched temporal paths created: {len(edge_blocks)} paths, {count} points")
+    return path_obj
+
 def demonstrate_temporal_concept():
     """Main function to demonstrate temporal modeling"""
     
@@ -197,6 +990,22 @@ def demonstrate_temporal_concept():
     
     return temporal_obj
 
+def demonstrate_temporal_scene(count: int = 500):
+    """Batch demonstration: many evolving objects created through bpy.data"""
+    
+    print(f"🚀 Building temporal scene with {count} objects...")
+    
+    bpy.context.scene.frame_start = 0
+    bpy.context.scene.frame_end = 100
+    
+    scene = TemporalScene("TemporalScene_Demo")
+    scene.create_objects(count)
+    scene.apply_evolutions()
+    scene.create_paths()
+    scene.report()
+    
+    return scene
+
 def add_scene_info():
     """Add text information to the scene"""
     # Create text object
@@ -213,28 +1022,544 @@ def add_scene_info():
     text_obj.scale = (0.5, 0.5, 0.5)
 
 # Utility functions for future VR integration
-def export_temporal_data(obj_name: str, filepath: str):
-    """Export temporal data for Unity import"""
+def _keyframe_times(obj) -> np.ndarray:
+    """Sorted unique keyframe frames across the object's transform F-curves"""
+    if not obj.animation_data or not obj.animation_data.action:
+        return np.zeros(0, dtype=np.float32)
+
+    data_paths = {path for _, path in TRANSFORM_CHANNELS}
+    frames = []
+    for fcurve in obj.animation_data.action.fcurves:
+        if fcurve.data_path not in data_paths:
+            continue
+        co = np.empty(len(fcurve.keyframe_points) * 2, dtype=np.float32)
+        fcurve.keyframe_points.foreach_get("co", co)
+        frames.append(co[0::2])
+
+    if not frames:
+        return np.zeros(0, dtype=np.float32)
+    return np.unique(np.concatenate(frames))
+
+def _sample_transform_channels(obj, times: np.ndarray) -> Dict[str, np.ndarray]:
+    """Evaluate transform F-curves at the given frames without touching the scene
+    
+    Rotations are exported both as Euler angles and as continuous quaternions,
+    whichever of the two the object is actually keyed with.
+    """
+    channels = {}
+    fcurves = obj.animation_data.action.fcurves if obj.animation_data and obj.animation_data.action else None
+    quaternion_mode = obj.rotation_mode == 'QUATERNION'
+
+    for name, data_path in TRANSFORM_CHANNELS:
+        if name == ('rotation' if quaternion_mode else 'rotation_quat'):
+            continue
+        static = tuple(getattr(obj, data_path))
+        values = np.empty((len(times), len(static)), dtype=np.float32)
+        # Fall back to the static value for channels without animation
+        values[:] = static
+        if fcurves is not None:
+            for axis in range(len(static)):
+                fcurve = fcurves.find(data_path, index=axis)
+                if fcurve is not None:
+                    values[:, axis] = [fcurve.evaluate(t) for t in times]
+        channels[name] = values
+
+    if quaternion_mode:
+        channels['rotation_quat'] = make_continuous(channels['rotation_quat']).astype(np.float32)
+        channels['rotation'] = quat_to_euler(channels['rotation_quat']).astype(np.float32)
+    else:
+        order = obj.rotation_mode if len(obj.rotation_mode) == 3 else 'XYZ'
+        channels['rotation_quat'] = make_continuous(
+            euler_to_quat(channels['rotation'], order)).astype(np.float32)
+
+    return channels
+
+def iter_evaluated_states(obj, frames, include_mesh: bool = True):
+    """Yield (frame, location, rotation, scale, vertices, normals) per frame
+    
+    rotation is a quaternion for QUATERNION-mode objects, otherwise Euler.
+    Vertex/normal buffers are reused between frames, so consumers must copy
+    them before advancing the generator. The scene frame is restored on exit.
+    """
+    scene = bpy.context.scene
+    original_frame = scene.frame_current
+    include_mesh = include_mesh and obj.type == 'MESH'
+    vertices = None
+    normals = None
+
+    try:
+        for t in frames:
+            t = float(t)
+            scene.frame_set(int(math.floor(t)), subframe=t - math.floor(t))
+            temporal_profile.count(DEPSGRAPH_UPDATES)
+            if include_mesh:
+                depsgraph = bpy.context.evaluated_depsgraph_get()
+                obj_eval = obj.evaluated_get(depsgraph)
+                mesh = obj_eval.to_mesh()
+                try:
+                    count = len(mesh.vertices)
+                    if vertices is None:
+                        vertices = np.empty((count, 3), dtype=np.float32)
+                        normals = np.empty((count, 3), dtype=np.float32)
+                    elif count != len(vertices):
+                        raise ValueError(
+                            f"Vertex count changed at frame {t}: {count} != {len(vertices)}")
+                    mesh.vertices.foreach_get("co", vertices.reshape(-1))
+                    mesh.vertex_normals.foreach_get("vector", normals.reshape(-1))
+                finally:
+                    obj_eval.to_mesh_clear()
+            rotation = (obj.rotation_quaternion if obj.rotation_mode == 'QUATERNION'
+                        else obj.rotation_euler)
+            yield (t, tuple(obj.location), tuple(rotation), tuple(obj.scale),
+                   vertices, normals)
+    finally:
+        scene.frame_set(original_frame)
+
+def capture_mesh_frames(obj, frames, vertices: np.ndarray = None,
+                        normals: np.ndarray = None) -> Tuple[np.ndarray, np.ndarray]:
+    """Capture the evaluated mesh at many frames into (F, V, 3) buffers
+    
+    Each frame costs one frame_set and two foreach_get calls that write
+    straight into the output slices, with no per-frame allocation. Pass
+    preallocated buffers (e.g. np.memmap) to reuse them across captures.
+    The scene frame is restored on exit.
+    """
+    scene = bpy.context.scene
+    original_frame = scene.frame_current
+    frames = np.asarray(frames, dtype=np.float64)
+    
+    try:
+        for i, t in enumerate(frames):
+            scene.frame_set(int(math.floor(t)), subframe=float(t - math.floor(t)))
+            temporal_profile.count(DEPSGRAPH_UPDATES)
+            depsgraph = bpy.context.evaluated_depsgraph_get()
+            obj_eval = obj.evaluated_get(depsgraph)
+            mesh = obj_eval.to_mesh()
+            try:
+                count = len(mesh.vertices)
+                if vertices is None:
+                    vertices = np.empty((len(frames), count, 3), dtype=np.float32)
+                if normals is None:
+                    normals = np.empty((len(frames), count, 3), dtype=np.float32)
+                if vertices.shape[1:] != (count, 3) or normals.shape[1:] != (count, 3):
+                    raise ValueError(f"Vertex count changed at frame {t}: {count} != {vertices.shape[1]}")
+                mesh.vertices.foreach_get("co", vertices[i].reshape(-1))
+                mesh.vertex_normals.foreach_get("vector", normals[i].reshape(-1))
+            finally:
+                obj_eval.to_mesh_clear()
+    finally:
+        scene.frame_set(original_frame)
+        
+    return vertices, normals
+
+def _evaluated_topology(obj) -> Tuple[np.ndarray, np.ndarray]:
+    """(E, 2) edges and (T, 3) triangles of the evaluated mesh at the current frame"""
+    obj_eval = obj.evaluated_get(bpy.context.evaluated_depsgraph_get())
+    mesh = obj_eval.to_mesh()
+    try:
+        return temporal_fields.read_edges(mesh), temporal_fields.read_triangles(mesh)
+    finally:
+        obj_eval.to_mesh_clear()
+
+@timed()
+def export_temporal_data(obj_name: str, filepath: str, include_mesh: bool = True,
+                         compress: bool = False, frames=None, adjacency: bool = True,
+                         spatial_index: bool = True, lod_levels: int = 0,
+                         lod_ratio: float = temporal_lod.DEFAULT_LOD_RATIO, **compress_options):
+    """Export temporal data for Unity import as a memory-mappable .tvrk file
+    
+    compress=True stores vertices/normals quantized, octahedral-encoded and
+    delta-packed (see temporal_compress for the options). frames overrides
+    the keyframe times, e.g. to capture every frame of a modifier animation.
+    adjacency=True adds the CSR vertex neighbours ('adjacency_offsets' /
+    'adjacency_indices') so the runtime can skip BuildVertexGroups.
+    spatial_index=True adds a flattened BVH over the rest pose (bvh_*
+    sections, see temporal_spatial) so brush queries only visit nearby vertices.
+    lod_levels=2..4 adds decimated copies of every keyframe that share one
+    topology per level (lod{i}_* sections, see temporal_lod).
+    """
     if obj_name not in bpy.data.objects:
         return None
         
     obj = bpy.data.objects[obj_name]
+    temporal_range = obj.get('temporal_range', [0, 100])
+    
+    # Gather keyframe channels as contiguous float32 arrays
+    times = _keyframe_times(obj) if frames is None else np.asarray(frames, dtype=np.float32)
+    render = bpy.context.scene.render
+    sections = {'time': times.astype(np.float32),
+                'fps': np.array([render.fps / render.fps_base], dtype=np.float32)}
+    sections.update(_sample_transform_channels(obj, times))
+    
+    if include_mesh and obj.type == 'MESH' and len(times):
+        vertices, normals = capture_mesh_frames(obj, times)
+        sections['vertices'] = vertices
+        sections['normals'] = normals
     
-    # Prepare temporal data for export
+    vertex_count = sections['vertices'].shape[1] if 'vertices' in sections else 0
+    
+    # Topology is fixed across keyframes, so one evaluation covers them all
+    if vertex_count and (adjacency or lod_levels):
+        edges, triangles = _evaluated_topology(obj)
+    if vertex_count and adjacency:
+        offsets, indices = temporal_fields.vertex_adjacency(vertex_count, edges, triangles)
+        sections['adjacency_offsets'] = offsets
+        sections['adjacency_indices'] = indices
+    
+    # Brushes and LODs work on the undeformed mesh; fall back to the first keyframe
+    if vertex_count and (spatial_index or lod_levels):
+        if vertex_count == len(obj.data.vertices):
+            rest_pose = temporal_fields.read_vertex_positions(obj.data)
+        else:
+            rest_pose = sections['vertices'][0]
+    if vertex_count and spatial_index:
+        sections.update(temporal_spatial.build_spatial_sections(rest_pose))
+    
+    # Baked per-vertex time fields, aligned with the keyframe vertex order
+    if vertex_count and vertex_count == len(obj.data.vertices):
+        for section, attribute in (('vertex_times', temporal_fields.TIME_FIELD_ATTRIBUTE),
+                                   ('time_velocities', 'temporal_velocity')):
+            values = temporal_fields.read_point_attribute(obj.data, attribute)
+            if values is not None:
+                sections[section] = values
+    
+    if vertex_count and lod_levels:
+        sections.update(temporal_lod.build_lod_sections(
+            rest_pose, triangles, sections['vertices'], sections['normals'],
+            levels=lod_levels, ratio=lod_ratio, vertex_times=sections.get('vertex_times')))
+    
+    flags = 0
+    if compress:
+        sections = temporal_compress.compress_sections(sections, **compress_options)
+        flags |= temporal_format.FLAG_COMPRESSED
+    
+    bytes_written = temporal_format.write_temporal_file(
+        filepath, obj_name, tuple(temporal_range), sections,
+        flags=flags, vertex_count=vertex_count)
+    
+    # Summary of what was written
     temporal_data = {
         'object_name': obj_name,
-        'temporal_range': obj.get('temporal_range', [0, 100]),
-        'keyframes': []
+        'temporal_range': list(temporal_range),
+        'keyframe_count': len(times),
+        'vertex_count': vertex_count,
+        'filepath': filepath,
+        'bytes_written': bytes_written
     }
     
-    # Extract keyframe data
-    # This will be expanded for Unity integration
-    
-    print(f"📤 Temporal data ready for export: {filepath}")
+    print(f"📤 Temporal data exported: {filepath} "
+          f"({len(times)} keyframes, {bytes_written / 1024:.1f} KB)")
     return temporal_data
 
+@timed()
+def export_temporal_data_parallel(obj_name: str, filepath: str, frames=None, workers: int = None,
+                                  blender_path: str = None, timeout: float = None):
+    """Capture many frames across background Blender processes and merge them
+    
+    The current file is saved to a temporary copy and the frames are split
+    into contiguous ranges, each exported by its own worker (see
+    temporal_capture). The parts are streamed into one .tvrk file.
+    Simulations must be baked first, since each worker starts evaluating
+    mid-range, and the vertex count must stay fixed across the range.
+    """
+    if obj_name not in bpy.data.objects:
+        return None
+        
+    obj = bpy.data.objects[obj_name]
+    temporal_range = obj.get('temporal_range', [0, 100])
+    if frames is None:
+        frames = range(int(temporal_range[0]), int(temporal_range[1]) + 1)
+    frames = np.asarray(frames, dtype=np.float32)
+    
+    work_dir = tempfile.mkdtemp(prefix="temporal_capture_")
+    try:
+        blend_file = os.path.join(work_dir, "capture.blend")
+        bpy.ops.wm.save_as_mainfile(filepath=blend_file, copy=True)
+        info = temporal_capture.capture_frames(
+            blender_path or bpy.app.binary_path, blend_file, obj_name, frames, filepath,
+            parts=workers or os.cpu_count() or 1, timeout=timeout, work_dir=work_dir)
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+        
+    print(f"📤 Temporal data captured in parallel: {filepath} ({info['keyframe_count']} frames, "
+          f"{info['parts']} workers, {info['seconds']:.1f}s, {info['bytes_written'] / 1024:.1f} KB)")
+    return {
+        'object_name': obj_name,
+        'temporal_range': list(temporal_range),
+        'keyframe_count': info['keyframe_count'],
+        'workers': info['parts'],
+        'filepath': filepath,
+        'bytes_written': info['bytes_written'],
+        'seconds': info['seconds']
+    }
+
+@timed()
+def export_temporal_stream(obj_name: str, filepath: str, frames=None,
+                           chunk_size: int = 64, include_mesh: bool = True):
+    """Export per-frame temporal states as a chunked .tvrs stream with bounded memory"""
+    if obj_name not in bpy.data.objects:
+        return None
+        
+    obj = bpy.data.objects[obj_name]
+    temporal_range = obj.get('temporal_range', [0, 100])
+    if frames is None:
+        frames = range(int(temporal_range[0]), int(temporal_range[1]) + 1)
+    
+    # Each chunk hits the disk as soon as it fills, so readers can start early
+    writer = temporal_format.TemporalStreamWriter(
+        filepath, obj_name, tuple(temporal_range), chunk_size=chunk_size)
+    with writer:
+        for state in iter_evaluated_states(obj, frames, include_mesh):
+            writer.write_keyframe(*state)
+    
+    print(f"📤 Temporal stream exported: {filepath} "
+          f"({writer.keyframe_count} keyframes in {len(writer.index)} chunks)")
+    return {
+        'object_name': obj_name,
+        'temporal_range': list(temporal_range),
+        'keyframe_count': writer.keyframe_count,
+        'chunk_count': len(writer.index),
+        'filepath': filepath
+    }
+
+@timed()
+def export_vertex_animation_texture(obj_name: str, directory: str, frames=None,
+                                    precision: str = 'half', encoding: str = None,
+                                    max_size: int = temporal_vat.DEFAULT_MAX_SIZE):
+    """Capture evaluated frames and write position/normal VATs plus a descriptor
+    
+    frames defaults to every frame of the temporal range so the shader can
+    step rows at a fixed rate; see temporal_vat for the texture layout.
+    """
+    if obj_name not in bpy.data.objects:
+        return None
+        
+    obj = bpy.data.objects[obj_name]
+    if obj.type != 'MESH':
+        raise ValueError(f"Object '{obj_name}' has no mesh to bake")
+    temporal_range = obj.get('temporal_range', [0, 100])
+    if frames is None:
+        frames = range(int(temporal_range[0]), int(temporal_range[1]) + 1)
+    times = np.asarray(list(frames), dtype=np.float32)
+    
+    vertices, normals = capture_mesh_frames(obj, times)
+    vat = temporal_vat.bake_vat(vertices, normals, times, precision=precision,
+                                encoding=encoding, max_size=max_size)
+    descriptor = temporal_vat.write_vat(directory, obj_name, vat, object_name=obj_name,
+                                        temporal_range=list(temporal_range))
+    
+    print(f"📤 VAT exported: {directory} ({descriptor['frame_count']} frames, "
+          f"{descriptor['width']}x{descriptor['height']} {descriptor['format']})")
+    return descriptor
+
+@timed()
+def export_shape_key_morphs(obj_name: str, filepath: str, threshold: float = 1e-6):
+    """Export temporal shape keys as a base mesh plus sparse per-key offsets"""
+    if obj_name not in bpy.data.objects:
+        return None
+        
+    obj = bpy.data.objects[obj_name]
+    key = obj.data.shape_keys if obj.type == 'MESH' else None
+    if key is None or "temporal_times" not in key:
+        print(f"⚠️ {obj_name} has no temporal shape keys")
+        return None
+        
+    temporal_range = obj.get('temporal_range', [0, 100])
+    ordered = sorted(key["temporal_times"].items(), key=lambda item: item[1])
+    vertex_count = len(obj.data.vertices)
+    
+    def read_block(block):
+        co = np.empty(vertex_count * 3, dtype=np.float32)
+        block.data.foreach_get("co", co)
+        normals = np.array(block.normals_vertex_get(), dtype=np.float32)
+        return co.reshape(-1, 3), normals.reshape(-1, 3)
+        
+    base_vertices, base_normals = read_block(key.reference_key)
+    targets = np.empty((len(ordered), vertex_count, 3), dtype=np.float32)
+    target_normals = np.empty_like(targets)
+    for i, (name, _) in enumerate(ordered):
+        targets[i], target_normals[i] = read_block(key.key_blocks[name])
+        
+    times = np.array([t for _, t in ordered], dtype=np.float32)
+    sections = {'time': times}
+    sections.update(_sample_transform_channels(obj, times))
+    sections.update(temporal_morph.morph_sections(
+        base_vertices, targets, base_normals, target_normals, threshold))
+    
+    bytes_written = temporal_format.write_temporal_file(
+        filepath, obj_name, tuple(temporal_range), sections, vertex_count=vertex_count)
+    density = temporal_morph.morph_density(sections)
+    
+    print(f"📤 Sparse morphs exported: {filepath} ({len(times)} states, "
+          f"{density * 100:.1f}% of vertices stored, {bytes_written / 1024:.1f} KB)")
+    return {
+        'object_name': obj_name,
+        'morph_count': len(times),
+        'vertex_count': vertex_count,
+        'density': density,
+        'filepath': filepath,
+        'bytes_written': bytes_written
+    }
+
+# Live link: push temporal changes to Unity over localhost TCP
+_live_link = None
+_live_link_dirty = set()
+_live_link_interval = 0.1
+
+def mark_live_link_dirty(obj_name: str):
+    """Queue an object for the next live link push (no-op when the link is off)"""
+    if _live_link is not None:
+        _live_link_dirty.add(obj_name)
+
+def _live_link_sections(obj) -> Dict[str, np.ndarray]:
+    """Keyframe channels plus the evaluated mesh at the current frame"""
+    times = _keyframe_times(obj)
+    render = bpy.context.scene.render
+    sections = {'time': times.astype(np.float32),
+                'fps': np.array([render.fps / render.fps_base], dtype=np.float32)}
+    sections.update(_sample_transform_channels(obj, times))
+    sections['frame'] = np.array([bpy.context.scene.frame_current], dtype=np.float32)
+    
+    if obj.type == 'MESH':
+        obj_eval = obj.evaluated_get(bpy.context.evaluated_depsgraph_get())
+        mesh = obj_eval.to_mesh()
+        try:
+            sections['vertices'] = temporal_fields.read_vertex_positions(mesh)
+            normals = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+            mesh.vertex_normals.foreach_get("vector", normals)
+            sections['normals'] = normals.reshape(-1, 3)
+        finally:
+            obj_eval.to_mesh_clear()
+    return sections
+
+def _live_link_tick():
+    """Timer callback on the main thread: gather dirty objects and publish deltas"""
+    if _live_link is None:
+        return None
+    while _live_link_dirty:
+        name = _live_link_dirty.pop()
+        obj = bpy.data.objects.get(name)
+        if obj is None or not obj.get("is_temporal"):
+            _live_link.remove(name)
+        else:
+            _live_link.publish(name, _live_link_sections(obj))
+    return _live_link_interval
+
+def _live_link_depsgraph(scene, depsgraph):
+    """Catch edits made in the UI (sculpting, shape keys, scrubbing)"""
+    for update in depsgraph.updates:
+        if isinstance(update.id, bpy.types.Object) and update.id.get("is_temporal"):
+            mark_live_link_dirty(update.id.original.name)
+
+def start_live_link(host: str = temporal_link.DEFAULT_HOST, port: int = temporal_link.DEFAULT_PORT,
+                    interval: float = 0.1):
+    """Serve temporal objects to Unity (or temporal_link.py) while Blender runs
+    
+    Network I/O runs on a background thread; bpy is only read from a
+    bpy.app.timers callback every `interval` seconds, and only for objects
+    that changed since the last push.
+    """
+    global _live_link, _live_link_interval
+    stop_live_link()
+    _live_link = temporal_link.TemporalLinkServer(host, port).start()
+    _live_link_interval = interval
+    
+    for obj in bpy.data.objects:
+        if obj.get("is_temporal"):
+            _live_link_dirty.add(obj.name)
+    bpy.app.timers.register(_live_link_tick, first_interval=0.0)
+    bpy.app.handlers.depsgraph_update_post.append(_live_link_depsgraph)
+    
+    print(f"🔗 Temporal live link listening on {host}:{_live_link.port}")
+    return _live_link
+
+def stop_live_link():
+    """Shut the live link down and unregister its callbacks"""
+    global _live_link
+    if _live_link_depsgraph in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(_live_link_depsgraph)
+    if bpy.app.timers.is_registered(_live_link_tick):
+        bpy.app.timers.unregister(_live_link_tick)
+    if _live_link is not None:
+        _live_link.stop()
+        print(f"🔗 Temporal live link stopped ({_live_link.bytes_sent / 1024:.1f} KB sent)")
+    _live_link = None
+    _live_link_dirty.clear()
+
+@timed()
+def run_batch_specs(specs: List[Dict], output_dir: str) -> List[Dict]:
+    """Build, bake and export each temporal object spec (headless worker entry)
+    
+    A spec is either procedural ({"name", "phases" or "phase_spec", "quaternion"?}) or points
+    at an existing asset ({"name", "blend_file", "object"}). Optional "export"
+    options are passed to export_temporal_data.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    results = []
+    
+    for spec in specs:
+        start = time.perf_counter()
+        name = spec.get('name', 'TemporalObject')
+        try:
+            if 'blend_file' in spec:
+                if bpy.data.filepath != os.path.abspath(spec['blend_file']):
+                    bpy.ops.wm.open_mainfile(filepath=spec['blend_file'])
+                obj_name = spec.get('object', name)
+                created = None
+            else:
+                temporal_obj = TemporalObject(name)
+                temporal_obj.create_base_object()
+                if 'phase_spec' in spec:
+                    temporal_obj.apply_phase_spec(spec['phase_spec'],
+                                                  quaternion=spec.get('quaternion', False))
+                else:
+                    temporal_obj.apply_temporal_evolution(spec.get('phases'), bulk=True,
+                                                          quaternion=spec.get('quaternion', False))
+                obj_name = temporal_obj.obj.name
+                created = temporal_obj.obj
+                
+            filepath = os.path.join(output_dir, f"{name}.tvrk")
+            info = export_temporal_data(obj_name, filepath, **spec.get('export', {}))
+            if info is None:
+                raise ValueError(f"Object '{obj_name}' not found")
+            results.append({'name': name, 'status': 'ok',
+                            'seconds': time.perf_counter() - start, **info})
+                            
+            # Keep the worker scene small between specs
+            if created is not None:
+                mesh = created.data
+                bpy.data.objects.remove(created)
+                if mesh.users == 0:
+                    bpy.data.meshes.remove(mesh)
+        except Exception as e:
+            print(f"⚠️ Spec '{name}' failed: {e}")
+            results.append({'name': name, 'status': 'error', 'error': str(e),
+                            'seconds': time.perf_counter() - start})
+            
+    return results
+
+def _parse_worker_args(argv: List[str]):
+    """Parse arguments passed after `--` on the Blender command line"""
+    parser = argparse.ArgumentParser(prog="temporal_base.py",
+                                     description="Temporal VR headless batch worker")
+    parser.add_argument("--specs", required=True, help="JSON file with a list of specs")
+    parser.add_argument("--output-dir", required=True, help="Directory for exported files")
+    parser.add_argument("--result", help="Where to write the JSON result list")
+    return parser.parse_args(argv)
+
 # Execute demonstration when script runs
-if __name__ == "__main__":
+if __name__ == "__main__" and "--" in sys.argv:
+    # Headless worker: blender --background --python temporal_base.py -- --specs ...
+    args = _parse_worker_args(sys.argv[sys.argv.index("--") + 1:])
+    with open(args.specs, 'r', encoding='utf-8') as f:
+        batch_specs = json.load(f)
+    batch_results = run_batch_specs(batch_specs, args.output_dir)
+    if args.result:
+        with open(args.result, 'w', encoding='utf-8') as f:
+            json.dump(batch_results, f, indent=2)
+    failed = sum(1 for result in batch_results if result['status'] != 'ok')
+    print(f"✅ Worker finished: {len(batch_results) - failed} ok, {failed} failed")
+elif __name__ == "__main__":
     # Clear existing mesh objects (optional)
     bpy.ops.object.select_all(action='SELECT')
     bpy.ops.object.delete(use_global=False, confirm=False)
@@ -0,0 +1,299 @@
+# temporal_benchmark.py
+# Temporal VR Project - Pipeline benchmarks
+# Times each TemporalObject stage at increasing object/phase/vertex counts
+#
+# Real Blender:  blender --background --factory-startup --python temporal_benchmark.py -- --out bench.json
+# Plain Python:  python temporal_benchmark.py --mock --out bench.json
+#
+# Add --baseline old.json to flag stages that got slower than --threshold
+# times the baseline. Peak memory is the tracemalloc peak (Python and NumPy
+# allocations; Blender's own C allocations are not visible to it).
+
+import argparse
+import json
+import math
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+import numpy as np
+from typing import Dict, List
+
+_SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+if _SCRIPT_DIR not in sys.path:
+    sys.path.append(_SCRIPT_DIR)
+
+STAGES = ('create_base_object', 'apply_temporal_evolution', 'apply_temporal_evolution_bulk',
+          'add_temporal_material', 'create_temporal_visualization',
+          'create_batched_temporal_paths', 'export_temporal_data')
+
+# One axis is scaled at a time from the base case
+BASE_CASE = {'objects': 10, 'phases': 5, 'vertices': 8}
+SCALES = {
+    'objects': (1, 10, 100, 1000),
+    'phases': (5, 50, 500),
+    'vertices': (8, 1024, 16384),
+}
+QUICK_SCALES = {axis: values[:2] for axis, values in SCALES.items()}
+
+DEFAULT_THRESHOLD = 1.25
+# Differences below this are timer noise, never regressions
+MIN_REGRESSION_SECONDS = 0.002
+
+
+def load_pipeline(use_mock: bool = False):
+    """Import temporal_base, installing the bpy stand-in when asked or when bpy is missing"""
+    import bpy_mock
+    if use_mock:
+        bpy_mock.install()
+    else:
+        try:
+            import bpy  # noqa: F401
+        except ImportError:
+            print("⚠️ bpy not available, using bpy_mock")
+            bpy_mock.install()
+    import temporal_base
+    return temporal_base
+
+
+def backend_name() -> str:
+    import bpy
+    import bpy_mock
+    return "mock" if bpy_mock.installed else f"blender {bpy.app.version_string}"
+
+
+def make_phases(count: int) -> List[Dict]:
+    """count phases on a looping path, 4 frames apart"""
+    phases = []
+    for i in range(count):
+        u = i / max(count - 1, 1)
+        angle = 2.0 * math.pi * u
+        phases.append({
+            'time': i * 4,
+            'location': (2.0 * math.sin(angle), 2.0 * math.cos(angle) - 2.0, 3.0 * u),
+            'rotation': (0.5 * angle, 0.0, angle),
+            'scale': (1.0 + 0.5 * math.sin(angle), 1.0, 1.0 + 0.5 * math.cos(angle)),
+        })
+    return phases
+
+
+def make_grid_mesh(name: str, vertex_count: int):
+    """Roughly vertex_count vertices as a quad grid"""
+    import bpy
+    side = max(2, int(math.ceil(math.sqrt(vertex_count))))
+    u, v = np.meshgrid(np.linspace(-1, 1, side), np.linspace(-1, 1, side))
+    vertices = np.column_stack([u.ravel(), v.ravel(), 0.1 * np.sin(4 * u.ravel())])
+    index = np.arange(side * side).reshape(side, side)
+    faces = np.column_stack([index[:-1, :-1].ravel(), index[:-1, 1:].ravel(),
+                             index[1:, 1:].ravel(), index[1:, :-1].ravel()])
+    mesh = bpy.data.meshes.new(name)
+    mesh.from_pydata(vertices.tolist(), [], faces.tolist())
+    mesh.update()
+    return mesh
+
+
+def reset_scene():
+    """Remove every datablock the pipeline creates"""
+    import bpy
+    for collection in (bpy.data.objects, bpy.data.meshes, bpy.data.curves,
+                       bpy.data.materials, bpy.data.node_groups, bpy.data.actions):
+        for item in list(collection):
+            collection.remove(item)
+
+
+class StageTimer:
+    """Measure wall time and tracemalloc peak of one stage"""
+
+    def __init__(self, results: List[Dict], stage: str, case: Dict):
+        self.results = results
+        self.stage = stage
+        self.case = case
+
+    def __enter__(self):
+        self.tracing = tracemalloc.is_tracing()
+        if self.tracing:
+            tracemalloc.reset_peak()
+            self.memory = tracemalloc.get_traced_memory()[0]
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        seconds = time.perf_counter() - self.start
+        peak = tracemalloc.get_traced_memory()[1] - self.memory if self.tracing else None
+        if exc[0] is None:
+            self.results.append({'stage': self.stage, **self.case, 'seconds': seconds,
+                                 'peak_kb': None if peak is None else peak / 1024})
+
+
+def run_case(tb, case: Dict, work_dir: str) -> List[Dict]:
+    """Run every stage once, in pipeline order, on a fresh scene"""
+    reset_scene()
+    results = []
+    phases = make_phases(case['phases'])
+    mesh = None if case['vertices'] <= 8 else make_grid_mesh("BenchGrid", case['vertices'])
+    side = int(math.ceil(math.sqrt(case['objects'])))
+    temporal_objects = [tb.TemporalObject(f"Bench_{i:05d}") for i in range(case['objects'])]
+
+    with StageTimer(results, 'create_base_object', case):
+        for i, temporal_obj in enumerate(temporal_objects):
+            temporal_obj.create_base_object(mesh, location=((i % side) * 4.0, (i // side) * 4.0, 0.0))
+    for temporal_obj in temporal_objects:
+        temporal_obj.obj["temporal_range"] = [0, phases[-1]['time']]
+
+    with StageTimer(results, 'apply_temporal_evolution', case):
+        for temporal_obj in temporal_objects:
+            temporal_obj.apply_temporal_evolution(phases)
+
+    with StageTimer(results, 'apply_temporal_evolution_bulk', case):
+        for temporal_obj in temporal_objects:
+            temporal_obj.apply_temporal_evolution(phases, bulk=True)
+
+    with StageTimer(results, 'add_temporal_material', case):
+        for temporal_obj in temporal_objects:
+            temporal_obj.add_temporal_material()
+
+    with StageTimer(results, 'create_temporal_visualization', case):
+        for temporal_obj in temporal_objects:
+            temporal_obj.create_temporal_visualization()
+
+    with StageTimer(results, 'create_batched_temporal_paths', case):
+        tb.create_batched_temporal_paths(temporal_objects)
+
+    with StageTimer(results, 'export_temporal_data', case):
+        for temporal_obj in temporal_objects:
+            tb.export_temporal_data(temporal_obj.obj.name,
+                                    os.path.join(work_dir, f"{temporal_obj.obj.name}.tvrk"))
+
+    reset_scene()
+    return results
+
+
+def benchmark_cases(scales: Dict) -> List[Dict]:
+    """Base case plus one case per non-base value on each axis"""
+    cases = [dict(BASE_CASE)]
+    for axis, values in scales.items():
+        for value in values:
+            case = {**BASE_CASE, axis: value}
+            if case not in cases:
+                cases.append(case)
+    return cases
+
+
+def _quiet(function, *args):
+    """Run function with the pipeline's per-object status prints suppressed"""
+    stdout = sys.stdout
+    sys.stdout = open(os.devnull, 'w', encoding='utf-8')
+    try:
+        return function(*args)
+    finally:
+        sys.stdout.close()
+        sys.stdout = stdout
+
+
+def run_benchmarks(tb, cases: List[Dict], repeat: int = 3) -> List[Dict]:
+    """Best-of-repeat wall time plus peak memory for every stage and case
+
+    Peak memory comes from one extra traced run, since tracemalloc slows
+    allocation-heavy stages down too much to time them under it.
+    """
+    best: Dict[tuple, Dict] = {}
+    with tempfile.TemporaryDirectory(prefix="temporal_bench_") as work_dir:
+        for case in cases:
+            for _ in range(repeat):
+                for result in _quiet(run_case, tb, case, work_dir):
+                    key = _result_key(result)
+                    if key not in best or result['seconds'] < best[key]['seconds']:
+                        best[key] = result
+
+            tracemalloc.start()
+            try:
+                for result in _quiet(run_case, tb, case, work_dir):
+                    best[_result_key(result)]['peak_kb'] = result['peak_kb']
+            finally:
+                tracemalloc.stop()
+
+            label = ", ".join(f"{axis}={value}" for axis, value in case.items())
+            print(f"⏱️ {label}: " + ", ".join(
+                f"{stage} {best[_result_key({'stage': stage, **case})]['seconds'] * 1000:.1f}ms"
+                for stage in STAGES))
+    return list(best.values())
+
+
+def _result_key(result: Dict) -> tuple:
+    return (result['stage'], result['objects'], result['phases'], result['vertices'])
+
+
+def compare_results(results: List[Dict], baseline: List[Dict],
+                    threshold: float = DEFAULT_THRESHOLD) -> List[Dict]:
+    """Ratio of current to baseline time for every stage/case present in both"""
+    previous = {_result_key(result): result for result in baseline}
+    comparison = []
+    for result in results:
+        old = previous.get(_result_key(result))
+        if old is None:
+            continue
+        ratio = result['seconds'] / max(old['seconds'], 1e-9)
+        regression = (ratio > threshold
+                      and result['seconds'] - old['seconds'] > MIN_REGRESSION_SECONDS)
+        comparison.append({'stage': result['stage'], 'objects': result['objects'],
+                           'phases': result['phases'], 'vertices': result['vertices'],
+                           'baseline_seconds': old['seconds'], 'seconds': result['seconds'],
+                           'ratio': ratio, 'regression': regression})
+    return comparison
+
+
+def _parse_args(argv: List[str]):
+    parser = argparse.ArgumentParser(prog="temporal_benchmark.py",
+                                     description="Temporal VR pipeline benchmarks")
+    parser.add_argument("--out", default="temporal_benchmark.json", help="JSON results file")
+    parser.add_argument("--baseline", help="Earlier results to compare against")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Slowdown ratio reported as a regression")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per case (best is kept)")
+    parser.add_argument("--quick", action="store_true", help="Only the two smallest scales per axis")
+    parser.add_argument("--mock", action="store_true", help="Use bpy_mock even inside Blender")
+    parser.add_argument("--fail-on-regression", action="store_true", help="Exit with status 1 on regressions")
+    return parser.parse_args(argv)
+
+
+def main(argv: List[str]) -> int:
+    args = _parse_args(argv)
+    tb = load_pipeline(args.mock)
+    cases = benchmark_cases(QUICK_SCALES if args.quick else SCALES)
+
+    print(f"🚀 Benchmarking {len(STAGES)} stages x {len(cases)} cases on {backend_name()}")
+    results = run_benchmarks(tb, cases, args.repeat)
+    report = {
+        'created': time.strftime("%Y-%m-%d %H:%M:%S"),
+        'backend': backend_name(),
+        'python': sys.version.split()[0],
+        'numpy': np.__version__,
+        'repeat': args.repeat,
+        'results': results,
+    }
+
+    regressions = []
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        if baseline.get('backend') != report['backend']:
+            print(f"⚠️ Baseline backend '{baseline.get('backend')}' differs from '{report['backend']}'")
+        report['baseline'] = args.baseline
+        report['comparison'] = compare_results(results, baseline['results'], args.threshold)
+        regressions = [row for row in report['comparison'] if row['regression']]
+        for row in regressions:
+            print(f"⚠️ Regression {row['stage']} (objects={row['objects']}, phases={row['phases']}, "
+                  f"vertices={row['vertices']}): {row['baseline_seconds'] * 1000:.1f}ms → "
+                  f"{row['seconds'] * 1000:.1f}ms ({row['ratio']:.2f}x)")
+        print(f"✅ Compared {len(report['comparison'])} measurements: {len(regressions)} regressions")
+
+    with open(args.out, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    print(f"📤 Benchmark results written: {args.out}")
+    return 1 if regressions and args.fail_on_regression else 0
+
+
+if __name__ == "__main__":
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else sys.argv[1:]
+    sys.exit(main(argv))
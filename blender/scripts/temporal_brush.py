@@ -0,0 +1,255 @@
+# temporal_brush.py
+# Temporal VR Project - Headless temporal brush
+# NumPy port of TemporalMeshData.ApplyTemporalBrush for replaying recorded strokes
+#
+# Per brush sample, every vertex within the radius moves toward the target time:
+#   falloff  = (1 - d / radius)^2
+#   influence = strength * falloff
+#   vertexTimes[i] = lerp(vertexTimes[i], targetTime, influence * dt)
+# and then pulls its neighbours along (PropagateTimeChange): each neighbour
+# whose time differs by more than PROPAGATION_THRESHOLD is lerped toward it
+# by influence * 0.5. lerp clamps its factor to [0, 1] like Mathf.Lerp.
+#
+# Without adjacency every sample is one vectorized update over the brushed
+# vertices, matching the C# loop to float precision. With adjacency the
+# propagation cascades through the loop order, so by default (exact=None)
+# those replays walk the vertices in index order like the C# loop. The
+# vectorized propagation (exact=False) pulls neighbours from the post-brush
+# times in one step; it is much faster but can differ from the headset result
+# by tenths of the time range, so it is only for previews.
+# Samples with a non-positive radius touch nothing.
+#
+# Stroke logs are JSON ({"matrix": 4x4 object-to-world, optional,
+# "samples": [{"position", "radius", "strength", "target_time", "dt"}, ...]})
+# or .npz with the same keys as arrays.
+#
+#   python temporal_brush.py export.tvrk strokes.json -o brushed.tvrk
+
+import argparse
+import json
+import numpy as np
+from typing import Dict, List, Optional, Tuple
+
+import temporal_format
+import temporal_spatial
+
+try:
+    from scipy.spatial import cKDTree
+except ImportError:
+    cKDTree = None
+
+PROPAGATION_THRESHOLD = 0.1
+PROPAGATION_FACTOR = 0.5
+DEFAULT_DT = 1.0 / 90.0
+# Samples whose neighbour queries are batched together
+QUERY_BATCH = 1024
+
+
+def _lerp(a, b, t):
+    """Mathf.Lerp: factor clamped to [0, 1]"""
+    return a + (b - a) * np.clip(t, 0.0, 1.0)
+
+
+def brush_influence(positions: np.ndarray, candidates: np.ndarray, center, radius: float,
+                    strength: float) -> Tuple[np.ndarray, np.ndarray]:
+    """Vertices of candidates inside the brush and their strength * (1 - d/r)^2"""
+    candidates = np.asarray(candidates, dtype=np.int64)
+    offsets = positions[candidates] - np.asarray(center, dtype=np.float32)
+    distance = np.sqrt(np.einsum('ij,ij->i', offsets, offsets))
+    inside = distance <= radius
+    falloff = (1.0 - distance[inside] / radius) ** 2
+    return candidates[inside], (strength * falloff).astype(np.float32)
+
+
+def propagate(vertex_times: np.ndarray, sources: np.ndarray, influence: np.ndarray,
+              adjacency: Tuple[np.ndarray, np.ndarray]):
+    """Vectorized PropagateTimeChange for many source vertices at once
+
+    A neighbour reached from several sources is blended toward their
+    influence-weighted mean time; with a single source this is exactly
+    lerp(neighbour, source, influence).
+    """
+    offsets, indices = adjacency
+    counts = offsets[sources + 1] - offsets[sources]
+    total = int(counts.sum())
+    if total == 0:
+        return
+    starts = np.repeat(offsets[sources] - (np.cumsum(counts) - counts), counts)
+    neighbours = indices[starts + np.arange(total)]
+    source = np.repeat(sources, counts)
+    weight = np.clip(np.repeat(influence, counts), 0.0, 1.0)
+
+    source_times = vertex_times[source]
+    moving = np.abs(source_times - vertex_times[neighbours]) > PROPAGATION_THRESHOLD
+    if not np.any(moving):
+        return
+    neighbours, weight, source_times = neighbours[moving], weight[moving], source_times[moving]
+
+    targets, inverse = np.unique(neighbours, return_inverse=True)
+    keep = np.ones(len(targets), dtype=np.float64)
+    np.multiply.at(keep, inverse, 1.0 - weight)
+    weight_sum = np.bincount(inverse, weight, minlength=len(targets))
+    mean = np.bincount(inverse, weight * source_times, minlength=len(targets)) / np.maximum(weight_sum, 1e-12)
+    vertex_times[targets] = vertex_times[targets] * keep + (1.0 - keep) * mean
+
+
+def apply_brush_sample(vertex_times: np.ndarray, positions: np.ndarray, candidates: np.ndarray,
+                       center, radius: float, strength: float, target_time: float,
+                       dt: float = DEFAULT_DT,
+                       adjacency: Optional[Tuple[np.ndarray, np.ndarray]] = None,
+                       exact: Optional[bool] = None) -> int:
+    """Apply one brush sample in place; candidates are the vertex indices near center
+
+    exact defaults to the C# vertex order whenever adjacency is given.
+    Returns the number of vertices inside the brush.
+    """
+    if radius <= 0.0:
+        return 0
+    if exact is None:
+        exact = adjacency is not None
+    brushed, influence = brush_influence(positions, candidates, center, radius, strength)
+    if len(brushed) == 0:
+        return 0
+
+    if not exact:
+        vertex_times[brushed] = _lerp(vertex_times[brushed], target_time, influence * dt)
+        if adjacency is not None:
+            propagate(vertex_times, brushed, influence * PROPAGATION_FACTOR, adjacency)
+        return len(brushed)
+
+    # Same order of reads and writes as the C# loop
+    offsets, indices = adjacency if adjacency is not None else (None, None)
+    for i, value in zip(np.sort(brushed).tolist(), influence[np.argsort(brushed)].tolist()):
+        vertex_times[i] = _lerp(vertex_times[i], target_time, value * dt)
+        if offsets is None:
+            continue
+        for n in indices[offsets[i]:offsets[i + 1]].tolist():
+            if abs(vertex_times[i] - vertex_times[n]) > PROPAGATION_THRESHOLD:
+                vertex_times[n] = _lerp(vertex_times[n], vertex_times[i], value * PROPAGATION_FACTOR)
+    return len(brushed)
+
+
+def load_stroke_log(filepath: str) -> Dict[str, np.ndarray]:
+    """Stroke samples as arrays: position (S, 3), radius, strength, target_time, dt (S,)"""
+    if filepath.lower().endswith('.npz'):
+        with np.load(filepath) as data:
+            log = {key: np.array(data[key]) for key in data.files}
+    else:
+        with open(filepath, 'r', encoding='utf-8') as f:
+            raw = json.load(f)
+        samples = raw['samples'] if isinstance(raw, dict) else raw
+        log = {key: np.array([sample[key] for sample in samples], dtype=np.float32)
+               for key in ('position', 'radius', 'strength', 'target_time')}
+        log['dt'] = np.array([sample.get('dt', DEFAULT_DT) for sample in samples], dtype=np.float32)
+        if isinstance(raw, dict) and 'matrix' in raw:
+            log['matrix'] = np.array(raw['matrix'], dtype=np.float32)
+
+    count = len(log['position'])
+    for key in ('radius', 'strength', 'target_time', 'dt'):
+        if key not in log:
+            if key != 'dt':
+                raise ValueError(f"Stroke log {filepath} has no '{key}'")
+            log[key] = np.full(count, DEFAULT_DT, dtype=np.float32)
+        if len(log[key]) != count:
+            raise ValueError(f"Stroke log {filepath}: '{key}' has {len(log[key])} entries, expected {count}")
+    return log
+
+
+class NeighbourQuery:
+    """Radius queries over fixed positions: scipy cKDTree if present, else VertexBVH"""
+
+    def __init__(self, positions: np.ndarray, bvh: Optional[temporal_spatial.VertexBVH] = None):
+        self.positions = positions
+        if cKDTree is not None:
+            self.tree = cKDTree(positions)
+            self.bvh = None
+        else:
+            self.tree = None
+            self.bvh = bvh or temporal_spatial.VertexBVH.build(positions)
+
+    def query(self, centers: np.ndarray, radii: np.ndarray) -> List[np.ndarray]:
+        """Candidate indices for a batch of brush samples"""
+        if self.tree is not None:
+            hits = self.tree.query_ball_point(centers, radii, return_sorted=True)
+            return [np.asarray(hit, dtype=np.int64) for hit in hits]
+        return [self.bvh.query_radius(self.positions, center, radius)
+                for center, radius in zip(centers, radii)]
+
+
+def replay_stroke_log(vertex_times: np.ndarray, positions: np.ndarray, log: Dict[str, np.ndarray],
+                      adjacency: Optional[Tuple[np.ndarray, np.ndarray]] = None,
+                      bvh: Optional[temporal_spatial.VertexBVH] = None,
+                      exact: Optional[bool] = None) -> np.ndarray:
+    """Replay every recorded sample and return the new per-vertex times
+
+    positions are the rest pose in object space; a 'matrix' entry in the
+    log (object → world, as in TransformPoint) moves them to world space
+    first. A prebuilt bvh is only used when no matrix is given.
+    """
+    vertex_times = np.array(vertex_times, dtype=np.float32)
+    positions = np.asarray(positions, dtype=np.float32)
+    if 'matrix' in log:
+        matrix = np.asarray(log['matrix'], dtype=np.float32)
+        positions = positions @ matrix[:3, :3].T + matrix[:3, 3]
+        bvh = None
+    search = NeighbourQuery(positions, bvh)
+
+    # Neighbour queries are independent of the times, so they run in batches
+    for start in range(0, len(log['position']), QUERY_BATCH):
+        end = start + QUERY_BATCH
+        candidates = search.query(log['position'][start:end], log['radius'][start:end])
+        for j, hits in enumerate(candidates):
+            s = start + j
+            apply_brush_sample(vertex_times, positions, hits, log['position'][s],
+                               float(log['radius'][s]), float(log['strength'][s]),
+                               float(log['target_time'][s]), float(log['dt'][s]), adjacency, exact)
+    return vertex_times
+
+
+def _rest_pose(temporal_file) -> np.ndarray:
+    """Rest-pose positions of an exported .tvrk (plain, sparse-morph or compressed)"""
+    if 'base_vertices' in temporal_file:
+        return np.asarray(temporal_file['base_vertices'])
+    if 'vertices' in temporal_file:
+        return np.asarray(temporal_file['vertices'][0])
+    import temporal_compress
+    return temporal_compress.decode_vertex_keyframes(temporal_file.sections)[0][0]
+
+
+def rebake_vertex_times(source: str, stroke_log: str, destination: str,
+                        exact: Optional[bool] = None) -> np.ndarray:
+    """Replay a stroke log onto an exported file and write a copy with new vertex_times"""
+    log = load_stroke_log(stroke_log)
+    with temporal_format.read_temporal_file(source) as src:
+        positions = _rest_pose(src)
+        times = src.get('vertex_times')
+        times = np.zeros(len(positions), np.float32) if times is None else np.array(times)
+        adjacency = None
+        if 'adjacency_offsets' in src:
+            adjacency = (np.array(src['adjacency_offsets']), np.array(src['adjacency_indices']))
+        bvh = temporal_spatial.VertexBVH.from_sections(src) if 'bvh_nodes' in src else None
+
+        new_times = replay_stroke_log(times, positions, log, adjacency, bvh, exact)
+        sections = dict(src.sections)
+        sections['vertex_times'] = new_times
+        temporal_format.write_temporal_file(destination, src.object_name, src.temporal_range,
+                                            sections, flags=src.flags, vertex_count=src.vertex_count)
+    return new_times
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay temporal brush strokes onto an export")
+    parser.add_argument("source", help=".tvrk export (rest pose, adjacency, vertex_times)")
+    parser.add_argument("strokes", help="Stroke log (.json or .npz)")
+    parser.add_argument("-o", "--output", required=True, help="Where to write the re-baked .tvrk")
+    parser.add_argument("--fast", action="store_true",
+                        help="Vectorized propagation (preview only, not C#-exact)")
+    args = parser.parse_args()
+
+    times = rebake_vertex_times(args.source, args.strokes, args.output, False if args.fast else None)
+    print(f"📤 Vertex times re-baked: {args.output} ({int(np.count_nonzero(times))} vertices touched, "
+          f"range {times.min():.3f}..{times.max():.3f})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+# temporal_cache.py
+# Temporal VR Project - Evaluated state cache
+# Bounded LRU of (object, time) → transforms, plus byte-budgeted vertex arrays
+#
+# Transforms are tiny, so they are bounded by entry count. Vertex/normal
+# arrays are bounded by total bytes: inserting past the budget evicts the
+# least recently used arrays first, and an array larger than the whole
+# budget is simply not cached.
+
+from collections import OrderedDict
+from typing import Dict, Hashable, Optional, Tuple
+import numpy as np
+
+DEFAULT_MAX_STATES = 4096
+DEFAULT_MAX_VERTEX_BYTES = 256 * 1024 * 1024
+# Times closer than this share a cache entry
+TIME_RESOLUTION = 1e-4
+
+
+def time_key(t: float) -> float:
+    """Cache key for a time, folding float noise from frame/subframe math"""
+    return round(float(t) / TIME_RESOLUTION) * TIME_RESOLUTION
+
+
+class TemporalStateCache:
+    """LRU cache of evaluated temporal states shared by many objects"""
+
+    def __init__(self, max_states: int = DEFAULT_MAX_STATES,
+                 max_vertex_bytes: int = DEFAULT_MAX_VERTEX_BYTES):
+        self.max_states = max_states
+        self.max_vertex_bytes = max_vertex_bytes
+        self._states: "OrderedDict[Tuple[Hashable, float], Dict]" = OrderedDict()
+        self._meshes: "OrderedDict[Tuple[Hashable, float], Tuple[np.ndarray, ...]]" = OrderedDict()
+        self._owners: Dict[Hashable, set] = {}
+        self.vertex_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._states)
+
+    def _track(self, key):
+        self._owners.setdefault(key[0], set()).add(key)
+
+    def _untrack(self, key):
+        keys = self._owners.get(key[0])
+        if keys is not None and key not in self._states and key not in self._meshes:
+            keys.discard(key)
+            if not keys:
+                del self._owners[key[0]]
+
+    def get_state(self, owner: Hashable, t: float) -> Optional[Dict]:
+        key = (owner, time_key(t))
+        state = self._states.get(key)
+        if state is None:
+            self.misses += 1
+            return None
+        self._states.move_to_end(key)
+        self.hits += 1
+        return state
+
+    def put_state(self, owner: Hashable, t: float, state: Dict):
+        key = (owner, time_key(t))
+        self._states[key] = state
+        self._states.move_to_end(key)
+        self._track(key)
+        while len(self._states) > self.max_states:
+            old, _ = self._states.popitem(last=False)
+            self.evictions += 1
+            self._untrack(old)
+
+    def get_mesh(self, owner: Hashable, t: float) -> Optional[Tuple[np.ndarray, ...]]:
+        key = (owner, time_key(t))
+        arrays = self._meshes.get(key)
+        if arrays is None:
+            self.misses += 1
+            return None
+        self._meshes.move_to_end(key)
+        self.hits += 1
+        return arrays
+
+    def put_mesh(self, owner: Hashable, t: float, *arrays: np.ndarray) -> bool:
+        """Cache vertex arrays (stored read-only); False if they exceed the budget"""
+        size = sum(array.nbytes for array in arrays)
+        if size > self.max_vertex_bytes:
+            return False
+        key = (owner, time_key(t))
+        self._drop_mesh(key)
+        while self._meshes and self.vertex_bytes + size > self.max_vertex_bytes:
+            old = next(iter(self._meshes))
+            self._drop_mesh(old)
+            self.evictions += 1
+        for array in arrays:
+            array.flags.writeable = False
+        self._meshes[key] = arrays
+        self.vertex_bytes += size
+        self._track(key)
+        return True
+
+    def _drop_mesh(self, key):
+        arrays = self._meshes.pop(key, None)
+        if arrays is not None:
+            self.vertex_bytes -= sum(array.nbytes for array in arrays)
+            self._untrack(key)
+
+    def invalidate(self, owner: Optional[Hashable] = None):
+        """Forget one owner's states (or everything)"""
+        if owner is None:
+            self._states.clear()
+            self._meshes.clear()
+            self._owners.clear()
+            self.vertex_bytes = 0
+            return
+        for key in self._owners.pop(owner, ()):
+            self._states.pop(key, None)
+            arrays = self._meshes.pop(key, None)
+            if arrays is not None:
+                self.vertex_bytes -= sum(array.nbytes for array in arrays)
+
+    def stats(self) -> Dict:
+        return {'states': len(self._states), 'meshes': len(self._meshes),
+                'vertex_mb': self.vertex_bytes / (1024 * 1024), 'hits': self.hits,
+                'misses': self.misses, 'evictions': self.evictions}
@@ -0,0 +1,165 @@
+# temporal_capture.py
+# Temporal VR Project - Parallel frame capture across background Blender processes
+# Shared by export_temporal_data_parallel (inside Blender) and
+# TemporalBatchRunner.capture (automation); needs no bpy itself.
+#
+# The frames are split into contiguous ranges and each range is exported by
+# one worker:
+#   blender --background --factory-startup file.blend --python temporal_base.py -- --specs ...
+# Only the first part computes the static topology sections (adjacency, BVH);
+# the others export keyframes only and the merge takes the static sections
+# from the first part. Worker output goes to a log file per part, so a chatty
+# worker can never stall on a full pipe.
+
+import json
+import os
+import shutil
+import subprocess
+import tempfile
+import time
+import numpy as np
+from typing import Dict, List, Optional
+
+import temporal_format
+
+WORKER_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "temporal_base.py")
+# Export options of every part after the first
+KEYFRAME_ONLY_EXPORT = {'adjacency': False, 'spatial_index': False}
+# Characters of a failed worker's log quoted in the error
+LOG_TAIL = 500
+
+
+def split_frames(frames, parts: int) -> List[List[float]]:
+    """Contiguous, non-empty frame ranges, at most parts of them"""
+    frames = np.asarray(list(frames), dtype=np.float64)
+    if len(frames) == 0:
+        raise ValueError("No frames to capture")
+    parts = max(1, min(parts, len(frames)))
+    return [chunk.tolist() for chunk in np.array_split(frames, parts)]
+
+
+def _log_tail(path: str) -> str:
+    """Last LOG_TAIL characters of a worker log"""
+    if not os.path.exists(path):
+        return ""
+    with open(path, 'r', encoding='utf-8', errors='replace') as f:
+        return f.read()[-LOG_TAIL:].strip()
+
+
+def _part_error(work_dir: str, name: str, returncode: int) -> Optional[str]:
+    """Why a finished worker produced no usable part, or None"""
+    result_file = os.path.join(work_dir, f"{name}_result.json")
+    if os.path.exists(result_file):
+        with open(result_file, 'r', encoding='utf-8') as f:
+            results = json.load(f)
+        failed = [r for r in results if r.get('status') != 'ok']
+        if failed:
+            return failed[0].get('error')
+    if returncode == 0 and os.path.exists(os.path.join(work_dir, f"{name}.tvrk")):
+        return None
+    return _log_tail(os.path.join(work_dir, f"{name}.log")) or f"exit code {returncode}"
+
+
+def run_capture_workers(blender_path: str, blend_file: str, obj_name: str, chunks: List[List[float]],
+                        work_dir: str, timeout: float = None, profile_dir: str = None) -> List[str]:
+    """Export each frame chunk in its own worker; returns the part files in frame order
+
+    All workers run at once and share one timeout. Any worker still running
+    when this returns or raises (failed launch, timeout) is killed.
+    """
+    processes, logs = [], []
+    if profile_dir:
+        os.makedirs(profile_dir, exist_ok=True)
+    try:
+        for i, chunk in enumerate(chunks):
+            name = f"part_{i:03d}"
+            export = {'frames': chunk, 'lod_levels': 0}
+            if i:
+                export.update(KEYFRAME_ONLY_EXPORT)
+            spec_file = os.path.join(work_dir, f"{name}_specs.json")
+            with open(spec_file, 'w', encoding='utf-8') as f:
+                json.dump([{'name': name, 'blend_file': blend_file, 'object': obj_name,
+                            'export': export}], f, ensure_ascii=False)
+
+            env = None
+            if profile_dir:
+                env = dict(os.environ, TEMPORAL_PROFILE="1",
+                           TEMPORAL_PROFILE_OUT=os.path.join(os.path.abspath(profile_dir), f"{name}.json"))
+            command = [blender_path, "--background", "--factory-startup", blend_file,
+                       "--python", WORKER_SCRIPT, "--",
+                       "--specs", spec_file, "--output-dir", work_dir,
+                       "--result", os.path.join(work_dir, f"{name}_result.json")]
+            logs.append(open(os.path.join(work_dir, f"{name}.log"), 'wb'))
+            try:
+                processes.append(subprocess.Popen(command, stdout=logs[-1], stderr=subprocess.STDOUT,
+                                                  env=env))
+            except OSError as e:
+                raise RuntimeError(f"Could not start Blender ({blender_path}): {e}") from e
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        errors = []
+        for i, process in enumerate(processes):
+            try:
+                process.wait(None if deadline is None else max(0.0, deadline - time.monotonic()))
+            except subprocess.TimeoutExpired:
+                raise RuntimeError(f"Parallel capture timed out after {timeout}s (part {i})")
+            error = _part_error(work_dir, f"part_{i:03d}", process.returncode)
+            if error:
+                errors.append(f"part {i} (frames {chunks[i][0]:g}-{chunks[i][-1]:g}): {error}")
+        if errors:
+            raise RuntimeError("Parallel capture failed: " + "; ".join(errors))
+    finally:
+        for process in processes:
+            if process.poll() is None:
+                process.kill()
+                process.wait()
+        for log in logs:
+            log.close()
+
+    return [os.path.join(work_dir, f"part_{i:03d}.tvrk") for i in range(len(chunks))]
+
+
+def check_vertex_counts(part_files: List[str], chunks: List[List[float]]):
+    """Raise a readable error when the parts do not share one vertex count"""
+    counts = []
+    for path in part_files:
+        with temporal_format.read_temporal_file(path) as part:
+            counts.append(part.vertex_count)
+    for i, count in enumerate(counts):
+        if count != counts[0]:
+            raise ValueError(
+                f"Vertex count changes between frames {chunks[0][0]:g}-{chunks[0][-1]:g} ({counts[0]}) "
+                f"and {chunks[i][0]:g}-{chunks[i][-1]:g} ({count}); topology-changing animations "
+                f"cannot be split across workers, export them with export_temporal_data")
+
+
+def capture_frames(blender_path: str, blend_file: str, obj_name: str, frames, output: str,
+                   parts: int, timeout: float = None, profile_dir: str = None,
+                   work_dir: str = None) -> Dict:
+    """Capture frames of obj_name in blend_file across parts workers into one .tvrk
+
+    work_dir holds the specs, logs and part files; a temporary directory is
+    used (and removed) when it is not given.
+    """
+    chunks = split_frames(frames, parts)
+    start = time.perf_counter()
+    own_dir = work_dir is None
+    if own_dir:
+        work_dir = tempfile.mkdtemp(prefix="temporal_capture_")
+    try:
+        part_files = run_capture_workers(blender_path, os.path.abspath(blend_file), obj_name, chunks,
+                                         work_dir, timeout, profile_dir)
+        check_vertex_counts(part_files, chunks)
+        bytes_written = temporal_format.merge_temporal_files(part_files, output)
+    finally:
+        if own_dir:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    return {
+        'object_name': obj_name,
+        'keyframe_count': sum(len(chunk) for chunk in chunks),
+        'parts': len(chunks),
+        'filepath': output,
+        'bytes_written': bytes_written,
+        'seconds': time.perf_counter() - start
+    }
@@ -0,0 +1,172 @@
+# temporal_compress.py
+# Temporal VR Project - Compressed vertex keyframes for standalone headsets
+# Quantized positions, octahedral normals and zlib-packed keyframe deltas
+#
+# Encoded sections (stored in a regular .tvrk container):
+#   compression      int32   [version, position_bits, normal_bits, delta, K, V]
+#   position_bounds  float32 (2, 3)  per-sequence min / max
+#   vertices_q       uint16  (K, V, 3)  quantized positions        (delta=False)
+#   normals_oct      uint16  (K, V, 2)  octahedral normals         (delta=False)
+#   vertices_qdz     uint8   zlib(byte-shuffled keyframe deltas)   (delta=True)
+#   normals_octdz    uint8   zlib(byte-shuffled keyframe deltas)   (delta=True)
+#
+# Deltas are taken between consecutive keyframes in the quantized integer
+# domain (mod 2^16), so decoding is exact with respect to quantization and
+# errors never accumulate across keyframes.
+
+import os
+import zlib
+import numpy as np
+from typing import Dict, Optional, Tuple
+
+import temporal_format
+
+COMPRESSION_VERSION = 1
+
+
+def quantize(values: np.ndarray, lo: np.ndarray, hi: np.ndarray, bits: int = 16) -> np.ndarray:
+    """Map values in [lo, hi] to unsigned integers with the given bit depth"""
+    levels = (1 << bits) - 1
+    extent = np.where(hi > lo, hi - lo, 1.0)
+    scaled = (np.asarray(values, dtype=np.float64) - lo) / extent * levels
+    return np.clip(np.rint(scaled), 0, levels).astype(np.uint16)
+
+
+def dequantize(quantized: np.ndarray, lo: np.ndarray, hi: np.ndarray, bits: int = 16) -> np.ndarray:
+    """Inverse of quantize"""
+    levels = (1 << bits) - 1
+    extent = np.where(hi > lo, hi - lo, 1.0)
+    return (quantized.astype(np.float32) / levels * extent + lo).astype(np.float32)
+
+
+def octahedral_encode(normals: np.ndarray) -> np.ndarray:
+    """Project unit vectors (..., 3) onto the octahedron; returns (..., 2) in [-1, 1]"""
+    n = np.asarray(normals, dtype=np.float64)
+    n = n / np.maximum(np.sum(np.abs(n), axis=-1, keepdims=True), 1e-12)
+    xy = n[..., :2]
+    sign = np.where(xy >= 0.0, 1.0, -1.0)
+    # Fold the lower hemisphere over the diagonals
+    folded = (1.0 - np.abs(xy[..., ::-1])) * sign
+    return np.where(n[..., 2:3] < 0.0, folded, xy)
+
+
+def octahedral_decode(encoded: np.ndarray) -> np.ndarray:
+    """Inverse of octahedral_encode; returns normalized float32 (..., 3)"""
+    e = np.asarray(encoded, dtype=np.float64)
+    x = e[..., 0]
+    y = e[..., 1]
+    z = 1.0 - np.abs(x) - np.abs(y)
+    t = np.clip(-z, 0.0, None)
+    x = x + np.where(x >= 0.0, -t, t)
+    y = y + np.where(y >= 0.0, -t, t)
+    n = np.stack([x, y, z], axis=-1)
+    return (n / np.linalg.norm(n, axis=-1, keepdims=True)).astype(np.float32)
+
+
+def _pack_deltas(quantized: np.ndarray, level: int) -> np.ndarray:
+    """Keyframe deltas (mod 2^16), byte-shuffled and zlib-compressed"""
+    deltas = quantized.copy()
+    deltas[1:] = quantized[1:] - quantized[:-1]  # uint16 arithmetic wraps
+    # Byte planes compress far better than interleaved little-endian words
+    planes = deltas.reshape(-1).view(np.uint8).reshape(-1, 2).T
+    return np.frombuffer(zlib.compress(planes.tobytes(), level), dtype=np.uint8)
+
+
+def _unpack_deltas(blob: np.ndarray, shape: Tuple[int, ...]) -> np.ndarray:
+    """Inverse of _pack_deltas"""
+    planes = np.frombuffer(zlib.decompress(blob.tobytes()), dtype=np.uint8).reshape(2, -1)
+    deltas = np.ascontiguousarray(planes.T).view(np.uint16).reshape(shape)
+    return np.cumsum(deltas, axis=0, dtype=np.uint16)
+
+
+def encode_vertex_keyframes(vertices: np.ndarray, normals: Optional[np.ndarray] = None,
+                            position_bits: int = 16, normal_bits: int = 16,
+                            delta: bool = True, level: int = 6) -> Dict[str, np.ndarray]:
+    """Compress (K, V, 3) vertex and normal keyframes into encoded sections"""
+    if not (1 <= position_bits <= 16 and 1 <= normal_bits <= 16):
+        raise ValueError("Bit depths must be between 1 and 16")
+    vertices = np.asarray(vertices, dtype=np.float32)
+    keyframes, vertex_count = vertices.shape[:2]
+
+    lo = vertices.reshape(-1, 3).min(axis=0) if vertices.size else np.zeros(3, np.float32)
+    hi = vertices.reshape(-1, 3).max(axis=0) if vertices.size else np.zeros(3, np.float32)
+    vertices_q = quantize(vertices, lo, hi, position_bits)
+
+    sections = {
+        'compression': np.array([COMPRESSION_VERSION, position_bits, normal_bits,
+                                 int(delta), keyframes, vertex_count], dtype=np.int32),
+        'position_bounds': np.stack([lo, hi]).astype(np.float32),
+    }
+    if delta:
+        sections['vertices_qdz'] = _pack_deltas(vertices_q, level)
+    else:
+        sections['vertices_q'] = vertices_q
+
+    if normals is not None:
+        octa = octahedral_encode(normals)
+        normals_q = quantize(octa, -1.0, 1.0, normal_bits)
+        if delta:
+            sections['normals_octdz'] = _pack_deltas(normals_q, level)
+        else:
+            sections['normals_oct'] = normals_q
+
+    return sections
+
+
+def decode_vertex_keyframes(sections) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+    """Decode sections from encode_vertex_keyframes (or a TemporalFile) to float32 arrays"""
+    version, position_bits, normal_bits, delta, keyframes, vertex_count = (
+        int(v) for v in sections['compression'])
+    if version > COMPRESSION_VERSION:
+        raise ValueError(f"Unsupported vertex compression version {version}")
+    lo, hi = sections['position_bounds']
+
+    if delta:
+        vertices_q = _unpack_deltas(sections['vertices_qdz'], (keyframes, vertex_count, 3))
+    else:
+        vertices_q = sections['vertices_q']
+    vertices = dequantize(vertices_q, lo, hi, position_bits)
+
+    normals = None
+    if 'normals_octdz' in sections:
+        normals_q = _unpack_deltas(sections['normals_octdz'], (keyframes, vertex_count, 2))
+    elif 'normals_oct' in sections:
+        normals_q = sections['normals_oct']
+    else:
+        normals_q = None
+    if normals_q is not None:
+        normals = octahedral_decode(dequantize(normals_q, -1.0, 1.0, normal_bits))
+
+    return vertices, normals
+
+
+def compress_sections(sections: Dict[str, np.ndarray], **options) -> Dict[str, np.ndarray]:
+    """Replace raw 'vertices'/'normals' sections with their encoded form"""
+    if 'vertices' not in sections:
+        return dict(sections)
+    compressed = {name: data for name, data in sections.items()
+                  if name not in ('vertices', 'normals')}
+    compressed.update(encode_vertex_keyframes(sections['vertices'],
+                                              sections.get('normals'), **options))
+    return compressed
+
+
+def compress_temporal_file(source: str, destination: str, **options) -> Dict:
+    """Re-encode a .tvrk file with compressed vertex keyframes; returns size stats"""
+    with temporal_format.read_temporal_file(source) as src:
+        sections = compress_sections(src.sections, **options)
+        written = temporal_format.write_temporal_file(
+            destination, src.object_name, src.temporal_range, sections,
+            flags=src.flags | temporal_format.FLAG_COMPRESSED, vertex_count=src.vertex_count)
+    original = os.path.getsize(source)
+    return {'original_bytes': original, 'compressed_bytes': written,
+            'ratio': original / written if written else 1.0}
+
+
+def load_vertex_keyframes(filepath: str) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+    """Read vertex/normal keyframes from a raw or compressed .tvrk file"""
+    with temporal_format.read_temporal_file(filepath) as f:
+        if 'compression' in f:
+            return decode_vertex_keyframes(f.sections)
+        normals = f.get('normals')
+        return np.array(f['vertices']), None if normals is None else np.array(normals)
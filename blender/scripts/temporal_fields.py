@@ -0,0 +1,194 @@
+# temporal_fields.py
+# Temporal VR Project - Per-vertex temporal fields for the temporal brush
+# Precomputes TemporalMeshData.vertexTimes offline so the headset can skip it
+#
+# Mesh helpers only rely on foreach_get, so they accept any Blender mesh
+# (original or evaluated) without importing bpy here.
+
+import heapq
+import numpy as np
+from typing import Optional, Sequence, Tuple
+
+# Point attribute used to store a baked time field on the mesh
+TIME_FIELD_ATTRIBUTE = "temporal_time"
+
+
+def read_vertex_positions(mesh) -> np.ndarray:
+    """(V, 3) float32 vertex coordinates via foreach_get"""
+    positions = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", positions)
+    return positions.reshape(-1, 3)
+
+
+def read_edges(mesh) -> np.ndarray:
+    """(E, 2) int32 edge vertex indices via foreach_get"""
+    edges = np.empty(len(mesh.edges) * 2, dtype=np.int32)
+    mesh.edges.foreach_get("vertices", edges)
+    return edges.reshape(-1, 2)
+
+
+def read_triangles(mesh) -> np.ndarray:
+    """(T, 3) int32 loop triangle vertex indices via foreach_get"""
+    mesh.calc_loop_triangles()
+    triangles = np.empty(len(mesh.loop_triangles) * 3, dtype=np.int32)
+    mesh.loop_triangles.foreach_get("vertices", triangles)
+    return triangles.reshape(-1, 3)
+
+
+def read_point_attribute(mesh, name: str) -> Optional[np.ndarray]:
+    """(V,) float32 values of a FLOAT point attribute, or None if absent"""
+    attribute = mesh.attributes.get(name)
+    if attribute is None or attribute.domain != 'POINT' or attribute.data_type != 'FLOAT':
+        return None
+    values = np.empty(len(mesh.vertices), dtype=np.float32)
+    attribute.data.foreach_get("value", values)
+    return values
+
+
+def write_point_attribute(mesh, name: str, values: np.ndarray):
+    """Store (V,) values as a FLOAT point attribute, replacing any existing one"""
+    attribute = mesh.attributes.get(name)
+    if attribute is not None and (attribute.domain != 'POINT' or attribute.data_type != 'FLOAT'):
+        mesh.attributes.remove(attribute)
+        attribute = None
+    if attribute is None:
+        attribute = mesh.attributes.new(name, 'FLOAT', 'POINT')
+    attribute.data.foreach_set("value", np.ascontiguousarray(values, dtype=np.float32))
+
+
+def vertex_group_field(obj, group_name: str) -> np.ndarray:
+    """(V,) weights of a painted vertex group (0 where unassigned)
+
+    Vertex group weights have no foreach_get accessor, so this walks the
+    vertices once in Python.
+    """
+    group = obj.vertex_groups[group_name]
+    weights = np.zeros(len(obj.data.vertices), dtype=np.float32)
+    for vertex in obj.data.vertices:
+        for element in vertex.groups:
+            if element.group == group.index:
+                weights[vertex.index] = element.weight
+                break
+    return weights
+
+
+def _seed_indices(positions: np.ndarray, seeds) -> np.ndarray:
+    """Vertex indices for seeds given as indices or as (S, 3) points (nearest vertex)"""
+    seeds = np.asarray(seeds)
+    if seeds.ndim == 2 and seeds.shape[1] == 3:
+        return np.array([int(np.argmin(np.sum((positions - p) ** 2, axis=1))) for p in seeds])
+    return seeds.astype(np.int64).reshape(-1)
+
+
+def distance_field(positions: np.ndarray, seeds) -> np.ndarray:
+    """Euclidean distance from every vertex to the closest seed (indices or points)"""
+    positions = np.asarray(positions, dtype=np.float32)
+    seeds = np.asarray(seeds)
+    points = seeds if seeds.ndim == 2 and seeds.shape[1] == 3 else positions[seeds.reshape(-1)]
+    field = np.full(len(positions), np.inf, dtype=np.float32)
+    for point in np.asarray(points, dtype=np.float32):
+        np.minimum(field, np.linalg.norm(positions - point, axis=1), out=field)
+    return field
+
+
+def triangle_edges(triangles: np.ndarray) -> np.ndarray:
+    """(3T, 2) edges of every triangle (shared edges appear more than once)"""
+    triangles = np.asarray(triangles).reshape(-1, 3)
+    return np.concatenate([triangles[:, [0, 1]], triangles[:, [1, 2]], triangles[:, [2, 0]]])
+
+
+def vertex_adjacency(vertex_count: int, edges: Optional[np.ndarray] = None,
+                     triangles: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """CSR vertex neighbours (offsets (V+1,), indices) from edges and/or triangles
+
+    Neighbours of vertex v are indices[offsets[v]:offsets[v + 1]], sorted
+    ascending, without duplicates or self-loops. Replaces the runtime
+    Dictionary<int, List<int>> built by TemporalMeshData.BuildVertexGroups.
+    """
+    pairs = [np.asarray(edges, dtype=np.int64).reshape(-1, 2)] if edges is not None else []
+    if triangles is not None:
+        pairs.append(triangle_edges(np.asarray(triangles, dtype=np.int64)))
+    pairs = np.concatenate(pairs) if pairs else np.zeros((0, 2), dtype=np.int64)
+    pairs = pairs[pairs[:, 0] != pairs[:, 1]]
+
+    # Both directions, then dedupe (source, target) via one sortable key
+    keys = np.concatenate([pairs[:, 0] * vertex_count + pairs[:, 1],
+                           pairs[:, 1] * vertex_count + pairs[:, 0]])
+    keys = np.unique(keys)
+    sources = keys // vertex_count
+    offsets = np.zeros(vertex_count + 1, dtype=np.int32)
+    np.cumsum(np.bincount(sources, minlength=vertex_count), out=offsets[1:])
+    return offsets, (keys % vertex_count).astype(np.int32)
+
+
+def geodesic_field(positions: np.ndarray, edges: np.ndarray, seeds,
+                   adjacency: Optional[Tuple[np.ndarray, np.ndarray]] = None) -> np.ndarray:
+    """Shortest edge-path distance from the seeds (multi-source Dijkstra)
+
+    Vertices not connected to any seed get +inf. A precomputed CSR adjacency
+    (see vertex_adjacency) can be passed instead of recomputing it from edges.
+    """
+    positions = np.asarray(positions, dtype=np.float64)
+    vertex_count = len(positions)
+    offsets, targets = adjacency if adjacency is not None else vertex_adjacency(vertex_count, edges)
+    sources = np.repeat(np.arange(vertex_count), np.diff(offsets))
+    lengths = np.linalg.norm(positions[targets] - positions[sources], axis=1)
+
+    # Plain lists keep the inner loop fast in CPython
+    offsets_l = offsets.tolist()
+    targets_l = targets.tolist()
+    lengths_l = lengths.tolist()
+    distance = [float('inf')] * vertex_count
+    heap = []
+    for seed in _seed_indices(positions, seeds).tolist():
+        distance[seed] = 0.0
+        heap.append((0.0, seed))
+    heapq.heapify(heap)
+
+    while heap:
+        d, v = heapq.heappop(heap)
+        if d > distance[v]:
+            continue
+        for j in range(offsets_l[v], offsets_l[v + 1]):
+            candidate = d + lengths_l[j]
+            u = targets_l[j]
+            if candidate < distance[u]:
+                distance[u] = candidate
+                heapq.heappush(heap, (candidate, u))
+
+    return np.array(distance, dtype=np.float32)
+
+
+def normalize_field(field: np.ndarray, time_range: Tuple[float, float] = (0.0, 1.0),
+                    invert: bool = False) -> np.ndarray:
+    """Rescale a raw field into [min_time, max_time]; unreachable vertices get the max"""
+    field = np.asarray(field, dtype=np.float32)
+    finite = np.isfinite(field)
+    if not np.any(finite):
+        return np.full(len(field), time_range[0], dtype=np.float32)
+    lo = float(field[finite].min())
+    hi = float(field[finite].max())
+    unit = np.where(finite, (field - lo) / (hi - lo) if hi > lo else 0.0, 1.0)
+    if invert:
+        unit = 1.0 - unit
+    return (time_range[0] + unit * (time_range[1] - time_range[0])).astype(np.float32)
+
+
+def compute_time_field(kind: str, positions: np.ndarray, edges: Optional[np.ndarray] = None,
+                       seeds: Sequence = (0,), weights: Optional[np.ndarray] = None,
+                       time_range: Tuple[float, float] = (0.0, 1.0),
+                       invert: bool = False) -> np.ndarray:
+    """Dispatch to a field kind ('distance', 'geodesic' or 'weights') and normalize"""
+    if kind == 'distance':
+        raw = distance_field(positions, seeds)
+    elif kind == 'geodesic':
+        if edges is None:
+            raise ValueError("Geodesic fields need the mesh edges")
+        raw = geodesic_field(positions, edges, seeds)
+    elif kind == 'weights':
+        if weights is None:
+            raise ValueError("Weight fields need per-vertex weights")
+        raw = np.asarray(weights, dtype=np.float32)
+    else:
+        raise ValueError(f"Unknown time field kind '{kind}'")
+    return normalize_field(raw, time_range, invert)
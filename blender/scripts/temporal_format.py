@@ -0,0 +1,609 @@
+# temporal_format.py
+# Temporal VR Project - Binary temporal keyframe formats (.tvrk, streaming .tvrs)
+# Flat, memory-mappable layout shared by the Blender exporter, Python tooling and Unity
+#
+# File layout (all little-endian):
+#   [header]         HEADER_DTYPE, 128 bytes
+#   [section table]  section_count x SECTION_DTYPE, 80 bytes each
+#   [data]           one contiguous C-order array per section, 64-byte aligned
+#
+# Standard sections (K = keyframe count, V = vertex count):
+#   time      float32 (K,)       keyframe time in frames
+#   fps       float32 (1,)       scene frame rate at export (frames → seconds)
+#   location  float32 (K, 3)
+#   rotation  float32 (K, 3)     Euler XYZ, radians
+#   rotation_quat float32 (K, 4) quaternion (w, x, y, z), sign-continuous
+#   scale     float32 (K, 3)
+#   vertices  float32 (K, V, 3)  evaluated mesh per keyframe (TKeyframe.vertices, see below)
+#   normals   float32 (K, V, 3)  per-vertex normals (TKeyframe.normals, see below)
+#   vertex_times     float32 (V,)  optional, TemporalMeshData.vertexTimes
+#   time_velocities  float32 (V,)  optional, TemporalMeshData.timeVelocities
+#   adjacency_offsets int32 (V + 1,)  optional CSR vertex neighbours: the
+#   adjacency_indices int32 (nnz,)    neighbours of v are indices[offsets[v]:offsets[v+1]]
+#   bvh_bounds, bvh_nodes, bvh_indices  optional rest-pose BVH (see temporal_spatial)
+#   lod{i}_vertices, lod{i}_normals, lod{i}_triangles, ...  optional decimated
+#                                  keyframes sharing one topology per LOD (see temporal_lod)
+#
+# Data is stored as Blender has it; a Unity importer has to convert:
+#   - Space: location/rotation/scale are the object's Blender transform and
+#     vertices/normals are in object space, both right-handed Z-up. Unity is
+#     left-handed Y-up: swap Y and Z of positions and normals (and reverse
+#     triangle winding), and convert rotations to match.
+#   - Time: 'time' and the header temporal_range are in Blender frames.
+#     TKeyframe.time is in seconds: divide by the 'fps' section. vertex_times
+#     keep the range the field was baked with (bake_time_field, 0..1 by
+#     default), like TemporalMeshData.vertexTimes.
+#   - Vertex order: V and every per-vertex section follow Blender's vertex
+#     indices. Unity's importer splits vertices along UV and hard-normal seams,
+#     so an imported Mesh usually has more vertices than V and
+#     TKeyframe.ApplyToMesh skips it. Map through a seam-split table (or
+#     import with seams welded) before filling TKeyframe.vertices.
+#
+# Readers look sections up by name, so new sections can be appended without
+# breaking older readers. A C# reader only needs to parse the header and the
+# table, then wrap the byte ranges (e.g. NativeArray over a memory-mapped file).
+
+import numpy as np
+from temporal_quat import euler_to_quat, make_continuous, quat_to_euler
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+MAGIC = b"TVRK"
+VERSION = 1
+ALIGNMENT = 64
+
+# Header flags
+FLAG_HAS_MESH = 1 << 0
+FLAG_COMPRESSED = 1 << 1   # vertices/normals stored encoded (see temporal_compress)
+
+HEADER_DTYPE = np.dtype([
+    ('magic', 'S4'),
+    ('version', '<u2'),
+    ('flags', '<u2'),
+    ('keyframe_count', '<u4'),
+    ('vertex_count', '<u4'),
+    ('section_count', '<u4'),
+    ('table_offset', '<u4'),
+    ('temporal_range', '<f4', (2,)),
+    ('object_name', 'S64'),
+    ('reserved', 'u1', (32,)),
+])
+
+SECTION_DTYPE = np.dtype([
+    ('name', 'S32'),
+    ('dtype', 'S8'),
+    ('ndim', '<u4'),
+    ('flags', '<u4'),
+    ('shape', '<u4', (4,)),
+    ('offset', '<u8'),
+    ('nbytes', '<u8'),
+])
+
+assert HEADER_DTYPE.itemsize == 128
+assert SECTION_DTYPE.itemsize == 80
+
+
+def _align(offset: int, alignment: int = ALIGNMENT) -> int:
+    """Round offset up to the next multiple of alignment"""
+    return (offset + alignment - 1) // alignment * alignment
+
+
+def _as_little_endian(array: np.ndarray) -> np.ndarray:
+    """Return a C-contiguous little-endian view or copy of array"""
+    array = np.asarray(array)
+    if array.dtype.byteorder == '>':
+        array = array.astype(array.dtype.newbyteorder('<'))
+    return np.ascontiguousarray(array)
+
+
+def _build_section_table(arrays: Dict[str, np.ndarray], offset: int) -> Tuple[np.ndarray, int]:
+    """Assign aligned offsets to each array starting at offset; return table and end offset"""
+    table = np.zeros(len(arrays), dtype=SECTION_DTYPE)
+    offset = _align(offset)
+    for entry, (name, data) in zip(table, arrays.items()):
+        if data.ndim > 4:
+            raise ValueError(f"Section '{name}' has {data.ndim} dimensions (max 4)")
+        entry['name'] = name.encode('ascii')
+        entry['dtype'] = data.dtype.str.encode('ascii')
+        entry['ndim'] = data.ndim
+        entry['shape'][:data.ndim] = data.shape
+        entry['offset'] = offset
+        entry['nbytes'] = data.nbytes
+        offset = _align(offset + data.nbytes)
+    return table, offset
+
+
+def _write_section_data(f, table: np.ndarray, arrays: Iterable[np.ndarray]):
+    """Write array payloads at the offsets recorded in table, zero-padding gaps"""
+    for entry, data in zip(table, arrays):
+        f.write(b'\0' * (int(entry['offset']) - f.tell()))
+        f.write(memoryview(data).cast('B') if data.nbytes else b'')
+
+
+def _read_section_table(buffer: np.ndarray, count: int, offset: int) -> Dict[str, np.ndarray]:
+    """Wrap every section listed in the table at offset as a zero-copy array"""
+    table = np.frombuffer(buffer, dtype=SECTION_DTYPE, count=count, offset=offset)
+    sections = {}
+    for entry in table:
+        shape = tuple(int(n) for n in entry['shape'][:entry['ndim']])
+        sections[entry['name'].decode('ascii')] = np.ndarray(
+            shape, dtype=np.dtype(entry['dtype'].decode('ascii')),
+            buffer=buffer, offset=int(entry['offset']))
+    return sections
+
+
+def _make_header(magic: bytes, object_name: str, temporal_range: Tuple[float, float],
+                 keyframe_count: int, vertex_count: int, section_count: int,
+                 flags: int) -> np.ndarray:
+    """Build a filled-in header record"""
+    header = np.zeros(1, dtype=HEADER_DTYPE)
+    header['magic'] = magic
+    header['version'] = VERSION
+    header['flags'] = flags | (FLAG_HAS_MESH if vertex_count else 0)
+    header['keyframe_count'] = keyframe_count
+    header['vertex_count'] = vertex_count
+    header['section_count'] = section_count
+    header['table_offset'] = HEADER_DTYPE.itemsize
+    header['temporal_range'] = temporal_range
+    # Cut on a character boundary so multibyte names still decode
+    name = object_name.encode('utf-8')[:64].decode('utf-8', errors='ignore')
+    header['object_name'] = name.encode('utf-8')
+    return header
+
+
+def _read_header(buffer: np.ndarray, magic: bytes, filepath: str) -> np.void:
+    """Parse and validate the file header"""
+    if len(buffer) < HEADER_DTYPE.itemsize:
+        raise ValueError(f"Truncated temporal file: {filepath}")
+    header = np.frombuffer(buffer, dtype=HEADER_DTYPE, count=1)[0]
+    if header['magic'] != magic:
+        raise ValueError(f"Not a temporal {magic.decode()} file: {filepath}")
+    if header['version'] > VERSION:
+        raise ValueError(f"Unsupported temporal file version {header['version']}")
+    return header
+
+
+def write_temporal_file(filepath: str, object_name: str,
+                        temporal_range: Tuple[float, float],
+                        sections: Dict[str, np.ndarray],
+                        flags: int = 0, vertex_count: Optional[int] = None) -> int:
+    """Write named arrays as a .tvrk file and return the number of bytes written
+    
+    vertex_count defaults to the width of the 'vertices' section; pass it
+    explicitly when vertices are stored in another (e.g. encoded) form.
+    """
+    arrays = {name: _as_little_endian(data) for name, data in sections.items()}
+
+    keyframe_count = len(arrays['time']) if 'time' in arrays else 0
+    if vertex_count is None:
+        vertex_count = arrays['vertices'].shape[1] if 'vertices' in arrays else 0
+    header = _make_header(MAGIC, object_name, temporal_range,
+                          keyframe_count, vertex_count, len(arrays), flags)
+
+    # Lay out data blocks after the section table
+    table, _ = _build_section_table(
+        arrays, HEADER_DTYPE.itemsize + len(arrays) * SECTION_DTYPE.itemsize)
+
+    with open(filepath, 'wb') as f:
+        f.write(header.tobytes())
+        f.write(table.tobytes())
+        _write_section_data(f, table, arrays.values())
+        end = f.tell()
+
+    return end
+
+
+class TemporalFile:
+    """Read-only view of a .tvrk file; section arrays are zero-copy views"""
+
+    def __init__(self, filepath: str, mmap: bool = True):
+        self.filepath = filepath
+        if mmap:
+            self._buffer = np.memmap(filepath, dtype=np.uint8, mode='r')
+        else:
+            self._buffer = np.fromfile(filepath, dtype=np.uint8)
+
+        header = _read_header(self._buffer, MAGIC, filepath)
+        self.version = int(header['version'])
+        self.flags = int(header['flags'])
+        self.keyframe_count = int(header['keyframe_count'])
+        self.vertex_count = int(header['vertex_count'])
+        self.temporal_range = tuple(float(v) for v in header['temporal_range'])
+        self.object_name = header['object_name'].decode('utf-8', errors='ignore')
+        self.sections: Dict[str, np.ndarray] = _read_section_table(
+            self._buffer, int(header['section_count']), int(header['table_offset']))
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.sections
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self.sections[name]
+
+    def get(self, name: str, default: Optional[np.ndarray] = None) -> Optional[np.ndarray]:
+        return self.sections.get(name, default)
+
+    def names(self) -> Iterable[str]:
+        return self.sections.keys()
+
+    def close(self):
+        """Drop references to the mapping; it is released once no views remain"""
+        self.sections = {}
+        self._buffer = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def read_temporal_file(filepath: str, mmap: bool = True) -> TemporalFile:
+    """Open a .tvrk file (memory-mapped by default)"""
+    return TemporalFile(filepath, mmap=mmap)
+
+
+# Sections indexed by keyframe along their first axis
+KEYFRAME_SECTIONS = ('time', 'location', 'rotation', 'rotation_quat', 'scale', 'vertices', 'normals')
+# Per-LOD keyframe sections (lod{i}_vertices, lod{i}_normals)
+LOD_KEYFRAME_SUFFIXES = ('_vertices', '_normals')
+
+
+def is_keyframe_section(name: str) -> bool:
+    """True for sections indexed by keyframe along their first axis"""
+    if name in KEYFRAME_SECTIONS:
+        return True
+    return name.startswith('lod') and name.endswith(LOD_KEYFRAME_SUFFIXES)
+
+
+def merge_temporal_files(filepaths: List[str], filepath: str) -> int:
+    """Concatenate .tvrk files holding consecutive frame ranges into one file
+
+    Keyframe sections (LOD keyframes included) are joined in time order and
+    must be present in every part; every other section (vertex times,
+    adjacency, BVH, ...) is taken from the first part, so later parts may
+    leave them out.
+    Parts are streamed from their memory maps, so the merged vertex data
+    never has to fit in RAM. Compressed parts are rejected, since their
+    encoding depends on each part's bounds: merge raw parts and compress the
+    result (temporal_compress.compress_temporal_file).
+    """
+    parts = [read_temporal_file(path) for path in filepaths]
+    parts.sort(key=lambda part: float(part['time'][0]) if len(part['time']) else 0.0)
+    first = parts[0]
+    for part in parts:
+        if part.flags & FLAG_COMPRESSED or 'compression' in part:
+            raise ValueError(f"Cannot merge {part.filepath}: vertex data is compressed")
+    keyframe_names = [name for name in first.names() if is_keyframe_section(name)]
+    for part in parts[1:]:
+        if part.vertex_count != first.vertex_count:
+            raise ValueError(f"Cannot merge {part.filepath}: {part.vertex_count} vertices, "
+                             f"{first.filepath} has {first.vertex_count}")
+        if [name for name in part.names() if is_keyframe_section(name)] != keyframe_names:
+            raise ValueError(f"Cannot merge {part.filepath}: keyframe sections differ")
+        for name in part.names():
+            if name.startswith('lod') and name.endswith('_clusters') and (
+                    name not in first or not np.array_equal(part[name], first[name])):
+                raise ValueError(f"Cannot merge {part.filepath}: LOD '{name}' differs")
+
+    times = np.concatenate([part['time'] for part in parts])
+    if np.any(np.diff(times) <= 0):
+        raise ValueError("Merged frame ranges overlap or are out of order")
+
+    # Each part made its quaternions continuous on its own; redo it across parts
+    merged = {}
+    if 'rotation_quat' in first:
+        quats = np.concatenate([part['rotation_quat'] for part in parts])
+        merged['rotation_quat'] = make_continuous(quats).astype(quats.dtype)
+
+    # Zero-stride placeholders describe the merged shapes without allocating them
+    layout = {}
+    for name, data in first.sections.items():
+        if is_keyframe_section(name):
+            shape = (sum(len(part[name]) for part in parts),) + data.shape[1:]
+            layout[name] = np.broadcast_to(np.zeros((), dtype=data.dtype), shape)
+        else:
+            layout[name] = data
+
+    header = _make_header(MAGIC, first.object_name, first.temporal_range,
+                          len(times), first.vertex_count, len(layout),
+                          first.flags & ~FLAG_HAS_MESH)
+    table, _ = _build_section_table(
+        layout, HEADER_DTYPE.itemsize + len(layout) * SECTION_DTYPE.itemsize)
+
+    with open(filepath, 'wb') as f:
+        f.write(header.tobytes())
+        f.write(table.tobytes())
+        for entry, name in zip(table, layout):
+            f.write(b'\0' * (int(entry['offset']) - f.tell()))
+            if name in merged:
+                blocks = [merged[name]]
+            elif is_keyframe_section(name):
+                blocks = [part[name] for part in parts]
+            else:
+                blocks = [layout[name]]
+            for block in blocks:
+                if block.nbytes:
+                    f.write(memoryview(np.ascontiguousarray(block)).cast('B'))
+        end = f.tell()
+
+    for part in parts:
+        part.close()
+    return end
+
+
+# ---------------------------------------------------------------------------
+# Streaming variant (.tvrs) for long captures
+#
+#   [header]   HEADER_DTYPE with magic TVRS; counts are patched on close
+#   [chunk]*   CHUNK_DTYPE + section table + data, holding <= chunk_size keyframes
+#   [index]    chunk_count x CHUNK_INDEX_DTYPE
+#   [trailer]  TRAILER_DTYPE, always the last 16 bytes of a finished file
+#
+# Every chunk records its own size, so a reader can follow chunks from the
+# start while the writer is still running (reopen to pick up new chunks) and
+# use the index once it exists.
+# ---------------------------------------------------------------------------
+
+STREAM_MAGIC = b"TVRS"
+CHUNK_MAGIC = b"CHNK"
+TRAILER_MAGIC = b"TVRE"
+
+CHUNK_DTYPE = np.dtype([
+    ('magic', 'S4'),
+    ('keyframe_count', '<u4'),
+    ('section_count', '<u4'),
+    ('reserved', '<u4'),
+    ('time_range', '<f4', (2,)),
+    ('nbytes', '<u8'),
+])
+
+CHUNK_INDEX_DTYPE = np.dtype([
+    ('offset', '<u8'),
+    ('keyframe_count', '<u4'),
+    ('first_keyframe', '<u4'),
+    ('time_range', '<f4', (2,)),
+])
+
+TRAILER_DTYPE = np.dtype([
+    ('index_offset', '<u8'),
+    ('chunk_count', '<u4'),
+    ('magic', 'S4'),
+])
+
+
+class TemporalStreamWriter:
+    """Write keyframes one at a time into fixed-size chunks with bounded memory"""
+
+    def __init__(self, filepath: str, object_name: str,
+                 temporal_range: Tuple[float, float], chunk_size: int = 64):
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        self.filepath = filepath
+        self.object_name = object_name
+        self.temporal_range = temporal_range
+        self.chunk_size = chunk_size
+        self.keyframe_count = 0
+        self.vertex_count = 0
+        self.index: List[Tuple[int, int, int, float, float]] = []
+
+        self._buffers: Optional[Dict[str, np.ndarray]] = None
+        self._fill = 0
+        self._last_quat: Optional[np.ndarray] = None
+        self._file = open(filepath, 'wb')
+        self._file.write(_make_header(STREAM_MAGIC, object_name, temporal_range,
+                                      0, 0, 0, 0).tobytes())
+        self._file.flush()
+
+    def _allocate(self, vertices: Optional[np.ndarray]):
+        """Allocate per-chunk staging buffers on the first keyframe"""
+        n = self.chunk_size
+        self._buffers = {
+            'time': np.empty(n, dtype='<f4'),
+            'location': np.empty((n, 3), dtype='<f4'),
+            'rotation': np.empty((n, 3), dtype='<f4'),
+            'rotation_quat': np.empty((n, 4), dtype='<f4'),
+            'scale': np.empty((n, 3), dtype='<f4'),
+        }
+        if vertices is not None:
+            self.vertex_count = len(vertices)
+            self._buffers['vertices'] = np.empty((n, self.vertex_count, 3), dtype='<f4')
+            self._buffers['normals'] = np.empty((n, self.vertex_count, 3), dtype='<f4')
+
+    def write_keyframe(self, time: float, location, rotation, scale,
+                       vertices: Optional[np.ndarray] = None,
+                       normals: Optional[np.ndarray] = None):
+        """Stage one keyframe; a chunk is flushed to disk whenever it fills up
+        
+        rotation may be XYZ Euler (3 values) or a (w, x, y, z) quaternion;
+        both representations are stored.
+        """
+        if self._buffers is None:
+            self._allocate(vertices)
+        elif (vertices is not None) != ('vertices' in self._buffers):
+            raise ValueError("All keyframes must consistently include or omit mesh data")
+
+        i = self._fill
+        self._buffers['time'][i] = time
+        self._buffers['location'][i] = location
+        rotation = np.asarray(rotation, dtype=np.float64)
+        if len(rotation) == 4:
+            quat = rotation[None]
+            self._buffers['rotation'][i] = quat_to_euler(quat)[0]
+        else:
+            quat = euler_to_quat(rotation)
+            self._buffers['rotation'][i] = rotation
+        if self._last_quat is not None:
+            quat = make_continuous(np.vstack([self._last_quat, quat]))[1:]
+        self._last_quat = quat
+        self._buffers['rotation_quat'][i] = quat[0]
+        self._buffers['scale'][i] = scale
+        if vertices is not None:
+            if len(vertices) != self.vertex_count:
+                raise ValueError(
+                    f"Vertex count changed at time {time}: {len(vertices)} != {self.vertex_count}")
+            self._buffers['vertices'][i] = vertices
+            self._buffers['normals'][i] = normals if normals is not None else 0.0
+
+        self._fill += 1
+        if self._fill == self.chunk_size:
+            self.flush()
+
+    def flush(self):
+        """Write the staged keyframes as one chunk"""
+        if not self._fill:
+            return
+        count = self._fill
+        arrays = {name: buf[:count] for name, buf in self._buffers.items()}
+
+        f = self._file
+        chunk_offset = _align(f.tell())
+        f.write(b'\0' * (chunk_offset - f.tell()))
+        table, _ = _build_section_table(
+            arrays, chunk_offset + CHUNK_DTYPE.itemsize + len(arrays) * SECTION_DTYPE.itemsize)
+        end = int(table['offset'][-1] + table['nbytes'][-1])
+
+        times = arrays['time']
+        chunk = np.zeros(1, dtype=CHUNK_DTYPE)
+        chunk['magic'] = CHUNK_MAGIC
+        chunk['keyframe_count'] = count
+        chunk['section_count'] = len(arrays)
+        chunk['time_range'] = (times[0], times[-1])
+        chunk['nbytes'] = end - chunk_offset
+
+        f.write(chunk.tobytes())
+        f.write(table.tobytes())
+        _write_section_data(f, table, arrays.values())
+        f.flush()
+
+        self.index.append((chunk_offset, count, self.keyframe_count,
+                           float(times[0]), float(times[-1])))
+        self.keyframe_count += count
+        self._fill = 0
+
+    def close(self) -> int:
+        """Flush pending keyframes, write the index footer and patch the header"""
+        if self._file is None:
+            return 0
+        self.flush()
+        f = self._file
+
+        index_offset = _align(f.tell())
+        f.write(b'\0' * (index_offset - f.tell()))
+        index = np.zeros(len(self.index), dtype=CHUNK_INDEX_DTYPE)
+        for entry, (offset, count, first, t0, t1) in zip(index, self.index):
+            entry['offset'] = offset
+            entry['keyframe_count'] = count
+            entry['first_keyframe'] = first
+            entry['time_range'] = (t0, t1)
+        f.write(index.tobytes())
+
+        trailer = np.zeros(1, dtype=TRAILER_DTYPE)
+        trailer['index_offset'] = index_offset
+        trailer['chunk_count'] = len(self.index)
+        trailer['magic'] = TRAILER_MAGIC
+        f.write(trailer.tobytes())
+        end = f.tell()
+
+        f.seek(0)
+        f.write(_make_header(STREAM_MAGIC, self.object_name, self.temporal_range,
+                             self.keyframe_count, self.vertex_count, 0, 0).tobytes())
+        f.close()
+        self._file = None
+        self._buffers = None
+        return end
+
+    def abort(self):
+        """Close without the index footer, so readers see an incomplete file
+
+        Chunks already on disk stay readable by following chunk sizes;
+        keyframes still pending in the buffers are dropped.
+        """
+        if self._file is None:
+            return
+        self._file.close()
+        self._file = None
+        self._buffers = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        # A capture that failed part-way must not look finished
+        if exc_type is not None:
+            self.abort()
+        else:
+            self.close()
+
+
+class TemporalStreamFile:
+    """Read a .tvrs file chunk by chunk; works on files that are still being written"""
+
+    def __init__(self, filepath: str):
+        self.filepath = filepath
+        self._buffer = np.memmap(filepath, dtype=np.uint8, mode='r')
+        header = _read_header(self._buffer, STREAM_MAGIC, filepath)
+        self.object_name = header['object_name'].decode('utf-8', errors='ignore')
+        self.temporal_range = tuple(float(v) for v in header['temporal_range'])
+        self.keyframe_count = int(header['keyframe_count'])
+        self.vertex_count = int(header['vertex_count'])
+        self.index = self._read_index()
+        self.complete = self.index is not None
+
+    def _read_index(self) -> Optional[np.ndarray]:
+        """Return the chunk index if the trailer has been written"""
+        if len(self._buffer) < HEADER_DTYPE.itemsize + TRAILER_DTYPE.itemsize:
+            return None
+        trailer = np.frombuffer(self._buffer, dtype=TRAILER_DTYPE, count=1,
+                                offset=len(self._buffer) - TRAILER_DTYPE.itemsize)[0]
+        if trailer['magic'] != TRAILER_MAGIC:
+            return None
+        return np.frombuffer(self._buffer, dtype=CHUNK_INDEX_DTYPE,
+                             count=int(trailer['chunk_count']),
+                             offset=int(trailer['index_offset']))
+
+    def _read_chunk(self, offset: int) -> Optional[Tuple[np.void, Dict[str, np.ndarray]]]:
+        """Parse the chunk at offset, or None if it is missing or incomplete"""
+        if offset + CHUNK_DTYPE.itemsize > len(self._buffer):
+            return None
+        chunk = np.frombuffer(self._buffer, dtype=CHUNK_DTYPE, count=1, offset=offset)[0]
+        if chunk['magic'] != CHUNK_MAGIC or offset + int(chunk['nbytes']) > len(self._buffer):
+            return None
+        return chunk, _read_section_table(self._buffer, int(chunk['section_count']),
+                                          offset + CHUNK_DTYPE.itemsize)
+
+    def iter_chunks(self) -> Iterator[Dict[str, np.ndarray]]:
+        """Yield each chunk's section arrays in time order"""
+        if self.index is not None:
+            for entry in self.index:
+                yield self._read_chunk(int(entry['offset']))[1]
+            return
+
+        # No footer yet: follow chunk sizes from the start of the file
+        offset = _align(HEADER_DTYPE.itemsize)
+        while True:
+            parsed = self._read_chunk(offset)
+            if parsed is None:
+                return
+            chunk, sections = parsed
+            yield sections
+            offset = _align(offset + int(chunk['nbytes']))
+
+    def chunk_for_time(self, time: float) -> Optional[Dict[str, np.ndarray]]:
+        """Return the chunk whose time range contains time (requires a finished file)"""
+        if self.index is None:
+            raise ValueError("Chunk lookup needs the index footer; the file is incomplete")
+        if not len(self.index):
+            return None
+        starts = self.index['time_range'][:, 0]
+        i = max(int(np.searchsorted(starts, time, side='right')) - 1, 0)
+        return self._read_chunk(int(self.index[i]['offset']))[1]
+
+    def close(self):
+        """Drop references to the mapping"""
+        self.index = None
+        self._buffer = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,150 @@
+# temporal_interp.py
+# Temporal VR Project - Standalone temporal interpolation engine
+# Samples TemporalObject keyframes with NumPy only; no Blender process required
+
+import numpy as np
+from typing import Dict, Iterable, Optional, Sequence
+
+from temporal_quat import QuaternionTrack, euler_to_quat
+
+INTERPOLATION_MODES = ('linear', 'bezier', 'catmull_rom')
+DEFAULT_CHANNELS = ('location', 'rotation', 'scale')
+# Quaternion sampling used for the 'rotation_quat' channel in each mode
+ROTATION_MODES = {'linear': 'slerp', 'bezier': 'squad', 'catmull_rom': 'squad'}
+
+
+def _segment_positions(times: np.ndarray, samples: np.ndarray):
+    """Binary-search each sample into its keyframe segment; return (index, u, dt)"""
+    last = len(times) - 2
+    index = np.clip(np.searchsorted(times, samples, side='right') - 1, 0, last)
+    dt = times[index + 1] - times[index]
+    u = np.clip((samples - times[index]) / dt, 0.0, 1.0)
+    return index, u, dt
+
+
+def _catmull_rom_tangents(times: np.ndarray, values: np.ndarray) -> np.ndarray:
+    """Finite-difference tangents (value per frame) for a non-uniform Catmull-Rom spline"""
+    tangents = np.empty_like(values)
+    tangents[1:-1] = (values[2:] - values[:-2]) / (times[2:] - times[:-2])[:, None]
+    tangents[0] = (values[1] - values[0]) / (times[1] - times[0])
+    tangents[-1] = (values[-1] - values[-2]) / (times[-1] - times[-2])
+    return tangents
+
+
+def _auto_clamped_tangents(times: np.ndarray, values: np.ndarray) -> np.ndarray:
+    """Approximate Blender's AUTO_CLAMPED Bezier handles: flat at ends and extrema"""
+    tangents = _catmull_rom_tangents(times, values)
+    tangents[0] = 0.0
+    tangents[-1] = 0.0
+    if len(values) > 2:
+        before = values[1:-1] - values[:-2]
+        after = values[2:] - values[1:-1]
+        extremum = before * after <= 0.0
+        tangents[1:-1][extremum] = 0.0
+    return tangents
+
+
+class TemporalEvaluator:
+    """Keyframes compiled into sorted arrays for vectorized sampling at any time
+
+    Optional (N, 4) rotations are sampled on the sphere as a 'rotation_quat'
+    channel: SLERP in linear mode, SQUAD in the cubic modes.
+    """
+
+    def __init__(self, times: Sequence[float], channels: Dict[str, np.ndarray],
+                 mode: str = 'linear', rotations: Optional[np.ndarray] = None):
+        if mode not in INTERPOLATION_MODES:
+            raise ValueError(f"Unknown interpolation mode '{mode}' (use {INTERPOLATION_MODES})")
+
+        times = np.asarray(times, dtype=np.float64)
+        order = np.argsort(times, kind='stable')
+        self.times = times[order]
+        if len(self.times) and np.any(np.diff(self.times) <= 0):
+            raise ValueError("Keyframe times must be unique")
+        self.mode = mode
+
+        # Pack every channel side by side so one call samples all of them
+        self.channel_slices: Dict[str, slice] = {}
+        columns = []
+        start = 0
+        for name, data in channels.items():
+            data = np.asarray(data, dtype=np.float64).reshape(len(self.times), -1)[order]
+            self.channel_slices[name] = slice(start, start + data.shape[1])
+            start += data.shape[1]
+            columns.append(data)
+        self.values = np.hstack(columns) if columns else np.zeros((len(self.times), 0))
+        self._tangents: Dict[str, np.ndarray] = {}
+        self.rotation_track = None
+        if rotations is not None and len(self.times):
+            self.rotation_track = QuaternionTrack(times, rotations)
+
+    @classmethod
+    def from_keyframes(cls, temporal_keyframes: Dict[float, Dict],
+                       channels: Iterable[str] = DEFAULT_CHANNELS,
+                       mode: str = 'linear') -> 'TemporalEvaluator':
+        """Compile a TemporalObject.temporal_keyframes dict
+
+        The quaternion channel is derived from each phase's Euler 'rotation',
+        so both rotation channels always agree.
+        """
+        items = sorted(temporal_keyframes.items())
+        times = [time for time, _ in items]
+        packed = {name: [props[name] for _, props in items] for name in channels}
+        rotations = None
+        if items and all('rotation' in props for _, props in items):
+            rotations = euler_to_quat(np.array([props['rotation'] for _, props in items]))
+        return cls(times, packed, mode=mode, rotations=rotations)
+
+    def __len__(self) -> int:
+        return len(self.times)
+
+    @property
+    def time_range(self):
+        return (float(self.times[0]), float(self.times[-1])) if len(self.times) else (0.0, 0.0)
+
+    def _tangents_for(self, mode: str) -> np.ndarray:
+        """Tangents for cubic modes, computed once per mode"""
+        if mode not in self._tangents:
+            if mode == 'bezier':
+                self._tangents[mode] = _auto_clamped_tangents(self.times, self.values)
+            else:
+                self._tangents[mode] = _catmull_rom_tangents(self.times, self.values)
+        return self._tangents[mode]
+
+    def sample_packed(self, samples, mode: Optional[str] = None) -> np.ndarray:
+        """Sample all channels at once; returns (M, C) in channel_slices order"""
+        mode = mode or self.mode
+        if mode not in INTERPOLATION_MODES:
+            raise ValueError(f"Unknown interpolation mode '{mode}' (use {INTERPOLATION_MODES})")
+
+        samples = np.asarray(samples, dtype=np.float64).reshape(-1)
+        if len(self.times) == 0:
+            raise ValueError("Cannot sample an evaluator without keyframes")
+        if len(self.times) == 1:
+            return np.repeat(self.values, len(samples), axis=0)
+
+        index, u, dt = _segment_positions(self.times, samples)
+        p0 = self.values[index]
+        p1 = self.values[index + 1]
+        u = u[:, None]
+
+        if mode == 'linear':
+            return p0 + (p1 - p0) * u
+
+        # Cubic Hermite with per-frame tangents scaled to the segment length
+        tangents = self._tangents_for(mode)
+        m0 = tangents[index] * dt[:, None]
+        m1 = tangents[index + 1] * dt[:, None]
+        u2 = u * u
+        u3 = u2 * u
+        return ((2 * u3 - 3 * u2 + 1) * p0 + (u3 - 2 * u2 + u) * m0
+                + (-2 * u3 + 3 * u2) * p1 + (u3 - u2) * m1)
+
+    def sample(self, samples, mode: Optional[str] = None) -> Dict[str, np.ndarray]:
+        """Sample every channel at the given times; returns {channel: (M, C)}"""
+        packed = self.sample_packed(samples, mode)
+        sampled = {name: packed[:, sl] for name, sl in self.channel_slices.items()}
+        if self.rotation_track is not None:
+            sampled['rotation_quat'] = self.rotation_track.sample(
+                samples, ROTATION_MODES[mode or self.mode])
+        return sampled
@@ -0,0 +1,308 @@
+# temporal_link.py
+# Temporal VR Project - Live Blender → Unity link
+# Pushes temporal keyframe/vertex changes to localhost TCP clients without files
+#
+# Wire format (little-endian), one message after another:
+#   header   magic "TVRL", u1 version, u1 type, u2 name length,
+#            f8 send time (time.time()), u4 payload bytes
+#   name     utf-8 object name
+#   payload  u4 section count, then per section:
+#            u1 name length, name, 8-byte numpy dtype str, u1 ndim,
+#            u4 shape[ndim], raw C-order data
+#
+# SNAPSHOT replaces an object's sections, DELTA only carries what changed:
+# a full section, or "<name>:rows" (int32) + "<name>:values" to patch rows.
+# Deltas assign values (never add), so re-applying one is harmless.
+#
+# Reference client:  python temporal_link.py --host 127.0.0.1 --port 9757
+
+import argparse
+import queue
+import select
+import socket
+import struct
+import threading
+import time
+import numpy as np
+from typing import Dict, Optional, Tuple
+
+LINK_MAGIC = b"TVRL"
+LINK_VERSION = 1
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 9757
+
+MSG_HELLO = 0
+MSG_SNAPSHOT = 1
+MSG_DELTA = 2
+MSG_REMOVE = 3
+
+HEADER = struct.Struct("<4sBBHdI")
+ROW_SUFFIX = ":rows"
+VALUE_SUFFIX = ":values"
+
+
+def encode_sections(sections: Dict[str, np.ndarray]) -> bytes:
+    """Serialize named arrays into a message payload"""
+    parts = [struct.pack("<I", len(sections))]
+    for name, array in sections.items():
+        array = np.ascontiguousarray(array)
+        if array.dtype.byteorder == '>':
+            array = array.astype(array.dtype.newbyteorder('<'))
+        key = name.encode('utf-8')
+        parts.append(struct.pack("<B", len(key)) + key)
+        parts.append(array.dtype.str.encode('ascii').ljust(8, b"\0"))
+        parts.append(struct.pack(f"<B{array.ndim}I", array.ndim, *array.shape))
+        parts.append(array.tobytes())
+    return b"".join(parts)
+
+
+def decode_sections(payload: bytes) -> Dict[str, np.ndarray]:
+    """Inverse of encode_sections (arrays are copies, safe to keep)"""
+    view = memoryview(payload)
+    count, = struct.unpack_from("<I", view, 0)
+    offset = 4
+    sections = {}
+    for _ in range(count):
+        length = view[offset]
+        name = bytes(view[offset + 1:offset + 1 + length]).decode('utf-8')
+        offset += 1 + length
+        dtype = np.dtype(bytes(view[offset:offset + 8]).rstrip(b"\0").decode('ascii'))
+        ndim = view[offset + 8]
+        shape = struct.unpack_from(f"<{ndim}I", view, offset + 9)
+        offset += 9 + 4 * ndim
+        nbytes = dtype.itemsize * int(np.prod(shape, dtype=np.int64))
+        sections[name] = np.frombuffer(view[offset:offset + nbytes], dtype=dtype).reshape(shape).copy()
+        offset += nbytes
+    return sections
+
+
+def encode_message(kind: int, name: str = "", sections: Optional[Dict[str, np.ndarray]] = None) -> bytes:
+    """Header + name + payload for one message"""
+    key = name.encode('utf-8')
+    payload = encode_sections(sections or {})
+    return HEADER.pack(LINK_MAGIC, LINK_VERSION, kind, len(key), time.time(), len(payload)) + key + payload
+
+
+def compute_delta(previous: Optional[Dict[str, np.ndarray]], current: Dict[str, np.ndarray],
+                  tolerance: float = 0.0, max_row_fraction: float = 0.5) -> Dict[str, np.ndarray]:
+    """Sections of current that differ from previous (empty dict if nothing changed)
+
+    Same-shaped arrays with few changed rows are sent as row patches; anything
+    else (new section, new shape, mostly changed) is sent whole.
+    """
+    delta = {}
+    for name, array in current.items():
+        old = None if previous is None else previous.get(name)
+        if old is None or old.shape != array.shape or old.dtype != array.dtype:
+            delta[name] = array
+            continue
+        if array.ndim == 0 or len(array) == 0:
+            continue
+        diff = np.abs(array.astype(np.float64) - old) > tolerance
+        rows = np.flatnonzero(diff.reshape(len(array), -1).any(axis=1))
+        if len(rows) == 0:
+            continue
+        if len(rows) > max_row_fraction * len(array):
+            delta[name] = array
+        else:
+            delta[name + ROW_SUFFIX] = rows.astype(np.int32)
+            delta[name + VALUE_SUFFIX] = array[rows]
+    return delta
+
+
+def apply_delta(state: Dict[str, np.ndarray], delta: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+    """Update a mirrored section dict in place with a DELTA payload"""
+    for name, array in delta.items():
+        if name.endswith(VALUE_SUFFIX):
+            continue
+        if name.endswith(ROW_SUFFIX):
+            base = name[:-len(ROW_SUFFIX)]
+            state[base][array] = delta[base + VALUE_SUFFIX]
+        else:
+            state[name] = np.array(array)
+    return state
+
+
+class TemporalLinkServer:
+    """Localhost TCP server that fans temporal updates out to every client
+
+    publish() is cheap and thread-safe: it diffs against the last published
+    state and queues the bytes. A single background thread accepts clients
+    (sending them current snapshots) and writes the queue, so Blender's main
+    thread never blocks on the network.
+    """
+
+    def __init__(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT, tolerance: float = 0.0):
+        self.host = host
+        self.port = port
+        self.tolerance = tolerance
+        self._states: Dict[str, Dict[str, np.ndarray]] = {}
+        self._queue: "queue.Queue[bytes]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._clients = []
+        self._socket = None
+        self._thread = None
+        self._running = False
+        self.bytes_sent = 0
+
+    @property
+    def client_count(self) -> int:
+        return len(self._clients)
+
+    def start(self):
+        """Bind and start the I/O thread"""
+        self._socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._socket.bind((self.host, self.port))
+        self._socket.listen()
+        self.port = self._socket.getsockname()[1]
+        self._running = True
+        self._thread = threading.Thread(target=self._serve, name="TemporalLink", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Close every connection and join the I/O thread"""
+        self._running = False
+        if self._thread is not None:
+            self._thread.join(timeout=2.0)
+        for client in self._clients:
+            client.close()
+        self._clients = []
+        if self._socket is not None:
+            self._socket.close()
+            self._socket = None
+
+    def publish(self, name: str, sections: Dict[str, np.ndarray]) -> int:
+        """Queue whatever changed since the last publish; returns the section count sent"""
+        sections = {key: np.array(value) for key, value in sections.items()}
+        with self._lock:
+            previous = self._states.get(name)
+            delta = compute_delta(previous, sections, self.tolerance)
+            self._states[name] = sections
+            if delta:
+                kind = MSG_SNAPSHOT if previous is None else MSG_DELTA
+                self._queue.put(encode_message(kind, name, delta))
+        return len(delta)
+
+    def remove(self, name: str):
+        """Tell clients an object is gone"""
+        with self._lock:
+            if self._states.pop(name, None) is not None:
+                self._queue.put(encode_message(MSG_REMOVE, name))
+
+    def _accept(self):
+        """Greet a new client with snapshots of every published object"""
+        client, _ = self._socket.accept()
+        client.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        with self._lock:
+            messages = [encode_message(MSG_HELLO, "", {'version': np.array([LINK_VERSION], np.int32)})]
+            messages += [encode_message(MSG_SNAPSHOT, name, state) for name, state in self._states.items()]
+        try:
+            for message in messages:
+                client.sendall(message)
+        except OSError:
+            client.close()
+            return
+        self._clients.append(client)
+
+    def _broadcast(self, message: bytes):
+        """Send to all clients, dropping the ones that disconnected"""
+        for client in list(self._clients):
+            try:
+                client.sendall(message)
+                self.bytes_sent += len(message)
+            except OSError:
+                self._clients.remove(client)
+                client.close()
+
+    def _serve(self):
+        while self._running:
+            readable, _, _ = select.select([self._socket], [], [], 0.02)
+            if readable:
+                self._accept()
+            while True:
+                try:
+                    message = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                self._broadcast(message)
+
+
+class TemporalLinkClient:
+    """Reference client: mirrors every object the server publishes"""
+
+    def __init__(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT):
+        self.host = host
+        self.port = port
+        self.objects: Dict[str, Dict[str, np.ndarray]] = {}
+        self._socket = None
+
+    def connect(self, timeout: float = 5.0):
+        self._socket = socket.create_connection((self.host, self.port), timeout=timeout)
+        self._socket.settimeout(None)
+        return self
+
+    def close(self):
+        if self._socket is not None:
+            self._socket.close()
+            self._socket = None
+
+    def __enter__(self):
+        return self.connect()
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _read_exact(self, size: int) -> bytes:
+        buffer = bytearray(size)
+        view = memoryview(buffer)
+        received = 0
+        while received < size:
+            count = self._socket.recv_into(view[received:])
+            if count == 0:
+                raise ConnectionError("Temporal link closed by server")
+            received += count
+        return bytes(buffer)
+
+    def receive(self) -> Tuple[int, str, float, Dict[str, np.ndarray]]:
+        """Block for the next message: (type, object name, send time, sections)"""
+        magic, version, kind, name_length, sent, nbytes = HEADER.unpack(self._read_exact(HEADER.size))
+        if magic != LINK_MAGIC or version != LINK_VERSION:
+            raise ValueError(f"Unexpected temporal link header {magic!r} v{version}")
+        name = self._read_exact(name_length).decode('utf-8')
+        sections = decode_sections(self._read_exact(nbytes))
+        return kind, name, sent, sections
+
+    def poll(self) -> Tuple[int, str, float]:
+        """Receive one message and apply it to self.objects"""
+        kind, name, sent, sections = self.receive()
+        if kind == MSG_SNAPSHOT:
+            self.objects[name] = sections
+        elif kind == MSG_DELTA:
+            apply_delta(self.objects.setdefault(name, {}), sections)
+        elif kind == MSG_REMOVE:
+            self.objects.pop(name, None)
+        return kind, name, sent
+
+
+def main():
+    """Print every update received from a running Blender live link"""
+    parser = argparse.ArgumentParser(description="Temporal VR live link reference client")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    args = parser.parse_args()
+
+    labels = {MSG_HELLO: "hello", MSG_SNAPSHOT: "snapshot", MSG_DELTA: "delta", MSG_REMOVE: "remove"}
+    with TemporalLinkClient(args.host, args.port) as client:
+        print(f"🔗 Connected to temporal link {args.host}:{args.port}")
+        while True:
+            kind, name, sent = client.poll()
+            latency = (time.time() - sent) * 1000.0
+            state = client.objects.get(name, {})
+            shapes = ", ".join(f"{key}{tuple(value.shape)}" for key, value in state.items())
+            print(f"📥 {labels.get(kind, kind)} {name or '-'} ({latency:.1f} ms): {shapes}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+# temporal_lod.py
+# Temporal VR Project - Topology-consistent LOD chains for keyframe sequences
+# Vertex-clustering decimation of the rest pose, shared by every keyframe
+#
+# Each LOD groups the full-resolution vertices into grid cells sized to hit a
+# target vertex count. A LOD vertex is the mean of its cluster, so any
+# keyframe is resampled onto the LOD with the same averaging map and all
+# keyframes share one triangle list per LOD.
+#
+# Sections per level i = 1..L (K = keyframes, Vi = LOD vertex count):
+#   lod{i}_vertices   float32 (K, Vi, 3)
+#   lod{i}_normals    float32 (K, Vi, 3)  cluster-averaged, renormalized
+#   lod{i}_triangles  int32   (Ti, 3)
+#   lod{i}_clusters   int32   (V,)        LOD vertex of each full-res vertex
+#   lod{i}_vertex_times float32 (Vi,)     when the export has vertex_times
+#   lod_vertex_counts int32   (L,)
+# Level 0 is the full-resolution 'vertices'/'normals' data.
+
+import numpy as np
+from typing import Dict, Optional, Tuple
+
+MIN_LOD_LEVELS = 2
+MAX_LOD_LEVELS = 4
+DEFAULT_LOD_RATIO = 0.5
+# Bisection steps when searching for the cell size of a target vertex count
+CELL_SEARCH_STEPS = 24
+# Keyframes resampled per block, bounding the temporary copy
+RESAMPLE_BLOCK = 64
+
+
+def cluster_vertices(points: np.ndarray, cell_size: float) -> Tuple[np.ndarray, int]:
+    """Grid cell cluster of each point as dense labels, and the cluster count"""
+    cells = np.floor((points - points.min(axis=0)) / cell_size).astype(np.int64)
+    _, labels = np.unique(cells, axis=0, return_inverse=True)
+    labels = labels.reshape(-1)
+    return labels.astype(np.int32), int(labels.max()) + 1 if len(labels) else 0
+
+
+def cluster_for_count(points: np.ndarray, target: int) -> np.ndarray:
+    """Labels of the grid clustering whose size is closest to (not above) target"""
+    points = np.asarray(points, dtype=np.float64)
+    diagonal = float(np.linalg.norm(np.ptp(points, axis=0))) or 1.0
+    lo, hi = np.log(diagonal * 1e-6), np.log(diagonal * 2.0)
+    best, _ = cluster_vertices(points, diagonal * 2.0)
+
+    for _ in range(CELL_SEARCH_STEPS):
+        mid = 0.5 * (lo + hi)
+        labels, count = cluster_vertices(points, float(np.exp(mid)))
+        if count > target:
+            lo = mid
+        else:
+            best, hi = labels, mid
+            if count == target:
+                break
+    return best
+
+
+def collapse_triangles(triangles: np.ndarray, labels: np.ndarray) -> np.ndarray:
+    """Triangles remapped onto clusters, without degenerate or duplicate faces"""
+    mapped = labels[np.asarray(triangles, dtype=np.int64).reshape(-1, 3)]
+    valid = ((mapped[:, 0] != mapped[:, 1]) & (mapped[:, 1] != mapped[:, 2])
+             & (mapped[:, 0] != mapped[:, 2]))
+    mapped = mapped[valid]
+    if len(mapped) == 0:
+        return np.zeros((0, 3), dtype=np.int32)
+    # Same face in any winding/rotation counts once; keep the first winding
+    _, first = np.unique(np.sort(mapped, axis=1), axis=0, return_index=True)
+    return mapped[np.sort(first)].astype(np.int32)
+
+
+def resample(frames: np.ndarray, labels: np.ndarray, count: int) -> np.ndarray:
+    """Cluster means of (K, V, C) per-vertex values → (K, count, C)"""
+    order = np.argsort(labels, kind='stable')
+    sizes = np.bincount(labels, minlength=count)
+    starts = np.concatenate([[0], np.cumsum(sizes)[:-1]])
+    out = np.empty((len(frames), count) + frames.shape[2:], dtype=np.float32)
+    for block in range(0, len(frames), RESAMPLE_BLOCK):
+        chunk = np.asarray(frames[block:block + RESAMPLE_BLOCK], dtype=np.float32)[:, order]
+        sums = np.add.reduceat(chunk, starts, axis=1)
+        out[block:block + RESAMPLE_BLOCK] = sums / sizes.reshape((1, -1) + (1,) * (frames.ndim - 2))
+    return out
+
+
+def build_lod_sections(rest_pose: np.ndarray, triangles: np.ndarray, vertices: np.ndarray,
+                       normals: Optional[np.ndarray] = None, levels: int = 3,
+                       ratio: float = DEFAULT_LOD_RATIO,
+                       vertex_times: Optional[np.ndarray] = None) -> Dict[str, np.ndarray]:
+    """lod{i}_* sections for levels LODs, each about ratio times the previous size"""
+    if not MIN_LOD_LEVELS <= levels <= MAX_LOD_LEVELS:
+        raise ValueError(f"LOD levels must be between {MIN_LOD_LEVELS} and {MAX_LOD_LEVELS}, got {levels}")
+    if not 0.0 < ratio < 1.0:
+        raise ValueError(f"LOD ratio must be in (0, 1), got {ratio}")
+
+    vertex_count = len(rest_pose)
+    sections = {}
+    counts = []
+    for level in range(1, levels + 1):
+        target = max(int(vertex_count * ratio ** level), 4)
+        labels = cluster_for_count(rest_pose, target)
+        count = int(labels.max()) + 1
+        prefix = f"lod{level}_"
+        sections[prefix + 'vertices'] = resample(vertices, labels, count)
+        if normals is not None:
+            averaged = resample(normals, labels, count)
+            length = np.linalg.norm(averaged, axis=2, keepdims=True)
+            sections[prefix + 'normals'] = averaged / np.maximum(length, 1e-12)
+        sections[prefix + 'triangles'] = collapse_triangles(triangles, labels)
+        sections[prefix + 'clusters'] = labels
+        if vertex_times is not None:
+            sections[prefix + 'vertex_times'] = resample(
+                np.asarray(vertex_times, dtype=np.float32)[None, :, None], labels, count)[0, :, 0]
+        counts.append(count)
+
+    sections['lod_vertex_counts'] = np.array(counts, dtype=np.int32)
+    return sections
+
+
+def lod_levels(sections) -> int:
+    """Number of LODs stored in a file or section dict"""
+    return len(sections['lod_vertex_counts']) if 'lod_vertex_counts' in sections else 0
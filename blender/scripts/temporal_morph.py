@@ -0,0 +1,107 @@
+# temporal_morph.py
+# Temporal VR Project - Sparse morph targets
+# Base mesh plus per-key offsets for only the vertices that actually move
+#
+# Sections written alongside the regular .tvrk channels (M = morph count):
+#   base_vertices         float32 (V, 3)
+#   base_normals          float32 (V, 3)     optional
+#   morph_offsets         int32   (M + 1,)   CSR row starts into indices/deltas
+#   morph_indices         int32   (nnz,)     moved vertex indices, ascending per morph
+#   morph_deltas          float32 (nnz, 3)   position offsets from the base
+#   morph_normal_offsets  int32   (M + 1,)   same layout for normal offsets
+#   morph_normal_indices  int32   (nnz_n,)
+#   morph_normal_deltas   float32 (nnz_n, 3)
+
+import numpy as np
+from typing import Dict, Optional, Tuple
+
+
+def sparse_morph_targets(base: np.ndarray, targets: np.ndarray,
+                         threshold: float = 1e-6) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Encode (M, V, 3) targets as CSR (offsets, indices, deltas) against (V, 3) base"""
+    base = np.asarray(base, dtype=np.float32)
+    offsets = np.zeros(len(targets) + 1, dtype=np.int32)
+    indices = []
+    deltas = []
+    for i, target in enumerate(targets):
+        delta = np.asarray(target, dtype=np.float32) - base
+        moved = np.flatnonzero(np.any(np.abs(delta) > threshold, axis=1))
+        indices.append(moved.astype(np.int32))
+        deltas.append(delta[moved])
+        offsets[i + 1] = offsets[i] + len(moved)
+
+    if indices:
+        return offsets, np.concatenate(indices), np.concatenate(deltas).astype(np.float32)
+    return offsets, np.zeros(0, np.int32), np.zeros((0, 3), np.float32)
+
+
+def morph_sections(base_vertices: np.ndarray, targets: np.ndarray,
+                   base_normals: Optional[np.ndarray] = None,
+                   target_normals: Optional[np.ndarray] = None,
+                   threshold: float = 1e-6, normal_threshold: float = 1e-4) -> Dict[str, np.ndarray]:
+    """Build the sparse morph sections for a base mesh and its target states"""
+    offsets, indices, deltas = sparse_morph_targets(base_vertices, targets, threshold)
+    sections = {
+        'base_vertices': np.asarray(base_vertices, dtype=np.float32),
+        'morph_offsets': offsets,
+        'morph_indices': indices,
+        'morph_deltas': deltas,
+    }
+    if base_normals is not None and target_normals is not None:
+        n_offsets, n_indices, n_deltas = sparse_morph_targets(
+            base_normals, target_normals, normal_threshold)
+        sections['base_normals'] = np.asarray(base_normals, dtype=np.float32)
+        sections['morph_normal_offsets'] = n_offsets
+        sections['morph_normal_indices'] = n_indices
+        sections['morph_normal_deltas'] = n_deltas
+    return sections
+
+
+def morph_density(sections) -> float:
+    """Fraction of (morph, vertex) pairs that are stored"""
+    morphs = len(sections['morph_offsets']) - 1
+    vertices = len(sections['base_vertices'])
+    return len(sections['morph_indices']) / max(morphs * vertices, 1)
+
+
+def apply_morphs(base: np.ndarray, offsets: np.ndarray, indices: np.ndarray,
+                 deltas: np.ndarray, weights: np.ndarray) -> np.ndarray:
+    """Blend sparse morphs: base + sum_i weights[i] * delta_i (touches moved vertices only)"""
+    result = np.array(base, dtype=np.float32)
+    for i, weight in enumerate(np.asarray(weights, dtype=np.float32)):
+        if weight == 0.0:
+            continue
+        start, end = offsets[i], offsets[i + 1]
+        np.add.at(result, indices[start:end], weight * deltas[start:end])
+    return result
+
+
+def tent_weights(times: np.ndarray, t: float, base_time: float = 0.0) -> np.ndarray:
+    """Per-morph weights at time t for a sequence that passes through each state
+
+    Each morph rises linearly from the previous state's time and falls to the
+    next one, so consecutive states cross-fade. Between base_time and the
+    first state the base mesh fades into the first morph.
+    """
+    times = np.asarray(times, dtype=np.float64)
+    weights = np.zeros(len(times), dtype=np.float32)
+    if len(times) == 0:
+        return weights
+    i = int(np.searchsorted(times, t, side='right')) - 1
+    if i < 0:
+        if times[0] > base_time:
+            weights[0] = np.clip((t - base_time) / (times[0] - base_time), 0.0, 1.0)
+    elif i >= len(times) - 1:
+        weights[-1] = 1.0
+    else:
+        u = (t - times[i]) / (times[i + 1] - times[i])
+        weights[i] = 1.0 - u
+        weights[i + 1] = u
+    return weights
+
+
+def sample_morph_sequence(sections, t: float, base_time: float = 0.0) -> np.ndarray:
+    """Vertex positions of a sparse morph .tvrk (or section dict) at time t"""
+    weights = tent_weights(sections['time'], t, base_time)
+    return apply_morphs(sections['base_vertices'], sections['morph_offsets'],
+                        sections['morph_indices'], sections['morph_deltas'], weights)
@@ -0,0 +1,207 @@
+# temporal_profile.py
+# Temporal VR Project - Opt-in pipeline instrumentation
+# Per-stage/per-object timers, counters and optional cProfile/tracemalloc dumps
+#
+# Off by default; when off every hook is a flag check. Turn it on without
+# touching the script via environment variables (inherited by batch workers):
+#   TEMPORAL_PROFILE=1              collect timings and counters
+#   TEMPORAL_PROFILE_OUT=path.json  where to write the report at exit
+#                                   ("{pid}" is replaced, for parallel workers)
+#   TEMPORAL_PROFILE_CPROFILE=1     also dump cProfile stats to path.prof
+#   TEMPORAL_PROFILE_MEMORY=1       also record tracemalloc peaks/top lines
+# or from code: temporal_profile.enable(...), then report()/dump().
+
+import atexit
+import cProfile
+import functools
+import json
+import os
+import time
+import tracemalloc
+from contextlib import contextmanager
+from typing import Dict, Optional
+
+# Counter names used by the pipeline
+KEYFRAMES_INSERTED = "keyframes_inserted"
+DEPSGRAPH_UPDATES = "depsgraph_updates"
+DATABLOCKS_CREATED = "datablocks_created"
+
+
+class Instrumentation:
+    """Collects stage timings, counters and optional profiler data"""
+
+    def __init__(self):
+        self.enabled = False
+        self.reset()
+
+    def reset(self):
+        self.stages: Dict[str, Dict[str, float]] = {}
+        self.objects: Dict[str, Dict[str, float]] = {}
+        self.counters: Dict[str, int] = {}
+        self.memory_peaks: Dict[str, float] = {}
+        self.profiler: Optional[cProfile.Profile] = None
+        self.trace_memory = False
+        self._depth = 0
+
+    def enable(self, cprofile: bool = False, memory: bool = False):
+        self.enabled = True
+        if cprofile and self.profiler is None:
+            self.profiler = cProfile.Profile()
+        if memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+        self.trace_memory = memory
+
+    def disable(self):
+        self.enabled = False
+        if self.trace_memory and tracemalloc.is_tracing():
+            tracemalloc.stop()
+        self.trace_memory = False
+
+    def count(self, name: str, amount: int = 1):
+        if self.enabled:
+            self.counters[name] = self.counters.get(name, 0) + int(amount)
+
+    @contextmanager
+    def stage(self, name: str, label: Optional[str] = None):
+        """Time a block; nested stages are timed too, profiled as part of the outermost"""
+        if not self.enabled:
+            yield
+            return
+
+        outermost = self._depth == 0
+        self._depth += 1
+        if outermost:
+            if self.profiler is not None:
+                self.profiler.enable()
+            if self.trace_memory:
+                tracemalloc.reset_peak()
+                memory = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - start
+            self._depth -= 1
+            if outermost:
+                if self.profiler is not None:
+                    self.profiler.disable()
+                if self.trace_memory:
+                    peak = (tracemalloc.get_traced_memory()[1] - memory) / 1024
+                    self.memory_peaks[name] = max(self.memory_peaks.get(name, 0.0), peak)
+            self._record(name, label, seconds)
+
+    def _record(self, name: str, label: Optional[str], seconds: float):
+        stats = self.stages.setdefault(name, {'calls': 0, 'total': 0.0, 'max': 0.0})
+        stats['calls'] += 1
+        stats['total'] += seconds
+        stats['max'] = max(stats['max'], seconds)
+        if label is not None:
+            per_object = self.objects.setdefault(label, {})
+            per_object[name] = per_object.get(name, 0.0) + seconds
+
+    def report(self, top: int = 10) -> Dict:
+        """Stage totals, counters and the slowest (object, stage) pairs"""
+        pairs = [(seconds, label, name) for label, stages in self.objects.items()
+                 for name, seconds in stages.items()]
+        report = {
+            'stages': self.stages,
+            'counters': self.counters,
+            'slowest': [{'object': label, 'stage': name, 'seconds': seconds}
+                        for seconds, label, name in sorted(pairs, reverse=True)[:top]],
+            'objects': self.objects,
+        }
+        if self.memory_peaks:
+            report['memory_peak_kb'] = self.memory_peaks
+        if self.trace_memory and tracemalloc.is_tracing():
+            statistics = tracemalloc.take_snapshot().statistics('lineno')[:top]
+            report['memory_top'] = [{'line': str(stat.traceback), 'kb': stat.size / 1024}
+                                    for stat in statistics]
+        return report
+
+    def print_report(self, top: int = 10):
+        report = self.report(top)
+        print("⏱️ Temporal pipeline stages:")
+        for name, stats in sorted(self.stages.items(), key=lambda item: -item[1]['total']):
+            print(f"   {name}: {stats['total'] * 1000:.1f}ms total, {stats['calls']} calls, "
+                  f"max {stats['max'] * 1000:.1f}ms")
+        for entry in report['slowest']:
+            print(f"   🐢 {entry['object']} / {entry['stage']}: {entry['seconds'] * 1000:.1f}ms")
+        if self.counters:
+            print("   " + ", ".join(f"{name}={value}" for name, value in sorted(self.counters.items())))
+
+    def dump(self, filepath: str) -> Dict:
+        """Write the JSON report (and cProfile stats next to it, if collected)"""
+        report = self.report()
+        if self.profiler is not None:
+            profile_path = os.path.splitext(filepath)[0] + ".prof"
+            self.profiler.dump_stats(profile_path)
+            report['cprofile'] = profile_path
+        with open(filepath, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"📤 Temporal profile written: {filepath}")
+        return report
+
+
+instrumentation = Instrumentation()
+
+
+def enable(cprofile: bool = False, memory: bool = False):
+    instrumentation.enable(cprofile, memory)
+
+
+def disable():
+    instrumentation.disable()
+
+
+def count(name: str, amount: int = 1):
+    """Bump a counter (no-op unless instrumentation is enabled)"""
+    if instrumentation.enabled:
+        instrumentation.count(name, amount)
+
+
+def stage(name: str, label: Optional[str] = None):
+    """Context manager timing a pipeline stage, optionally for one object"""
+    return instrumentation.stage(name, label)
+
+
+def _label(args) -> Optional[str]:
+    """Object label from a method's self (.name) or a leading object-name argument"""
+    if not args:
+        return None
+    first = args[0]
+    if isinstance(first, str):
+        return first
+    return getattr(first, 'name', None)
+
+
+def timed(name: Optional[str] = None):
+    """Decorator timing every call as a stage (named after the function by default)"""
+    def decorator(function):
+        stage_name = name or function.__name__
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if not instrumentation.enabled:
+                return function(*args, **kwargs)
+            with instrumentation.stage(stage_name, _label(args)):
+                return function(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def _enable_from_environment():
+    """TEMPORAL_PROFILE=1 turns instrumentation on and dumps a report at exit"""
+    if os.environ.get("TEMPORAL_PROFILE", "") in ("", "0"):
+        return
+    enable(cprofile=os.environ.get("TEMPORAL_PROFILE_CPROFILE", "") not in ("", "0"),
+           memory=os.environ.get("TEMPORAL_PROFILE_MEMORY", "") not in ("", "0"))
+    filepath = os.environ.get("TEMPORAL_PROFILE_OUT") or "temporal_profile_{pid}.json"
+    filepath = filepath.replace("{pid}", str(os.getpid()))
+
+    def _dump_at_exit():
+        instrumentation.print_report()
+        instrumentation.dump(filepath)
+    atexit.register(_dump_at_exit)
+
+
+_enable_from_environment()
@@ -0,0 +1,169 @@
+# temporal_quat.py
+# Temporal VR Project - Packed quaternion rotations for temporal phases
+# Quaternions are (N, 4) float arrays in Blender order (w, x, y, z)
+
+import numpy as np
+from typing import Optional, Sequence
+
+_AXIS_INDEX = {'X': 1, 'Y': 2, 'Z': 3}
+
+
+def quat_multiply(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Hamilton product of two quaternion arrays (broadcasting)"""
+    aw, ax, ay, az = np.moveaxis(np.asarray(a), -1, 0)
+    bw, bx, by, bz = np.moveaxis(np.asarray(b), -1, 0)
+    return np.stack([
+        aw * bw - ax * bx - ay * by - az * bz,
+        aw * bx + ax * bw + ay * bz - az * by,
+        aw * by - ax * bz + ay * bw + az * bx,
+        aw * bz + ax * by - ay * bx + az * bw,
+    ], axis=-1)
+
+
+def quat_conjugate(q: np.ndarray) -> np.ndarray:
+    """Inverse of unit quaternions"""
+    return np.asarray(q) * np.array([1.0, -1.0, -1.0, -1.0])
+
+
+def quat_normalize(q: np.ndarray) -> np.ndarray:
+    """Scale quaternions to unit length"""
+    q = np.asarray(q, dtype=np.float64)
+    return q / np.linalg.norm(q, axis=-1, keepdims=True)
+
+
+def euler_to_quat(euler: np.ndarray, order: str = 'XYZ') -> np.ndarray:
+    """Convert (N, 3) Blender Euler angles (radians) to (N, 4) quaternions"""
+    euler = np.asarray(euler, dtype=np.float64).reshape(-1, 3)
+    half = euler * 0.5
+    result = None
+    # Blender 'XYZ' applies X first, so the product is qz * qy * qx
+    for axis in order:
+        angle = half[:, 'XYZ'.index(axis)]
+        q = np.zeros((len(euler), 4))
+        q[:, 0] = np.cos(angle)
+        q[:, _AXIS_INDEX[axis]] = np.sin(angle)
+        result = q if result is None else quat_multiply(q, result)
+    return result
+
+
+def quat_to_euler(q: np.ndarray) -> np.ndarray:
+    """Convert (N, 4) quaternions to (N, 3) XYZ Euler angles"""
+    w, x, y, z = np.moveaxis(quat_normalize(np.asarray(q).reshape(-1, 4)), -1, 0)
+    # Rotation matrix terms for R = Rz * Ry * Rx
+    r00 = 1 - 2 * (y * y + z * z)
+    r10 = 2 * (x * y + w * z)
+    r20 = 2 * (x * z - w * y)
+    r21 = 2 * (y * z + w * x)
+    r22 = 1 - 2 * (x * x + y * y)
+    return np.stack([np.arctan2(r21, r22),
+                     np.arcsin(np.clip(-r20, -1.0, 1.0)),
+                     np.arctan2(r10, r00)], axis=-1)
+
+
+def make_continuous(q: np.ndarray) -> np.ndarray:
+    """Flip signs so consecutive quaternions lie in the same hemisphere"""
+    q = np.array(q, dtype=np.float64).reshape(-1, 4)
+    if len(q) > 1:
+        flips = np.sum(q[1:] * q[:-1], axis=-1) < 0
+        # Each flip inverts every following key
+        signs = np.concatenate([[1.0], np.where(np.cumsum(flips) % 2, -1.0, 1.0)])
+        q *= signs[:, None]
+    return q
+
+
+def quat_log(q: np.ndarray) -> np.ndarray:
+    """Log map of unit quaternions to (N, 3) rotation vectors (half-angle axis)"""
+    q = np.asarray(q)
+    v = q[..., 1:]
+    sin_half = np.linalg.norm(v, axis=-1, keepdims=True)
+    half = np.arctan2(sin_half, q[..., :1])
+    scale = np.where(sin_half > 1e-12, half / np.maximum(sin_half, 1e-12), 1.0)
+    return v * scale
+
+
+def quat_exp(v: np.ndarray) -> np.ndarray:
+    """Inverse of quat_log"""
+    v = np.asarray(v)
+    half = np.linalg.norm(v, axis=-1, keepdims=True)
+    scale = np.where(half > 1e-12, np.sin(half) / np.maximum(half, 1e-12), 1.0)
+    return np.concatenate([np.cos(half), v * scale], axis=-1)
+
+
+def slerp(q0: np.ndarray, q1: np.ndarray, u: np.ndarray) -> np.ndarray:
+    """Batched spherical linear interpolation; u broadcasts against (N,)"""
+    q0 = np.asarray(q0, dtype=np.float64)
+    q1 = np.asarray(q1, dtype=np.float64)
+    u = np.asarray(u, dtype=np.float64)[..., None]
+
+    dot = np.sum(q0 * q1, axis=-1, keepdims=True)
+    q1 = np.where(dot < 0, -q1, q1)
+    dot = np.abs(dot)
+
+    # Fall back to normalized lerp where the arc is too short for a stable sin()
+    theta = np.arccos(np.clip(dot, -1.0, 1.0))
+    sin_theta = np.sin(theta)
+    close = sin_theta < 1e-6
+    safe = np.where(close, 1.0, sin_theta)
+    w0 = np.where(close, 1.0 - u, np.sin((1.0 - u) * theta) / safe)
+    w1 = np.where(close, u, np.sin(u * theta) / safe)
+    return quat_normalize(w0 * q0 + w1 * q1)
+
+
+def squad_controls(q: np.ndarray) -> np.ndarray:
+    """Intermediate SQUAD control points s_i for a continuous key sequence"""
+    q = np.asarray(q, dtype=np.float64)
+    prev = np.concatenate([q[:1], q[:-1]])
+    nxt = np.concatenate([q[1:], q[-1:]])
+    inv = quat_conjugate(q)
+    tangent = -(quat_log(quat_multiply(inv, nxt)) + quat_log(quat_multiply(inv, prev))) / 4.0
+    return quat_normalize(quat_multiply(q, quat_exp(tangent)))
+
+
+class QuaternionTrack:
+    """Sorted quaternion keys with batched SLERP/SQUAD sampling"""
+
+    MODES = ('slerp', 'squad')
+
+    def __init__(self, times: Sequence[float], quaternions: np.ndarray, mode: str = 'slerp'):
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown rotation mode '{mode}' (use {self.MODES})")
+        times = np.asarray(times, dtype=np.float64)
+        order = np.argsort(times, kind='stable')
+        self.times = times[order]
+        if len(self.times) == 0:
+            raise ValueError("A quaternion track needs at least one key")
+        self.quaternions = make_continuous(quat_normalize(
+            np.asarray(quaternions, dtype=np.float64).reshape(-1, 4)[order]))
+        self.mode = mode
+        self._controls: Optional[np.ndarray] = None
+
+    @classmethod
+    def from_euler(cls, times: Sequence[float], euler: np.ndarray,
+                   order: str = 'XYZ', mode: str = 'slerp') -> 'QuaternionTrack':
+        """Build a track from Euler phase rotations"""
+        return cls(times, euler_to_quat(euler, order), mode=mode)
+
+    def sample(self, samples, mode: Optional[str] = None) -> np.ndarray:
+        """Sample (M, 4) quaternions at the given times (clamped at the ends)"""
+        mode = mode or self.mode
+        samples = np.asarray(samples, dtype=np.float64).reshape(-1)
+        if len(self.times) == 1:
+            return np.repeat(self.quaternions, len(samples), axis=0)
+
+        last = len(self.times) - 2
+        index = np.clip(np.searchsorted(self.times, samples, side='right') - 1, 0, last)
+        t0 = self.times[index]
+        u = np.clip((samples - t0) / (self.times[index + 1] - t0), 0.0, 1.0)
+        q0 = self.quaternions[index]
+        q1 = self.quaternions[index + 1]
+
+        if mode == 'slerp':
+            return slerp(q0, q1, u)
+        if mode != 'squad':
+            raise ValueError(f"Unknown rotation mode '{mode}' (use {self.MODES})")
+
+        if self._controls is None:
+            self._controls = squad_controls(self.quaternions)
+        s0 = self._controls[index]
+        s1 = self._controls[index + 1]
+        return slerp(slerp(q0, q1, u), slerp(s0, s1, u), 2.0 * u * (1.0 - u))
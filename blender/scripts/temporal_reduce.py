@@ -0,0 +1,128 @@
+# temporal_reduce.py
+# Temporal VR Project - Keyframe reduction for temporal data
+# Drops keys that can be reconstructed within a tolerance (RDP-style refinement)
+
+import numpy as np
+from typing import Dict, Iterable, Tuple, Union
+
+from temporal_interp import DEFAULT_CHANNELS, TemporalEvaluator
+
+Tolerance = Union[float, Dict[str, float]]
+# Keys accepted in a tolerance dict (channel names as in TemporalEvaluator/specs)
+TOLERANCE_KEYS = ('location', 'rotation', 'rotation_quat', 'scale', 'default')
+DEFAULT_TOLERANCE = 1e-4
+
+
+def _reconstruct(times: np.ndarray, values: np.ndarray, mask: np.ndarray,
+                 mode: str) -> np.ndarray:
+    """Rebuild all original samples from the kept keys"""
+    evaluator = TemporalEvaluator(times[mask], {'values': values[mask]}, mode=mode)
+    return evaluator.sample_packed(times)
+
+
+def simplify_channel(times, values, tolerance: float, mode: str = 'linear',
+                     initial: np.ndarray = None) -> np.ndarray:
+    """Return a mask of keys to keep so every dropped key is within tolerance
+
+    values is (N,) or (N, C); the error of a key is its largest component
+    deviation. Like Ramer-Douglas-Peucker, each pass inserts the worst key of
+    every out-of-tolerance segment, but the error is measured against the
+    actual reconstruction (linear, bezier or catmull_rom), not a straight line.
+    Keys already set in initial are always kept.
+    """
+    times = np.asarray(times, dtype=np.float64)
+    values = np.asarray(values, dtype=np.float64).reshape(len(times), -1)
+    mask = np.zeros(len(times), dtype=bool) if initial is None else initial.copy()
+    if len(times) <= 2:
+        mask[:] = True
+        return mask
+    mask[[0, -1]] = True
+
+    while True:
+        error = np.max(np.abs(_reconstruct(times, values, mask, mode) - values), axis=1)
+        error[mask] = 0.0
+        over = error > tolerance
+        if not np.any(over):
+            return mask
+
+        # Pick the worst offender inside each segment between kept keys
+        segment = np.cumsum(mask) - 1
+        candidates = np.flatnonzero(over)
+        order = np.lexsort((-error[candidates], segment[candidates]))
+        candidates = candidates[order]
+        first = np.concatenate([[True], np.diff(segment[candidates]) != 0])
+        mask[candidates[first]] = True
+
+
+def channel_tolerance(tolerance: Tolerance, name: str, *fallbacks: str) -> float:
+    """Look up a per-channel tolerance: name, then each fallback, then 'default'"""
+    if isinstance(tolerance, dict):
+        for key in (name, *fallbacks, 'default'):
+            if key in tolerance:
+                return float(tolerance[key])
+        return DEFAULT_TOLERANCE
+    return float(tolerance)
+
+
+def validate_tolerance(tolerance: Tolerance, extra_keys: Iterable[str] = ()):
+    """Reject tolerance dict keys that no channel would ever look up"""
+    if isinstance(tolerance, dict):
+        unknown = set(tolerance) - set(TOLERANCE_KEYS) - set(extra_keys)
+        if unknown:
+            raise ValueError(f"Unknown tolerance channels {sorted(unknown)} "
+                             f"(use {TOLERANCE_KEYS})")
+
+
+def reduce_arrays(times, channels: Dict[str, np.ndarray], tolerance: Tolerance,
+                  mode: str = 'linear') -> Tuple[np.ndarray, Dict]:
+    """Simplify every channel and keep the union of keys any channel needs
+
+    Returns the shared keep-mask and a report with the compression ratio and
+    the max reconstruction error per channel.
+    """
+    times = np.asarray(times, dtype=np.float64)
+    mask = np.zeros(len(times), dtype=bool)
+    for name, values in channels.items():
+        mask |= simplify_channel(times, values, channel_tolerance(tolerance, name), mode)
+
+    # Keys added for one channel move the cubic tangents of the others, so
+    # refine against the shared mask until no channel needs another key
+    while True:
+        previous = mask.sum()
+        for name, values in channels.items():
+            mask = simplify_channel(times, values, channel_tolerance(tolerance, name),
+                                    mode, initial=mask)
+        if mask.sum() == previous:
+            break
+
+    errors = {}
+    for name, values in channels.items():
+        values = np.asarray(values, dtype=np.float64).reshape(len(times), -1)
+        if len(times):
+            errors[name] = float(np.max(np.abs(_reconstruct(times, values, mask, mode) - values)))
+        else:
+            errors[name] = 0.0
+
+    kept = int(mask.sum())
+    report = {
+        'original_keys': len(times),
+        'kept_keys': kept,
+        'compression_ratio': len(times) / kept if kept else 1.0,
+        'max_error': max(errors.values(), default=0.0),
+        'channel_errors': errors
+    }
+    return mask, report
+
+
+def reduce_keyframes(temporal_keyframes: Dict[float, Dict], tolerance: Tolerance,
+                     channels: Iterable[str] = DEFAULT_CHANNELS,
+                     mode: str = 'linear') -> Tuple[Dict[float, Dict], Dict]:
+    """Simplify a TemporalObject.temporal_keyframes dict; returns (reduced, report)"""
+    validate_tolerance(tolerance, channels)
+    items = sorted(temporal_keyframes.items())
+    times = np.array([time for time, _ in items], dtype=np.float64)
+    packed = {name: np.array([props[name] for _, props in items], dtype=np.float64)
+              for name in channels}
+    mask, report = reduce_arrays(times, packed, tolerance, mode)
+    reduced = {time: props for (time, props), keep in zip(items, mask) if keep}
+    return reduced, report
@@ -0,0 +1,103 @@
+# temporal_spatial.py
+# Temporal VR Project - Spatial index for temporal brush queries
+# Flattened BVH over rest-pose vertices, shipped with the keyframes
+#
+# Sections (N = node count, V = vertex count):
+#   bvh_bounds   float32 (N, 2, 3)  node AABB: [min, max] in object space
+#   bvh_nodes    int32   (N, 4)     [first, count, left, right]; leaves have left = -1
+#   bvh_indices  int32   (V,)       vertex indices ordered so every node covers
+#                                   bvh_indices[first:first + count]
+#
+# Node 0 is the root. Children split their parent's range at the median of
+# the longest axis, so any node (not just a leaf) is one contiguous range and
+# a brush can take a whole subtree when its box lies inside the brush sphere.
+
+import numpy as np
+from typing import Dict, List
+
+DEFAULT_LEAF_SIZE = 32
+SECTION_NAMES = ('bvh_bounds', 'bvh_nodes', 'bvh_indices')
+
+
+class VertexBVH:
+    """Median-split BVH over a fixed point set"""
+
+    def __init__(self, bounds: np.ndarray, nodes: np.ndarray, indices: np.ndarray):
+        self.bounds = np.asarray(bounds, dtype=np.float32)
+        self.nodes = np.asarray(nodes, dtype=np.int32)
+        self.indices = np.asarray(indices, dtype=np.int32)
+
+    @classmethod
+    def build(cls, points: np.ndarray, leaf_size: int = DEFAULT_LEAF_SIZE) -> 'VertexBVH':
+        points = np.asarray(points, dtype=np.float32).reshape(-1, 3)
+        order = np.arange(len(points), dtype=np.int32)
+        nodes: List[List[int]] = [[0, len(points), -1, -1]]
+        bounds: List[np.ndarray] = [None]
+        stack = [0]
+
+        while stack:
+            i = stack.pop()
+            first, count = nodes[i][0], nodes[i][1]
+            members = order[first:first + count]
+            block = points[members]
+            lo = block.min(axis=0) if count else np.zeros(3, np.float32)
+            hi = block.max(axis=0) if count else np.zeros(3, np.float32)
+            bounds[i] = np.stack([lo, hi])
+            if count <= leaf_size:
+                continue
+
+            axis = int(np.argmax(hi - lo))
+            half = count // 2
+            order[first:first + count] = members[np.argpartition(block[:, axis], half)]
+            left = len(nodes)
+            nodes += [[first, half, -1, -1], [first + half, count - half, -1, -1]]
+            bounds += [None, None]
+            nodes[i][2], nodes[i][3] = left, left + 1
+            stack += [left + 1, left]
+
+        return cls(np.array(bounds, dtype=np.float32), np.array(nodes, dtype=np.int32), order)
+
+    @classmethod
+    def from_sections(cls, sections) -> 'VertexBVH':
+        return cls(sections['bvh_bounds'], sections['bvh_nodes'], sections['bvh_indices'])
+
+    def to_sections(self) -> Dict[str, np.ndarray]:
+        return {'bvh_bounds': self.bounds, 'bvh_nodes': self.nodes, 'bvh_indices': self.indices}
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def query_radius(self, points: np.ndarray, center, radius: float) -> np.ndarray:
+        """Sorted indices of points within radius of center (points = the indexed positions)
+
+        Subtrees whose box is far away are skipped; boxes entirely inside the
+        sphere are taken without per-vertex distance checks.
+        """
+        center = np.asarray(center, dtype=np.float32)
+        r2 = float(radius) ** 2
+        found = []
+        stack = [0]
+        while stack:
+            i = stack.pop()
+            lo, hi = self.bounds[i]
+            gap = np.maximum(lo - center, 0.0) + np.maximum(center - hi, 0.0)
+            if float(gap @ gap) > r2:
+                continue
+            first, count, left, right = self.nodes[i]
+            members = self.indices[first:first + count]
+            far = np.maximum(np.abs(lo - center), np.abs(hi - center))
+            if float(far @ far) <= r2:
+                found.append(members)
+            elif left < 0:
+                offsets = points[members] - center
+                found.append(members[np.einsum('ij,ij->i', offsets, offsets) <= r2])
+            else:
+                stack += [int(right), int(left)]
+        if not found:
+            return np.zeros(0, dtype=np.int32)
+        return np.sort(np.concatenate(found))
+
+
+def build_spatial_sections(points: np.ndarray, leaf_size: int = DEFAULT_LEAF_SIZE) -> Dict[str, np.ndarray]:
+    """bvh_* sections for a (V, 3) rest pose"""
+    return VertexBVH.build(points, leaf_size).to_sections()
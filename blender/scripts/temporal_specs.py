@@ -0,0 +1,229 @@
+# temporal_specs.py
+# Temporal VR Project - Declarative temporal phase specs
+# Load phases from JSON/TOML, validate once, compile to packed arrays and cache
+#
+# Spec layout (JSON shown; TOML uses [[phases]] tables with the same keys):
+#   {
+#     "name": "Growth",
+#     "rotation_units": "degrees",          # or "radians" (default)
+#     "phases": [
+#       {"time": 0, "location": [0, 0, 0], "rotation": [0, 0, 0],
+#        "scale": [1, 1, 1], "description": "Birth"},
+#       {"time": 25, "location": [0, 0, 1], "rotation_quaternion": [1, 0, 0, 0],
+#        "scale": [2, 2, 0.5]}
+#     ]
+#   }
+#
+# Compiled arrays are cached as .tvrk files named after the SHA-256 of the
+# spec bytes, so an unchanged spec loads straight from the cache.
+
+import hashlib
+import json
+import math
+import os
+import numpy as np
+from typing import Dict, List, Optional, Tuple
+
+import temporal_format
+from temporal_quat import euler_to_quat, make_continuous, quat_to_euler
+
+# Bump when compiled output changes so stale caches are ignored
+SPEC_COMPILER_VERSION = 1
+DEFAULT_CACHE_DIRNAME = ".temporal_cache"
+ARRAY_KEYS = ('time', 'location', 'rotation', 'rotation_quat', 'scale')
+
+
+def _phase_quaternion(phase: Dict) -> np.ndarray:
+    """Phase rotation as a (w, x, y, z) quaternion
+
+    'rotation' is the source of truth; 'rotation_quaternion' is only used
+    for phases that give no Euler rotation.
+    """
+    if 'rotation' in phase:
+        return euler_to_quat(phase['rotation'])[0]
+    return np.asarray(phase['rotation_quaternion'], dtype=np.float64)
+
+
+def phases_to_arrays(phases: List[Dict]) -> Dict[str, np.ndarray]:
+    """Pack phase dicts into sorted (N,) time and (N, 3) transform arrays
+
+    Rotations are also packed as continuous (N, 4) quaternions in
+    'rotation_quat'; phases may give either 'rotation' or 'rotation_quaternion'
+    (when both are given, 'rotation' wins).
+    """
+    times = np.array([phase['time'] for phase in phases], dtype=np.float32)
+    order = np.argsort(times, kind='stable')
+    arrays = {'time': times[order]}
+    for key in ('location', 'scale'):
+        arrays[key] = np.array([phase[key] for phase in phases], dtype=np.float32)[order]
+
+    quats = make_continuous(np.array([_phase_quaternion(phase) for phase in phases])[order])
+    arrays['rotation_quat'] = quats.astype(np.float32)
+    arrays['rotation'] = np.array(
+        [phases[i]['rotation'] if 'rotation' in phases[i] else quat_to_euler(quats[n])[0]
+         for n, i in enumerate(order)], dtype=np.float32)
+    return arrays
+
+
+def arrays_to_phases(arrays: Dict[str, np.ndarray],
+                     descriptions: Optional[List[str]] = None) -> List[Dict]:
+    """Rebuild phase dicts (for TemporalObject.temporal_keyframes) from packed arrays
+
+    Only the Euler 'rotation' is stored, so editing it cannot leave a stale
+    quaternion behind; quaternions are re-derived when needed.
+    """
+    phases = []
+    for i, time in enumerate(arrays['time']):
+        phase = {
+            'time': float(time),
+            'scale': tuple(float(v) for v in arrays['scale'][i]),
+            'rotation': tuple(float(v) for v in arrays['rotation'][i]),
+            'location': tuple(float(v) for v in arrays['location'][i]),
+        }
+        if descriptions and descriptions[i]:
+            phase['description'] = descriptions[i]
+        phases.append(phase)
+    return phases
+
+
+def normalize_phases(phases: List[Dict]) -> List[Dict]:
+    """Phases sorted by time, each with an Euler 'rotation'
+
+    Quaternion-only phases are converted to Euler and their
+    'rotation_quaternion' is dropped, so 'rotation' is the one stored source
+    of truth. Every other key (time, description, ...) is kept as given.
+    """
+    arrays = phases_to_arrays(phases)
+    order = np.argsort(np.array([phase['time'] for phase in phases], dtype=np.float32), kind='stable')
+    normalized = []
+    for n, i in enumerate(order):
+        phase = dict(phases[i])
+        phase['rotation'] = tuple(float(v) for v in arrays['rotation'][n])
+        phase.pop('rotation_quaternion', None)
+        normalized.append(phase)
+    return normalized
+
+
+def _read_spec_bytes(path: str) -> Dict:
+    """Parse a JSON or TOML spec file"""
+    with open(path, 'rb') as f:
+        raw = f.read()
+    if path.lower().endswith('.toml'):
+        import tomllib
+        return tomllib.loads(raw.decode('utf-8'))
+    return json.loads(raw.decode('utf-8'))
+
+
+def _vector(phase: Dict, key: str, size: int, where: str) -> Tuple[float, ...]:
+    """Validate a numeric vector field"""
+    value = phase[key]
+    if not isinstance(value, (list, tuple)) or len(value) != size:
+        raise ValueError(f"{where}: '{key}' must be a list of {size} numbers")
+    try:
+        vector = tuple(float(v) for v in value)
+    except (TypeError, ValueError):
+        raise ValueError(f"{where}: '{key}' must contain only numbers") from None
+    if not all(math.isfinite(v) for v in vector):
+        raise ValueError(f"{where}: '{key}' must be finite")
+    return vector
+
+
+def validate_phase_spec(spec: Dict, source: str = "spec") -> List[Dict]:
+    """Check a parsed spec and return normalized phase dicts (rotations in radians)"""
+    if not isinstance(spec, dict) or not isinstance(spec.get('phases'), list):
+        raise ValueError(f"{source}: expected an object with a 'phases' list")
+    if not spec['phases']:
+        raise ValueError(f"{source}: 'phases' is empty")
+
+    units = spec.get('rotation_units', 'radians')
+    if units not in ('radians', 'degrees'):
+        raise ValueError(f"{source}: rotation_units must be 'radians' or 'degrees'")
+
+    phases = []
+    seen = set()
+    for i, raw in enumerate(spec['phases']):
+        where = f"{source}: phases[{i}]"
+        if not isinstance(raw, dict):
+            raise ValueError(f"{where}: expected a table/object")
+        for key in ('time', 'location', 'scale'):
+            if key not in raw:
+                raise ValueError(f"{where}: missing '{key}'")
+        if 'rotation' not in raw and 'rotation_quaternion' not in raw:
+            raise ValueError(f"{where}: needs 'rotation' or 'rotation_quaternion'")
+
+        try:
+            time = float(raw['time'])
+        except (TypeError, ValueError):
+            raise ValueError(f"{where}: 'time' must be a number") from None
+        if not math.isfinite(time) or time in seen:
+            raise ValueError(f"{where}: time {raw['time']} is not finite or is duplicated")
+        seen.add(time)
+
+        phase = {
+            'time': time,
+            'location': _vector(raw, 'location', 3, where),
+            'scale': _vector(raw, 'scale', 3, where),
+            'description': str(raw.get('description', '')),
+        }
+        if 'rotation' in raw:
+            rotation = _vector(raw, 'rotation', 3, where)
+            phase['rotation'] = tuple(math.radians(v) for v in rotation) if units == 'degrees' else rotation
+        if 'rotation_quaternion' in raw:
+            quat = _vector(raw, 'rotation_quaternion', 4, where)
+            if not any(quat):
+                raise ValueError(f"{where}: 'rotation_quaternion' must not be zero")
+            phase['rotation_quaternion'] = quat
+        phases.append(phase)
+
+    return phases
+
+
+def spec_hash(path: str) -> str:
+    """Content hash of a spec file (plus compiler version)"""
+    digest = hashlib.sha256(f"temporal-spec-v{SPEC_COMPILER_VERSION}\n".encode())
+    with open(path, 'rb') as f:
+        digest.update(f.read())
+    return digest.hexdigest()
+
+
+def _cache_path(path: str, digest: str, cache_dir: Optional[str]) -> str:
+    """Location of the compiled cache file for a spec"""
+    cache_dir = cache_dir or os.path.join(os.path.dirname(os.path.abspath(path)), DEFAULT_CACHE_DIRNAME)
+    stem = os.path.splitext(os.path.basename(path))[0]
+    return os.path.join(cache_dir, f"{stem}-{digest[:16]}.tvrk")
+
+
+def compile_phase_spec(path: str, cache_dir: Optional[str] = None) -> Dict:
+    """Load a spec, compiling and caching it unless an up-to-date cache exists
+
+    Returns {'name', 'hash', 'cached', 'arrays', 'descriptions'}.
+    """
+    digest = spec_hash(path)
+    cache_file = _cache_path(path, digest, cache_dir)
+
+    if os.path.exists(cache_file):
+        with temporal_format.read_temporal_file(cache_file, mmap=False) as cached:
+            arrays = {key: np.array(cached[key]) for key in ARRAY_KEYS}
+            meta = json.loads(cached['meta'].tobytes().decode('utf-8'))
+        return {'name': meta['name'], 'hash': digest, 'cached': True,
+                'arrays': arrays, 'descriptions': meta['descriptions']}
+
+    spec = _read_spec_bytes(path)
+    phases = validate_phase_spec(spec, source=path)
+    arrays = phases_to_arrays(phases)
+    order = np.argsort([phase['time'] for phase in phases], kind='stable')
+    descriptions = [phases[i]['description'] for i in order]
+    name = str(spec.get('name', os.path.splitext(os.path.basename(path))[0]))
+
+    # Write to a temp name first so a crash never leaves a half-written cache
+    os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+    meta = json.dumps({'name': name, 'source': os.path.basename(path),
+                       'descriptions': descriptions}).encode('utf-8')
+    sections = {key: arrays[key] for key in ARRAY_KEYS}
+    sections['meta'] = np.frombuffer(meta, dtype=np.uint8)
+    temporal_format.write_temporal_file(
+        cache_file + '.tmp', name, (float(arrays['time'][0]), float(arrays['time'][-1])), sections)
+    os.replace(cache_file + '.tmp', cache_file)
+
+    return {'name': name, 'hash': digest, 'cached': False,
+            'arrays': arrays, 'descriptions': descriptions}
@@ -0,0 +1,182 @@
+# temporal_vat.py
+# Temporal VR Project - Vertex animation textures
+# Packs captured vertex/normal keyframes into textures for vertex-shader playback
+#
+# Layout: one block of rows per frame, vertices along x. With W = texture
+# width and R = rows_per_frame = ceil(V / W), vertex v of frame f lives at
+#   texel (v % W, f * R + v // W)
+# so a shader needs only SV_VertexID, the frame index and the descriptor.
+# Texels are RGBA (alpha unused, 1.0); padding texels after the last vertex
+# of a frame are zero.
+#
+# Positions are stored raw (encoding 'raw') or remapped into the sequence
+# bounds (encoding 'bounds', p = lerp(bounds_min, bounds_max, texel.rgb)),
+# which keeps half precision usable far from the origin. Normals are stored
+# as unit vectors in [-1, 1].
+#
+# Files (written by write_vat):
+#   <name>_position.bin  raw texel data, bottom row first, for
+#   <name>_normal.bin    Texture2D.LoadRawTextureData (RGBAHalf / RGBAFloat)
+#   <name>.vat.json      descriptor: sizes, format, encoding, bounds, times
+#
+#   python temporal_vat.py export.tvrk out_dir --precision half
+
+import argparse
+import json
+import os
+import numpy as np
+from typing import Dict, Optional
+
+VAT_VERSION = 1
+DEFAULT_MAX_SIZE = 4096   # safe texture dimension on standalone headsets
+
+TEXTURE_FORMATS = {'half': ('RGBAHalf', np.float16), 'float': ('RGBAFloat', np.float32)}
+
+
+def vat_layout(vertex_count: int, frame_count: int, max_size: int = DEFAULT_MAX_SIZE) -> Dict[str, int]:
+    """Texture width/height and rows per frame for V vertices over F frames"""
+    if vertex_count <= 0 or frame_count <= 0:
+        raise ValueError("Vertex animation textures need at least one vertex and one frame")
+    width = min(vertex_count, max_size)
+    rows_per_frame = -(-vertex_count // width)
+    height = frame_count * rows_per_frame
+    if height > max_size:
+        raise ValueError(f"{frame_count} frames x {rows_per_frame} rows exceed the "
+                         f"{max_size}px texture limit; capture fewer frames")
+    return {'width': width, 'height': height, 'rows_per_frame': rows_per_frame}
+
+
+def pack_frames(frames: np.ndarray, layout: Dict[str, int], dtype) -> np.ndarray:
+    """(F, V, 3) values → (height, width, 4) texture in the VAT layout"""
+    frame_count, vertex_count = frames.shape[:2]
+    width, rows = layout['width'], layout['rows_per_frame']
+    texture = np.zeros((frame_count, rows * width, 4), dtype=dtype)
+    texture[:, :vertex_count, :3] = frames
+    texture[:, :vertex_count, 3] = 1.0
+    return texture.reshape(layout['height'], width, 4)
+
+
+def bake_vat(vertices: np.ndarray, normals: Optional[np.ndarray] = None, times=None,
+             precision: str = 'half', encoding: Optional[str] = None,
+             max_size: int = DEFAULT_MAX_SIZE) -> Dict:
+    """Bake (F, V, 3) keyframes into position/normal textures and a descriptor
+
+    encoding defaults to 'bounds' for half precision and 'raw' for float.
+    """
+    if precision not in TEXTURE_FORMATS:
+        raise ValueError(f"Unknown VAT precision '{precision}' (use 'half' or 'float')")
+    encoding = encoding or ('bounds' if precision == 'half' else 'raw')
+    if encoding not in ('raw', 'bounds'):
+        raise ValueError(f"Unknown VAT position encoding '{encoding}'")
+
+    vertices = np.asarray(vertices, dtype=np.float32)
+    frame_count, vertex_count = vertices.shape[:2]
+    texture_format, dtype = TEXTURE_FORMATS[precision]
+    layout = vat_layout(vertex_count, frame_count, max_size)
+
+    bounds_min = vertices.min(axis=(0, 1))
+    bounds_max = vertices.max(axis=(0, 1))
+    positions = vertices
+    if encoding == 'bounds':
+        extent = np.where(bounds_max > bounds_min, bounds_max - bounds_min, 1.0)
+        positions = (vertices - bounds_min) / extent
+
+    times = np.arange(frame_count, dtype=np.float32) if times is None else np.asarray(times, np.float32)
+    if len(times) != frame_count:
+        raise ValueError(f"{len(times)} times given for {frame_count} frames")
+
+    textures = {'position': pack_frames(positions, layout, dtype)}
+    if normals is not None:
+        textures['normal'] = pack_frames(np.asarray(normals, dtype=np.float32), layout, dtype)
+
+    descriptor = {
+        'version': VAT_VERSION,
+        'frame_count': int(frame_count),
+        'vertex_count': int(vertex_count),
+        **layout,
+        'format': texture_format,
+        'position_encoding': encoding,
+        'bounds_min': bounds_min.tolist(),
+        'bounds_max': bounds_max.tolist(),
+        'times': times.tolist(),
+    }
+    return {'descriptor': descriptor, 'textures': textures}
+
+
+def write_vat(directory: str, name: str, vat: Dict, **metadata) -> Dict:
+    """Write the textures as raw .bin files plus <name>.vat.json; returns the descriptor"""
+    os.makedirs(directory, exist_ok=True)
+    descriptor = dict(vat['descriptor'], name=name, **metadata)
+    descriptor['textures'] = {}
+    for kind, texture in vat['textures'].items():
+        filename = f"{name}_{kind}.bin"
+        np.ascontiguousarray(texture).astype(texture.dtype.newbyteorder('<'), copy=False).tofile(
+            os.path.join(directory, filename))
+        descriptor['textures'][kind] = filename
+
+    with open(os.path.join(directory, f"{name}.vat.json"), 'w', encoding='utf-8') as f:
+        json.dump(descriptor, f, indent=2)
+    return descriptor
+
+
+def read_vat(descriptor_path: str):
+    """Load a descriptor and its textures as (height, width, 4) arrays"""
+    with open(descriptor_path, 'r', encoding='utf-8') as f:
+        descriptor = json.load(f)
+    dtype = np.dtype(TEXTURE_FORMATS['half' if descriptor['format'] == 'RGBAHalf' else 'float'][1])
+    shape = (descriptor['height'], descriptor['width'], 4)
+    directory = os.path.dirname(descriptor_path)
+    textures = {kind: np.fromfile(os.path.join(directory, filename), dtype=dtype.newbyteorder('<')).reshape(shape)
+                for kind, filename in descriptor['textures'].items()}
+    return descriptor, textures
+
+
+def unpack_frames(texture: np.ndarray, descriptor: Dict) -> np.ndarray:
+    """Inverse of pack_frames (and of the bounds encoding for positions)"""
+    frames = texture.reshape(descriptor['frame_count'], -1, 4)[:, :descriptor['vertex_count'], :3]
+    return frames.astype(np.float32)
+
+
+def decode_positions(texture: np.ndarray, descriptor: Dict) -> np.ndarray:
+    """(F, V, 3) object-space positions from a position texture"""
+    positions = unpack_frames(texture, descriptor)
+    if descriptor['position_encoding'] == 'bounds':
+        lo = np.array(descriptor['bounds_min'], dtype=np.float32)
+        hi = np.array(descriptor['bounds_max'], dtype=np.float32)
+        positions = lo + positions * np.where(hi > lo, hi - lo, 1.0)
+    return positions
+
+
+def bake_vat_from_file(source: str, directory: str, name: Optional[str] = None, **options) -> Dict:
+    """Bake a VAT from an exported .tvrk (raw or compressed vertices)"""
+    import temporal_compress
+    import temporal_format
+    vertices, normals = temporal_compress.load_vertex_keyframes(source)
+    with temporal_format.read_temporal_file(source) as f:
+        times = np.array(f['time'])
+        object_name = f.object_name
+        temporal_range = list(f.temporal_range)
+    vat = bake_vat(vertices, normals, times, **options)
+    return write_vat(directory, name or object_name, vat,
+                     object_name=object_name, temporal_range=temporal_range)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bake vertex animation textures from a .tvrk export")
+    parser.add_argument("source", help=".tvrk file with vertex keyframes")
+    parser.add_argument("output_dir", help="Directory for the textures and descriptor")
+    parser.add_argument("--name", help="Base file name (defaults to the object name)")
+    parser.add_argument("--precision", choices=sorted(TEXTURE_FORMATS), default='half')
+    parser.add_argument("--encoding", choices=['raw', 'bounds'])
+    parser.add_argument("--max-size", type=int, default=DEFAULT_MAX_SIZE, help="Max texture dimension")
+    args = parser.parse_args()
+
+    descriptor = bake_vat_from_file(args.source, args.output_dir, args.name, precision=args.precision,
+                                    encoding=args.encoding, max_size=args.max_size)
+    print(f"📤 VAT baked: {args.output_dir} ({descriptor['frame_count']} frames x "
+          f"{descriptor['vertex_count']} vertices, {descriptor['width']}x{descriptor['height']} "
+          f"{descriptor['format']})")
+
+
+if __name__ == "__main__":
+    main()
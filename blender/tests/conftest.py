@@ -0,0 +1,24 @@
+# conftest.py
+# Temporal VR Project - Test setup
+# Runs the Blender scripts under plain Python with the bpy stand-in
+
+import os
+import sys
+
+import pytest
+
+SCRIPTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "scripts")
+sys.path.insert(0, os.path.abspath(SCRIPTS_DIR))
+
+import bpy_mock
+
+bpy_mock.install()
+
+
+@pytest.fixture(autouse=True)
+def fresh_blend_data():
+    """Each test starts from an empty mock scene and state cache"""
+    import temporal_base
+    bpy_mock.reset()
+    temporal_base.STATE_CACHE.invalidate()
+    yield
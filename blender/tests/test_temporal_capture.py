@@ -0,0 +1,86 @@
+# test_temporal_capture.py
+# Temporal VR Project - Parallel capture tests against a stand-in Blender executable
+
+import os
+import stat
+import sys
+import time
+
+import numpy as np
+import pytest
+
+import temporal_capture
+import temporal_format
+
+# Writes one .tvrk part per spec like `blender ... --python temporal_base.py -- --specs ...`
+FAKE_BLENDER = '''#!{python}
+import json, os, sys, time
+sys.path.insert(0, {scripts!r})
+import numpy as np
+import temporal_format
+
+args = sys.argv[sys.argv.index("--") + 1:]
+specs, output_dir, result = args[1], args[3], args[5]
+with open(specs) as f:
+    spec = json.load(f)[0]
+frames = np.asarray(spec['export']['frames'], dtype=np.float32)
+sys.stderr.write("x" * int(os.environ.get("FAKE_NOISE", "0")))
+if frames[0] >= float(os.environ.get("FAKE_HANG_FROM", "inf")):
+    with open(os.path.join(output_dir, spec['name'] + ".pid"), 'w') as f:
+        f.write(str(os.getpid()))
+    time.sleep(60)
+vertex_count = 8 if frames[0] < float(os.environ.get("FAKE_GROW_FROM", "inf")) else 9
+sections = {{'time': frames, 'location': np.zeros((len(frames), 3), np.float32),
+            'vertices': np.ones((len(frames), vertex_count, 3), np.float32) * frames[:, None, None]}}
+if spec['export'].get('adjacency', True):
+    sections['adjacency_offsets'] = np.zeros(vertex_count + 1, np.int32)
+temporal_format.write_temporal_file(os.path.join(output_dir, spec['name'] + ".tvrk"), spec['object'],
+                                    (0, 100), sections, vertex_count=vertex_count)
+with open(result, 'w') as f:
+    json.dump([{{'name': spec['name'], 'status': 'ok'}}], f)
+'''
+
+
+@pytest.fixture
+def fake_blender(tmp_path):
+    path = tmp_path / "blender"
+    path.write_text(FAKE_BLENDER.format(python=sys.executable,
+                                        scripts=os.path.dirname(temporal_capture.WORKER_SCRIPT)))
+    path.chmod(path.stat().st_mode | stat.S_IEXEC)
+    return str(path)
+
+
+def test_parts_merge_in_order_and_only_the_first_builds_topology(fake_blender, tmp_path, monkeypatch):
+    # More output than a pipe buffer holds must not stall the workers
+    monkeypatch.setenv("FAKE_NOISE", str(1 << 20))
+    output = str(tmp_path / "merged.tvrk")
+    info = temporal_capture.capture_frames(fake_blender, str(tmp_path / "scene.blend"), "Cube",
+                                           range(0, 20), output, parts=3, timeout=60)
+
+    assert info['parts'] == 3 and info['keyframe_count'] == 20
+    with temporal_format.read_temporal_file(output) as merged:
+        assert np.array_equal(merged['time'], np.arange(20, dtype=np.float32))
+        assert np.array_equal(merged['vertices'][:, 0, 0], np.arange(20, dtype=np.float32))
+        assert 'adjacency_offsets' in merged
+
+
+def test_vertex_count_change_between_parts_is_reported(fake_blender, tmp_path, monkeypatch):
+    monkeypatch.setenv("FAKE_GROW_FROM", "10")
+    with pytest.raises(ValueError, match="Vertex count changes between frames 0-4"):
+        temporal_capture.capture_frames(fake_blender, str(tmp_path / "scene.blend"), "Cube",
+                                        range(0, 20), str(tmp_path / "merged.tvrk"), parts=4, timeout=60)
+
+
+def test_timeout_kills_running_workers(fake_blender, tmp_path, monkeypatch):
+    monkeypatch.setenv("FAKE_HANG_FROM", "10")
+    work_dir = tmp_path / "work"
+    work_dir.mkdir()
+    start = time.monotonic()
+    with pytest.raises(RuntimeError, match="timed out"):
+        temporal_capture.capture_frames(fake_blender, str(tmp_path / "scene.blend"), "Cube",
+                                        range(0, 20), str(tmp_path / "merged.tvrk"), parts=2, timeout=5,
+                                        work_dir=str(work_dir))
+    assert time.monotonic() - start < 30
+    pid = int((work_dir / "part_001.pid").read_text())
+    with pytest.raises(ProcessLookupError):
+        os.kill(pid, 0)
@@ -0,0 +1,59 @@
+# test_temporal_reduce.py
+# Temporal VR Project - F-curve reduction tests
+
+import math
+
+import numpy as np
+import pytest
+
+import temporal_base
+
+
+def _smooth_phases(count):
+    times = np.linspace(0, 100, count)
+    return [{'time': float(t), 'location': (math.sin(t / 30), 0.0, 0.0),
+             'rotation': (0.0, 0.0, math.sin(t / 30)), 'scale': (1.0, 1.0, 1.0)} for t in times]
+
+
+def _key_counts(obj):
+    return {(fc.data_path, fc.array_index): len(fc.keyframe_points)
+            for fc in obj.animation_data.action.fcurves}
+
+
+def test_channel_tolerances_reach_rotation_curves():
+    for quaternion in (False, True):
+        temporal_obj = temporal_base.TemporalObject(f"Reduce{quaternion}")
+        temporal_obj.create_base_object()
+        temporal_obj.apply_temporal_evolution(_smooth_phases(200), bulk=True, quaternion=quaternion)
+        temporal_base.reduce_fcurves(temporal_obj.obj, {'location': 0.5, 'rotation': 0.5, 'scale': 0.5})
+
+        counts = _key_counts(temporal_obj.obj)
+        rotation_path = 'rotation_quaternion' if quaternion else 'rotation_euler'
+        location_keys = counts[('location', 0)]
+        assert max(n for (path, _), n in counts.items() if path == rotation_path) <= location_keys
+
+
+def test_reduction_skips_other_curves_and_keeps_interpolation():
+    temporal_obj = temporal_base.TemporalObject("ReduceOther")
+    temporal_obj.create_base_object()
+    temporal_obj.apply_temporal_evolution(_smooth_phases(50), bulk=True)
+    times = np.linspace(0, 100, 50)
+    temporal_base.bake_fcurves(temporal_obj.obj, '["temporal_phase"]', times, times / 100)
+    location = temporal_obj.obj.animation_data.action.fcurves.find('location', index=0)
+    for point in location.keyframe_points:
+        point.interpolation = 'CONSTANT'
+
+    temporal_base.reduce_fcurves(temporal_obj.obj, 0.5)
+
+    counts = _key_counts(temporal_obj.obj)
+    assert counts[('["temporal_phase"]', 0)] == 50
+    assert len(location.keyframe_points) < 50
+    assert {point.interpolation for point in location.keyframe_points} == {'CONSTANT'}
+
+
+def test_unknown_tolerance_channel_is_rejected():
+    temporal_obj = temporal_base.TemporalObject("ReduceTypo")
+    temporal_obj.create_base_object()
+    temporal_obj.apply_temporal_evolution(bulk=True)
+    with pytest.raises(ValueError):
+        temporal_obj.reduce_keyframes({'locaton': 0.1})
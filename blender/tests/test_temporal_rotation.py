@@ -0,0 +1,55 @@
+# test_temporal_rotation.py
+# Temporal VR Project - Rotation source-of-truth tests
+
+import copy
+import math
+
+import numpy as np
+
+import temporal_base
+from temporal_quat import euler_to_quat
+
+
+def _quaternion_curves(obj, frame):
+    fcurves = obj.animation_data.action.fcurves
+    return np.array([fcurves.find('rotation_quaternion', index=i).evaluate(frame) for i in range(4)])
+
+
+def _same_rotation(a, b):
+    return abs(abs(float(np.dot(a, b))) - 1.0) < 1e-5
+
+
+def test_editing_stored_rotation_updates_quaternion_curves():
+    temporal_obj = temporal_base.TemporalObject("RotationEdit")
+    temporal_obj.create_base_object()
+    temporal_obj.apply_temporal_evolution(bulk=True, quaternion=True)
+
+    phases = copy.deepcopy([temporal_obj.temporal_keyframes[t] for t in sorted(temporal_obj.temporal_keyframes)])
+    edited = next(phase for phase in phases if phase['time'] == 50)
+    edited['rotation'] = (0.0, math.radians(30), math.radians(10))
+
+    report = temporal_obj.update_temporal_evolution(phases)
+    expected = euler_to_quat(np.array([edited['rotation']]))[0]
+
+    assert report['changed'] == 1
+    assert report['fcurves_touched'] > 0
+    assert _same_rotation(_quaternion_curves(temporal_obj.obj, 50), expected)
+    assert _same_rotation(temporal_obj.state_at(50)['rotation_quat'], expected)
+
+
+def test_evaluator_rotation_channels_agree():
+    temporal_obj = temporal_base.TemporalObject("RotationChannels")
+    temporal_obj.create_base_object()
+    quaternion = euler_to_quat(np.array([[0.0, 0.0, math.pi / 2]]))[0].tolist()
+    phases = [
+        {'time': 0, 'location': (0, 0, 0), 'scale': (1, 1, 1), 'rotation': (0, 0, 0)},
+        {'time': 100, 'location': (0, 0, 0), 'scale': (1, 1, 1), 'rotation_quaternion': quaternion},
+    ]
+    temporal_obj.apply_temporal_evolution(phases, bulk=True)
+
+    stored = temporal_obj.temporal_keyframes[100]
+    assert 'rotation_quaternion' not in stored
+    assert np.allclose(stored['rotation'], (0, 0, math.pi / 2), atol=1e-5)
+
+    sampled = temporal_obj.compile_evaluator().sample([0.0, 100.0])
+    assert _same_rotation(sampled['rotation_quat'][1], euler_to_quat(sampled['rotation'][1:])[0])
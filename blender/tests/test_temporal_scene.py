@@ -0,0 +1,21 @@
+# test_temporal_scene.py
+# Temporal VR Project - Batched scene tests
+
+import numpy as np
+
+import temporal_base
+
+
+def test_reapplying_evolutions_keeps_grid_offsets():
+    scene = temporal_base.TemporalScene("Grid")
+    scene.create_objects(4, spacing=4.0)
+
+    scene.apply_evolutions()
+    first = [temporal_obj.state_at(50)['location'] for temporal_obj in scene.objects]
+    # The objects now sit at their animated location, not their grid origin
+    temporal_base.bpy.context.scene.frame_set(50)
+    scene.apply_evolutions()
+    second = [temporal_obj.state_at(50)['location'] for temporal_obj in scene.objects]
+
+    assert np.allclose(first, second)
+    assert np.allclose(second[3] - second[0], (4.0, 4.0, 0.0))
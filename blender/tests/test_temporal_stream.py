@@ -0,0 +1,39 @@
+# test_temporal_stream.py
+# Temporal VR Project - Streaming .tvrs writer tests
+
+import numpy as np
+import pytest
+
+import temporal_format
+
+
+def _write(writer, count):
+    for i in range(count):
+        writer.write_keyframe(float(i), (0.0, 0.0, 0.0), (0.0, 0.0, 0.0), (1.0, 1.0, 1.0),
+                              np.zeros((4, 3), np.float32), np.zeros((4, 3), np.float32))
+
+
+def test_finished_stream_has_index(tmp_path):
+    filepath = str(tmp_path / "done.tvrs")
+    with temporal_format.TemporalStreamWriter(filepath, "Cube", (0, 10), chunk_size=4) as writer:
+        _write(writer, 10)
+
+    with temporal_format.TemporalStreamFile(filepath) as stream:
+        assert stream.complete
+        assert stream.keyframe_count == 10
+        assert sum(len(chunk['time']) for chunk in stream.iter_chunks()) == 10
+
+
+def test_failed_capture_is_not_reported_complete(tmp_path):
+    filepath = str(tmp_path / "failed.tvrs")
+    with pytest.raises(RuntimeError):
+        with temporal_format.TemporalStreamWriter(filepath, "Cube", (0, 10), chunk_size=4) as writer:
+            _write(writer, 6)
+            raise RuntimeError("capture interrupted")
+
+    with temporal_format.TemporalStreamFile(filepath) as stream:
+        assert not stream.complete
+        with pytest.raises(ValueError):
+            stream.chunk_for_time(0.0)
+        # The chunk that reached the disk is still readable
+        assert [len(chunk['time']) for chunk in stream.iter_chunks()] == [4]
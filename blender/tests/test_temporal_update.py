@@ -0,0 +1,39 @@
+# test_temporal_update.py
+# Temporal VR Project - Incremental re-bake tests
+
+import copy
+
+import temporal_base
+import temporal_profile
+
+
+def _frames(obj, data_path, index):
+    fcurve = obj.animation_data.action.fcurves.find(data_path, index=index)
+    return [round(point.co[0]) for point in fcurve.keyframe_points]
+
+
+def test_removal_after_inserted_edit_hits_the_right_key():
+    temporal_obj = temporal_base.TemporalObject("UpdateOrder")
+    temporal_obj.create_base_object()
+    temporal_obj.apply_temporal_evolution(bulk=True)
+
+    # A per-curve reduction can leave a curve without a key other curves have
+    points = temporal_obj.obj.animation_data.action.fcurves.find('location', index=0).keyframe_points
+    points.remove(points[_frames(temporal_obj.obj, 'location', 0).index(25)], fast=True)
+
+    phases = copy.deepcopy(temporal_base.DEFAULT_TEMPORAL_PHASES)
+    phases[1]['location'] = (3.0, 0.0, 1.0)
+    phases = [phase for phase in phases if phase['time'] != 75]
+
+    temporal_profile.instrumentation.reset()
+    temporal_profile.enable()
+    try:
+        report = temporal_obj.update_temporal_evolution(phases)
+    finally:
+        temporal_profile.disable()
+
+    assert _frames(temporal_obj.obj, 'location', 0) == [0, 25, 50, 100]
+    assert report['changed'] == 1
+    assert report['removed'] == 1
+    # Only the re-inserted t=25 key is an insertion; removals and value edits are not
+    assert temporal_profile.instrumentation.counters[temporal_profile.KEYFRAMES_INSERTED] == 1